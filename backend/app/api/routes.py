@@ -110,7 +110,9 @@ async def scrapear_receta(datos: RecetaCrear, db: Session = Depends(obtener_db))
     service = RecipeService(db)
     
     try:
-        receta = await service.scrapear_y_guardar(str(datos.url))
+        receta = await service.scrapear_y_guardar(
+            str(datos.url), forzar_actualizacion=datos.forzar_actualizacion
+        )
         return ScrapingRespuesta(
             exito=True,
             mensaje="Receta scrapeada y guardada exitosamente",
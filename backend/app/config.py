@@ -17,10 +17,27 @@ DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{BASE_DIR}/recetario.db")
 # Configuración del scraper
 SCRAPER_TIMEOUT = int(os.getenv("SCRAPER_TIMEOUT", "30000"))  # milisegundos
 SCRAPER_HEADLESS = os.getenv("SCRAPER_HEADLESS", "true").lower() == "true"
+# No descargar imágenes, fuentes, multimedia ni rastreadores (solo se leen URLs y texto)
+SCRAPER_BLOQUEAR_RECURSOS = os.getenv("SCRAPER_BLOQUEAR_RECURSOS", "true").lower() == "true"
+# Páginas abiertas en simultáneo al reutilizar un mismo contexto de navegador
+SCRAPER_MAX_PAGINAS = int(os.getenv("SCRAPER_MAX_PAGINAS", "4"))
+# Intentar primero sin navegador en los sitios cuyo HTML ya trae la receta
+SCRAPER_HTTP_DIRECTO = os.getenv("SCRAPER_HTTP_DIRECTO", "true").lower() == "true"
 
 # Rate limiting - tiempo de espera entre peticiones (segundos)
 RATE_LIMIT_DELAY = float(os.getenv("RATE_LIMIT_DELAY", "2.0"))
 
+# Caché de recetas scrapeadas (por URL normalizada)
+SCRAPER_CACHE_TTL = float(os.getenv("SCRAPER_CACHE_TTL", "3600"))  # segundos
+SCRAPER_CACHE_MAX = int(os.getenv("SCRAPER_CACHE_MAX", "1024"))  # entradas
+
+# Caché en disco del HTML descargado sin navegador (vacío para desactivarla).
+# Pasado el TTL la página se revalida con ETag/Last-Modified; por encima del
+# máximo se borran las páginas guardadas hace más tiempo
+SCRAPER_CACHE_HTML_DIR = os.getenv("SCRAPER_CACHE_HTML_DIR", "/tmp/recetario_html")
+SCRAPER_CACHE_HTML_TTL = float(os.getenv("SCRAPER_CACHE_HTML_TTL", "86400"))  # segundos
+SCRAPER_CACHE_HTML_MAX = int(os.getenv("SCRAPER_CACHE_HTML_MAX", "2000"))  # páginas
+
 # Configuración de proxies (opcional)
 PROXY_ENABLED = os.getenv("PROXY_ENABLED", "false").lower() == "true"
 PROXY_LIST_FILE = os.getenv("PROXY_LIST_FILE", str(BASE_DIR / "proxies.txt"))
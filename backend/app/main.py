@@ -7,6 +7,15 @@ endpoints necesarios para el scraping y gestión de recetas.
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+
+try:
+    # Serializador en C: el progreso de una búsqueda se consulta cada dos
+    # segundos mientras corre, y el listado de recetas puede ser grande
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as RespuestaJSON
+except ImportError:  # orjson es opcional
+    RespuestaJSON = JSONResponse
 
 from app.config import CORS_ORIGINS, API_HOST, API_PORT, API_DEBUG
 from app.database import crear_tablas
@@ -18,7 +27,8 @@ app = FastAPI(
     description="API para scraping y gestión de recetas de cocina",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=RespuestaJSON
 )
 
 # Configurar CORS
@@ -30,6 +30,10 @@ class RecetaCrear(BaseModel):
     """Schema para crear una receta mediante scraping."""
     
     url: HttpUrl = Field(..., description="URL de la receta a scrapear")
+    forzar_actualizacion: bool = Field(
+        False,
+        description="Ignorar la caché de recetas scrapeadas y volver a descargarla"
+    )
 
 
 class RecetaActualizar(BaseModel):
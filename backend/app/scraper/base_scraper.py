@@ -5,13 +5,32 @@ Define la interfaz común que deben implementar todos los scrapers específicos.
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Optional, List, Tuple
+from pathlib import Path
+from typing import Optional, List, Tuple, Iterable, Dict, NamedTuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 import asyncio
+import hashlib
+import json
+import os
+import tempfile
 import time
 import re
 
-from app.config import SCRAPER_TIMEOUT, SCRAPER_HEADLESS, RATE_LIMIT_DELAY
+try:
+    # Parser en C, bastante más rápido para bloques JSON-LD grandes
+    from orjson import loads as _json_loads
+except ImportError:  # orjson es opcional
+    from json import loads as _json_loads
+
+from app.config import (
+    SCRAPER_TIMEOUT, SCRAPER_HEADLESS, RATE_LIMIT_DELAY,
+    SCRAPER_CACHE_TTL, SCRAPER_CACHE_MAX, SCRAPER_MAX_PAGINAS,
+    SCRAPER_BLOQUEAR_RECURSOS, SCRAPER_HTTP_DIRECTO,
+    SCRAPER_CACHE_HTML_DIR, SCRAPER_CACHE_HTML_TTL, SCRAPER_CACHE_HTML_MAX
+)
 
 
 # Constantes para detección de idioma
@@ -45,6 +64,138 @@ VERBOS_COCINA = [
     'incorporar', 'salpimentar', 'precalentar', 'retirar', 'escurrir'
 ]
 
+# Extractor genérico que se inyecta en cada contexto con add_init_script.
+# Recibe la especificación de campos de un scraper (atributo CAMPOS) y
+# devuelve todos los valores en una sola llamada a page.evaluate.
+#
+# Tipos de campo soportados:
+# - texto:    {"tipo": "texto", "selector": "h1.titulo, h1"}
+# - atributo: {"tipo": "atributo", "selectores": [...], "atributos": [...],
+#              "requiere_http": bool}
+# - lista:    {"tipo": "lista", "selectores": [selector | [contenedor, [partes]]]}
+#
+# También expone tarjetas(opciones) para los listados de búsqueda (ver
+# BaseScraper._extraer_tarjetas).
+JS_EXTRACTOR = r'''
+window.__webscarper = {
+    esquemaHttp: /^https?:\/\//i,
+    texto(el) {
+        return el ? (el.innerText || '').trim() : '';
+    },
+    campoTexto(campo) {
+        return this.texto(document.querySelector(campo.selector));
+    },
+    campoAtributo(campo) {
+        this.indiceGanador = -1;
+        for (const [indice, selector] of campo.selectores.entries()) {
+            const el = document.querySelector(selector);
+            if (!el) continue;
+            for (const atributo of campo.atributos) {
+                const valor = (el.getAttribute(atributo) || '').trim();
+                if (!valor || valor.startsWith('data:')) continue;
+                if (campo.requiere_http && !this.esquemaHttp.test(valor)) continue;
+                this.indiceGanador = indice;
+                return valor;
+            }
+        }
+        return '';
+    },
+    campoLista(campo) {
+        this.indiceGanador = -1;
+        for (const [indice, entrada] of campo.selectores.entries()) {
+            const [selector, partes] = Array.isArray(entrada) ? entrada : [entrada, []];
+            const items = [];
+            for (const el of document.querySelectorAll(selector)) {
+                const valores = partes
+                    .map(parte => this.texto(el.querySelector(parte)))
+                    .filter(Boolean);
+                const item = valores.length ? valores.join(' ') : this.texto(el);
+                if (item) items.push(item);
+            }
+            if (items.length) {
+                this.indiceGanador = indice;
+                return items;
+            }
+        }
+        return [];
+    },
+    tarjetas(opciones) {
+        for (const selector of opciones.selectores) {
+            const recetas = [];
+            for (const el of document.querySelectorAll(selector)) {
+                let href = el.getAttribute('href');
+                if (!href || (opciones.filtro_href && !href.includes(opciones.filtro_href))) continue;
+                if (opciones.url_base && href.startsWith('/')) href = opciones.url_base + href;
+                // Sin elemento de título dentro de la tarjeta, el texto del enlace;
+                // innerText fuerza el cálculo de estilos, así que solo si se pide
+                let titulo = '';
+                if (opciones.con_titulo) {
+                    const nodoTitulo = opciones.selector_titulo
+                        ? el.querySelector(opciones.selector_titulo)
+                        : null;
+                    titulo = this.texto(nodoTitulo || el);
+                }
+                const img = opciones.selector_imagen ? el.querySelector(opciones.selector_imagen) : null;
+                // Fila posicional, en el orden de los campos de TarjetaReceta
+                recetas.push([href, titulo, img ? (img.getAttribute('src') || '') : '']);
+                if (recetas.length >= opciones.limite) break;
+            }
+            if (recetas.length) return recetas;
+        }
+        return [];
+    },
+    extraer(campos) {
+        const resultado = {};
+        const ganadores = {};
+        for (const [nombre, campo] of Object.entries(campos)) {
+            if (campo.tipo === 'texto') {
+                resultado[nombre] = this.campoTexto(campo);
+                continue;
+            }
+            resultado[nombre] = campo.tipo === 'lista'
+                ? this.campoLista(campo)
+                : this.campoAtributo(campo);
+            if (this.indiceGanador >= 0) ganadores[nombre] = this.indiceGanador;
+        }
+        // Posición del selector que resolvió cada cascada (ver _extraer_campos)
+        resultado.__ganadores = ganadores;
+        return resultado;
+    }
+};
+'''
+
+# Devuelve el primer selector (en orden de prioridad) con un elemento visible,
+# o false para que wait_for_function siga esperando. "Visible" sigue el
+# criterio de wait_for_selector: caja no vacía y visibility distinta de hidden.
+JS_PRIMER_SELECTOR_VISIBLE = r'''
+(selectores) => selectores.find(selector => {
+    const el = document.querySelector(selector);
+    if (!el) return false;
+    const caja = el.getBoundingClientRect();
+    return caja.width > 0 && caja.height > 0
+        && getComputedStyle(el).visibility !== 'hidden';
+}) || false
+'''
+
+# User agent de escritorio, compartido por el navegador y las descargas directas
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Recursos que los extractores nunca usan: de las imágenes solo se lee el
+# atributo src, que sigue presente en el DOM aunque no se descarguen.
+# Las hojas de estilo se mantienen porque innerText depende del CSS.
+TIPOS_RECURSO_BLOQUEADOS = frozenset(("image", "font", "media"))
+
+# Dominios de analítica y publicidad que no aportan contenido
+DOMINIOS_RASTREO = (
+    "google-analytics.com", "googletagmanager.com", "googlesyndication.com",
+    "doubleclick.net", "facebook.net", "connect.facebook.net", "hotjar.com",
+    "scorecardresearch.com", "taboola.com", "outbrain.com", "criteo.com",
+    "amazon-adsystem.com"
+)
+
 
 def validar_receta(receta: dict) -> Tuple[bool, str]:
     """
@@ -152,7 +303,294 @@ def separar_ingredientes_y_pasos(items: List[str]) -> Tuple[List[str], List[str]
     return ingredientes, pasos
 
 
-@dataclass
+# Duración ISO 8601 usada por schema.org (ej: "PT1H30M")
+PATRON_DURACION_ISO = re.compile(
+    r'^P(?:(?P<dias>\d+)D)?(?:T(?:(?P<horas>\d+)H)?(?:(?P<minutos>\d+)M)?(?:\d+(?:\.\d+)?S)?)?$',
+    re.IGNORECASE
+)
+
+
+def formatear_duracion_iso(duracion: str) -> str:
+    """
+    Convierte una duración ISO 8601 a texto legible.
+    
+    Args:
+        duracion: Duración (ej: "PT1H30M").
+        
+    Returns:
+        Texto como "1 h 30 min", o la cadena original si no es ISO 8601.
+    """
+    match = PATRON_DURACION_ISO.match(duracion.strip())
+    if not match:
+        return duracion.strip()
+    
+    horas = int(match.group('horas') or 0) + 24 * int(match.group('dias') or 0)
+    minutos = int(match.group('minutos') or 0)
+    partes = []
+    if horas:
+        partes.append(f"{horas} h")
+    if minutos:
+        partes.append(f"{minutos} min")
+    return " ".join(partes)
+
+
+def _es_tipo_recipe(nodo: dict) -> bool:
+    """Verifica si un nodo JSON-LD es de tipo schema.org Recipe."""
+    tipo = nodo.get('@type', '')
+    tipos = tipo if isinstance(tipo, list) else [tipo]
+    return 'Recipe' in tipos
+
+
+def buscar_recipe_jsonld(payloads: Iterable[str]) -> Optional[dict]:
+    """
+    Busca el primer nodo Recipe entre los bloques JSON-LD de una página.
+    
+    Soporta objetos sueltos, listas y grafos (@graph).
+    
+    Args:
+        payloads: Contenido de cada <script type="application/ld+json">.
+        
+    Returns:
+        Diccionario del nodo Recipe o None si no hay.
+    """
+    for payload in payloads:
+        try:
+            datos = _json_loads(payload)
+        except ValueError:
+            continue
+        
+        pendientes = datos if isinstance(datos, list) else [datos]
+        while pendientes:
+            nodo = pendientes.pop(0)
+            if not isinstance(nodo, dict):
+                continue
+            if _es_tipo_recipe(nodo):
+                return nodo
+            pendientes.extend(nodo.get('@graph', []))
+    
+    return None
+
+
+def _texto_jsonld(valor) -> str:
+    """Normaliza un valor JSON-LD (texto, número o lista) a cadena."""
+    if isinstance(valor, list):
+        valor = valor[0] if valor else ''
+    if isinstance(valor, dict):
+        valor = valor.get('url') or valor.get('text') or ''
+    return str(valor).strip() if valor is not None else ''
+
+
+def _pasos_jsonld(instrucciones) -> List[str]:
+    """Aplana recipeInstructions (texto, HowToStep o HowToSection) a una lista de pasos."""
+    if isinstance(instrucciones, str):
+        return [linea.strip() for linea in instrucciones.split('\n') if linea.strip()]
+    
+    pasos = []
+    for instruccion in instrucciones or []:
+        if isinstance(instruccion, str):
+            texto = instruccion.strip()
+        elif isinstance(instruccion, dict) and 'itemListElement' in instruccion:
+            pasos.extend(_pasos_jsonld(instruccion['itemListElement']))
+            continue
+        elif isinstance(instruccion, dict):
+            texto = str(instruccion.get('text') or instruccion.get('name') or '').strip()
+        else:
+            continue
+        if texto:
+            pasos.append(texto)
+    return pasos
+
+
+def campos_desde_recipe_jsonld(recipe: dict) -> dict:
+    """
+    Mapea un nodo schema.org Recipe a los campos de RecetaScraped.
+    
+    Args:
+        recipe: Nodo Recipe (ver buscar_recipe_jsonld).
+        
+    Returns:
+        Diccionario con las mismas claves que usan las especificaciones CAMPOS.
+    """
+    ingredientes = recipe.get('recipeIngredient') or []
+    if isinstance(ingredientes, str):
+        ingredientes = [ingredientes]
+    
+    return {
+        "titulo": _texto_jsonld(recipe.get('name')),
+        "descripcion": _texto_jsonld(recipe.get('description')),
+        "imagen_url": _texto_jsonld(recipe.get('image')),
+        "ingredientes": [str(i).strip() for i in ingredientes if str(i).strip()],
+        "pasos": _pasos_jsonld(recipe.get('recipeInstructions')),
+        "tiempo_preparacion": formatear_duracion_iso(_texto_jsonld(recipe.get('prepTime'))),
+        "tiempo_coccion": formatear_duracion_iso(_texto_jsonld(recipe.get('cookTime'))),
+        "porciones": _texto_jsonld(recipe.get('recipeYield')),
+    }
+
+
+# Mismo criterio que esquemaHttp en JS_EXTRACTOR
+PATRON_ESQUEMA_HTTP = re.compile(r'^https?://', re.IGNORECASE)
+
+
+def _texto_nodo(nodo) -> str:
+    """Texto de un nodo selectolax con los espacios normalizados ('' si no existe)."""
+    return ' '.join(nodo.text(separator=' ').split()) if nodo is not None else ''
+
+
+def _atributo_de_arbol(arbol, campo: dict) -> str:
+    """Resuelve un campo de tipo atributo (ver campoAtributo en JS_EXTRACTOR)."""
+    for selector in campo["selectores"]:
+        nodo = arbol.css_first(selector)
+        if nodo is None:
+            continue
+        for atributo in campo["atributos"]:
+            valor = (nodo.attributes.get(atributo) or '').strip()
+            if not valor or valor.startswith('data:'):
+                continue
+            if campo["requiere_http"] and not PATRON_ESQUEMA_HTTP.match(valor):
+                continue
+            return valor
+    return ''
+
+
+def _lista_de_arbol(arbol, campo: dict) -> List[str]:
+    """Resuelve un campo de tipo lista (ver campoLista en JS_EXTRACTOR)."""
+    for entrada in campo["selectores"]:
+        selector, partes = entrada if isinstance(entrada, (list, tuple)) else (entrada, ())
+        items = []
+        for nodo in arbol.css(selector):
+            valores = [v for v in (_texto_nodo(nodo.css_first(parte)) for parte in partes) if v]
+            item = ' '.join(valores) if valores else _texto_nodo(nodo)
+            if item:
+                items.append(item)
+        if items:
+            return items
+    return []
+
+
+def extraer_campos_de_arbol(arbol, campos: dict) -> dict:
+    """
+    Evalúa una especificación de campos sobre un árbol HTML local.
+    
+    Equivalente en Python de window.__webscarper.extraer (ver JS_EXTRACTOR)
+    para HTML descargado sin navegador: misma cascada, primer resultado no
+    vacío. El texto sale del HTML tal cual, sin estilos aplicados.
+    
+    Args:
+        arbol: Árbol LexborHTMLParser (selectolax).
+        campos: Especificación de campos (mismo formato que CAMPOS).
+        
+    Returns:
+        Diccionario con el valor de cada campo ('' o [] si no se encontró).
+    """
+    datos = {}
+    for nombre, campo in campos.items():
+        if campo["tipo"] == "texto":
+            datos[nombre] = _texto_nodo(arbol.css_first(campo["selector"]))
+        elif campo["tipo"] == "atributo":
+            datos[nombre] = _atributo_de_arbol(arbol, campo)
+        else:
+            datos[nombre] = _lista_de_arbol(arbol, campo)
+    return datos
+
+
+def campos_jsonld_de_arbol(arbol) -> Optional[dict]:
+    """
+    Busca el JSON-LD Recipe en un árbol HTML local.
+    
+    Equivalente de BaseScraper._extraer_jsonld_receta para HTML
+    descargado sin navegador.
+    
+    Args:
+        arbol: Árbol LexborHTMLParser (selectolax).
+        
+    Returns:
+        Diccionario de campos (ver campos_desde_recipe_jsonld) o None
+        si la página no publica un Recipe.
+    """
+    payloads = [nodo.text() for nodo in arbol.css('script[type="application/ld+json"]')]
+    recipe = buscar_recipe_jsonld(payloads)
+    return campos_desde_recipe_jsonld(recipe) if recipe else None
+
+
+# Pool de cadenas para campos con pocos valores distintos ("Cookpad",
+# "30 min", "4 porciones"): miles de recetas comparten la misma instancia
+# en lugar de una copia por receta. Acotado para no crecer sin límite.
+MAX_POOL_CADENAS = 10000
+_pool_cadenas: Dict[str, str] = {}
+
+
+def compartir_cadena(valor: Optional[str]) -> Optional[str]:
+    """
+    Devuelve la instancia compartida de una cadena repetida.
+    
+    Args:
+        valor: Cadena a compartir (None o vacía se devuelven tal cual).
+        
+    Returns:
+        La cadena del pool si ya existía (o si hay lugar para agregarla);
+        si el pool está lleno, la cadena original.
+    """
+    if not valor:
+        return valor
+    if len(_pool_cadenas) < MAX_POOL_CADENAS:
+        return _pool_cadenas.setdefault(valor, valor)
+    return _pool_cadenas.get(valor, valor)
+
+
+class TarjetaReceta(NamedTuple):
+    """
+    Vista previa de una receta en un listado de búsqueda.
+    
+    Tupla inmutable y liviana: se crea una por tarjeta, así que evita
+    el costo de memoria de un diccionario por elemento.
+    """
+    url: str
+    titulo: str = ""
+    imagen_preview: str = ""
+
+
+def tarjetas_de_arbol(arbol, opciones: dict) -> List[TarjetaReceta]:
+    """
+    Extrae las tarjetas de un listado de búsqueda desde un árbol HTML local.
+    
+    Equivalente en Python de window.__webscarper.tarjetas (ver JS_EXTRACTOR)
+    para listados descargados sin navegador.
+    
+    Args:
+        arbol: Árbol LexborHTMLParser (selectolax).
+        opciones: Mismas opciones que recibe tarjetas (ver
+                  BaseScraper._opciones_tarjetas).
+        
+    Returns:
+        Tarjetas del primer selector con resultados.
+    """
+    filtro_href = opciones.get("filtro_href")
+    url_base = opciones.get("url_base")
+    selector_titulo = opciones.get("selector_titulo")
+    selector_imagen = opciones.get("selector_imagen")
+    for selector in opciones["selectores"]:
+        recetas = []
+        for nodo in arbol.css(selector):
+            href = nodo.attributes.get('href')
+            if not href or (filtro_href and filtro_href not in href):
+                continue
+            if url_base and href.startswith('/'):
+                href = url_base + href
+            titulo = ''
+            if opciones.get("con_titulo"):
+                nodo_titulo = nodo.css_first(selector_titulo) if selector_titulo else None
+                titulo = _texto_nodo(nodo if nodo_titulo is None else nodo_titulo)
+            img = nodo.css_first(selector_imagen) if selector_imagen else None
+            imagen = (img.attributes.get('src') or '') if img is not None else ''
+            recetas.append(TarjetaReceta(href, titulo, imagen))
+            if len(recetas) >= opciones["limite"]:
+                break
+        if recetas:
+            return recetas
+    return []
+
+
+@dataclass(slots=True)
 class RecetaScraped:
     """
     Estructura de datos para una receta scrapeada.
@@ -165,17 +603,21 @@ class RecetaScraped:
     sitio_origen: str
     descripcion: Optional[str] = None
     imagen_url: Optional[str] = None
-    ingredientes: List[str] = None
-    pasos: List[str] = None
+    # Tuplas: inmutables (la receta puede quedar compartida en la caché)
+    # y sin la sobreasignación de las listas
+    ingredientes: Tuple[str, ...] = None
+    pasos: Tuple[str, ...] = None
     tiempo_preparacion: Optional[str] = None
     tiempo_coccion: Optional[str] = None
     porciones: Optional[str] = None
     
     def __post_init__(self):
-        if self.ingredientes is None:
-            self.ingredientes = []
-        if self.pasos is None:
-            self.pasos = []
+        self.ingredientes = tuple(self.ingredientes or ())
+        self.pasos = tuple(self.pasos or ())
+        self.sitio_origen = compartir_cadena(self.sitio_origen)
+        self.tiempo_preparacion = compartir_cadena(self.tiempo_preparacion)
+        self.tiempo_coccion = compartir_cadena(self.tiempo_coccion)
+        self.porciones = compartir_cadena(self.porciones)
     
     def validar(self) -> Tuple[bool, str]:
         """
@@ -215,6 +657,272 @@ class RecetaScraped:
         return detectar_idioma(texto)
 
 
+# Parámetros de query que solo sirven para seguimiento y no cambian la receta
+PARAMETROS_SEGUIMIENTO = frozenset((
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'fbclid', 'gclid', 'ref', 'ref_src'
+))
+
+# Caché de recetas scrapeadas: URL normalizada -> (momento de guardado, receta)
+_cache_recetas: "OrderedDict[str, Tuple[float, RecetaScraped]]" = OrderedDict()
+
+
+def normalizar_url(url: str) -> str:
+    """
+    Normaliza una URL para usarla como clave de caché.
+    
+    Pasa esquema y dominio a minúsculas, quita el fragmento, la barra final
+    y los parámetros de seguimiento (utm_*, fbclid, etc.).
+    
+    Args:
+        url: URL a normalizar.
+        
+    Returns:
+        URL canónica.
+    """
+    partes = urlsplit(url.strip())
+    query = urlencode([
+        (clave, valor)
+        for clave, valor in parse_qsl(partes.query, keep_blank_values=True)
+        if clave.lower() not in PARAMETROS_SEGUIMIENTO
+    ])
+    path = partes.path.rstrip('/') or '/'
+    return urlunsplit((partes.scheme.lower(), partes.netloc.lower(), path, query, ''))
+
+
+def obtener_receta_cacheada(url: str) -> Optional[RecetaScraped]:
+    """
+    Devuelve la receta cacheada para la URL si no expiró.
+    
+    Args:
+        url: URL de la receta (se normaliza internamente).
+        
+    Returns:
+        RecetaScraped cacheada o None.
+    """
+    clave = normalizar_url(url)
+    entrada = _cache_recetas.get(clave)
+    if entrada is None:
+        return None
+    
+    guardado, receta = entrada
+    if time.monotonic() - guardado > SCRAPER_CACHE_TTL:
+        del _cache_recetas[clave]
+        return None
+    
+    _cache_recetas.move_to_end(clave)
+    return receta
+
+
+def guardar_receta_en_cache(url: str, receta: RecetaScraped) -> bool:
+    """
+    Guarda una receta en la caché, descartando la más antigua si está llena.
+    
+    Solo se guardan recetas válidas: un scrapeo vacío o parcial (página que
+    no terminó de cargar, receta de respaldo tras un error) no debe servirse
+    durante todo SCRAPER_CACHE_TTL.
+    
+    Args:
+        url: URL de la receta (se normaliza internamente).
+        receta: Receta a guardar.
+        
+    Returns:
+        True si la receta se guardó, False si no pasó la validación.
+    """
+    if not receta.validar()[0]:
+        return False
+    
+    clave = normalizar_url(url)
+    _cache_recetas[clave] = (time.monotonic(), receta)
+    _cache_recetas.move_to_end(clave)
+    while len(_cache_recetas) > SCRAPER_CACHE_MAX:
+        _cache_recetas.popitem(last=False)
+    return True
+
+
+def limpiar_cache_recetas() -> None:
+    """Vacía la caché de recetas scrapeadas."""
+    _cache_recetas.clear()
+
+
+class HtmlCacheado(NamedTuple):
+    """HTML descargado y guardado en disco, con sus validadores HTTP."""
+    html: str
+    etag: Optional[str]
+    ultima_modificacion: Optional[str]
+    guardado: float
+
+
+# Escrituras en la caché de HTML entre dos podas (ver _podar_cache_html).
+# El contador arranca lleno: la primera escritura poda lo que dejó una
+# ejecución anterior
+_PODA_HTML_CADA = 100
+_escrituras_html = _PODA_HTML_CADA
+
+
+def _ruta_html_cacheado(url: str) -> Optional[Path]:
+    """Archivo de la caché de HTML para la URL, o None si está desactivada."""
+    if not SCRAPER_CACHE_HTML_DIR:
+        return None
+    nombre = hashlib.sha256(normalizar_url(url).encode()).hexdigest()
+    return Path(SCRAPER_CACHE_HTML_DIR) / f"{nombre}.json"
+
+
+def leer_html_cacheado(url: str) -> Optional[HtmlCacheado]:
+    """
+    Devuelve el HTML guardado en disco para la URL, aunque haya expirado.
+    
+    Args:
+        url: URL de la página (se normaliza internamente).
+        
+    Returns:
+        HtmlCacheado, o None si no hay entrada legible.
+    """
+    ruta = _ruta_html_cacheado(url)
+    if ruta is None:
+        return None
+    try:
+        datos = _json_loads(ruta.read_bytes())
+        return HtmlCacheado(
+            datos["html"], datos.get("etag"),
+            datos.get("ultima_modificacion"), float(datos["guardado"])
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def guardar_html_en_cache(
+    url: str,
+    html: str,
+    etag: Optional[str] = None,
+    ultima_modificacion: Optional[str] = None
+) -> None:
+    """
+    Guarda en disco el HTML de una página junto con sus validadores HTTP.
+    
+    Args:
+        url: URL de la página (se normaliza internamente).
+        html: Cuerpo de la respuesta.
+        etag: Cabecera ETag de la respuesta, si la hubo.
+        ultima_modificacion: Cabecera Last-Modified, si la hubo.
+    """
+    ruta = _ruta_html_cacheado(url)
+    if ruta is None:
+        return
+    entrada = {
+        "html": html,
+        "etag": etag,
+        "ultima_modificacion": ultima_modificacion,
+        "guardado": time.time(),
+    }
+    temporal = None
+    try:
+        ruta.parent.mkdir(parents=True, exist_ok=True)
+        # Escribir en un temporal único y renombrar: nunca queda un archivo
+        # a medias y dos escrituras simultáneas no comparten el temporal
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=ruta.parent, suffix=".tmp", delete=False
+        ) as archivo:
+            temporal = archivo.name
+            json.dump(entrada, archivo)
+        os.replace(temporal, ruta)
+    except OSError:
+        if temporal is not None:
+            try:
+                os.unlink(temporal)
+            except OSError:
+                pass
+        return
+    
+    global _escrituras_html
+    _escrituras_html += 1
+    if _escrituras_html >= _PODA_HTML_CADA:
+        _escrituras_html = 0
+        _podar_cache_html(ruta.parent)
+
+
+def _podar_cache_html(directorio: Path) -> None:
+    """
+    Borra las páginas guardadas hace más tiempo hasta dejar SCRAPER_CACHE_HTML_MAX.
+    
+    Las entradas vencidas se conservan para revalidarlas, así que sin esta
+    poda la caché crecería con cada URL nueva. Una respuesta 304 reescribe
+    el archivo, de modo que las páginas que se siguen usando son las últimas
+    en irse.
+    
+    Args:
+        directorio: Directorio de la caché de HTML.
+    """
+    entradas = []
+    for ruta in directorio.glob("*.json"):
+        try:
+            entradas.append((ruta.stat().st_mtime, ruta))
+        except OSError:
+            pass
+    sobrantes = len(entradas) - SCRAPER_CACHE_HTML_MAX
+    if sobrantes <= 0:
+        return
+    entradas.sort()
+    for _, ruta in entradas[:sobrantes]:
+        try:
+            ruta.unlink()
+        except OSError:
+            pass
+
+
+# Un lock por URL en vuelo: URL normalizada -> [lock, cantidad de usuarios]
+_locks_por_url: Dict[str, list] = {}
+
+
+@asynccontextmanager
+async def _bloqueo_por_url(url: str):
+    """
+    Serializa los scrapeos concurrentes de una misma URL.
+    
+    El primero scrapea y guarda en caché; los demás esperan y reciben
+    la receta cacheada en lugar de navegar de nuevo. El lock se descarta
+    cuando ya nadie lo usa.
+    
+    Args:
+        url: URL de la receta (se normaliza internamente).
+    """
+    clave = normalizar_url(url)
+    entrada = _locks_por_url.get(clave)
+    if entrada is None:
+        entrada = _locks_por_url[clave] = [asyncio.Lock(), 0]
+    entrada[1] += 1
+    try:
+        async with entrada[0]:
+            yield
+    finally:
+        entrada[1] -= 1
+        if entrada[1] == 0:
+            del _locks_por_url[clave]
+
+
+# Límite global de páginas abiertas en simultáneo sobre contextos compartidos
+_semaforo_paginas: Optional[asyncio.Semaphore] = None
+
+
+def _obtener_semaforo_paginas() -> asyncio.Semaphore:
+    """Crea (una sola vez) el semáforo que limita las páginas concurrentes."""
+    global _semaforo_paginas
+    if _semaforo_paginas is None:
+        _semaforo_paginas = asyncio.Semaphore(SCRAPER_MAX_PAGINAS)
+    return _semaforo_paginas
+
+
+# Selector que resolvió cada cascada la última vez, por sitio y campo:
+# (sitio, campo, id de la cascada) -> (cascada, entrada ganadora, campo
+# priorizado). El diseño de un sitio es estable entre recetas, así que la
+# próxima página la prueba primero. Las cascadas son constantes de clase: su
+# identidad sirve de clave sin armar nada por llamada, y guardarla junto al
+# ganador evita confundirla con otra lista que reutilice el mismo id. El campo
+# priorizado (ganadora primero) se arma una sola vez cuando cambia el ganador
+# y se reutiliza tal cual en las páginas siguientes.
+_selectores_ganadores: Dict[tuple, tuple] = {}
+
+
 class BaseScraper(ABC):
     """
     Clase base abstracta para todos los scrapers de sitios de recetas.
@@ -229,6 +937,22 @@ class BaseScraper(ABC):
     
     nombre_sitio: str = "Base"
     dominios_soportados: List[str] = []
+    # Especificación de campos para el extractor compilado (ver JS_EXTRACTOR)
+    CAMPOS: dict = {}
+    # Scripts propios del sitio que se instalan una vez por contexto, junto
+    # con JS_EXTRACTOR; cada página solo invoca las funciones que registran
+    SCRIPTS_INICIO: Tuple[str, ...] = ()
+    # True si el HTML del servidor ya trae los campos de CAMPOS: la receta
+    # se intenta primero sin navegador (ver _extraer_receta_http)
+    HTML_ESTATICO: bool = False
+    # True si ese HTML publica además el JSON-LD Recipe: sin navegador se
+    # prioriza como en _extraer_campos_con_jsonld
+    JSONLD_ESTATICO: bool = False
+    # True si el listado de búsqueda viene en el HTML del servidor y se lee
+    # con _extraer_tarjetas(page, SELECTORES_TARJETA, limite): se intenta
+    # primero sin navegador (ver _extraer_lista_http)
+    LISTADO_ESTATICO: bool = False
+    SELECTORES_TARJETA: Tuple[str, ...] = ()
     
     def __init__(self, proxy: Optional[str] = None):
         """
@@ -238,9 +962,14 @@ class BaseScraper(ABC):
             proxy: URL del proxy a usar (opcional).
         """
         self.proxy = proxy
+        # Si es False, los listados no leen el título de cada tarjeta (queda
+        # vacío); sirve cuando solo se usa la URL y el título sale de la receta
+        self.titulos_preview = True
         self.timeout = SCRAPER_TIMEOUT
         self.headless = SCRAPER_HEADLESS
         self._ultimo_request = 0
+        # Contexto compartido mientras hay una sesión abierta (ver sesion_navegador)
+        self._contexto = None
     
     @classmethod
     def soporta_url(cls, url: str) -> bool:
@@ -259,10 +988,12 @@ class BaseScraper(ABC):
     async def _esperar_rate_limit(self):
         """Implementa rate limiting entre peticiones."""
         ahora = time.time()
-        tiempo_desde_ultimo = ahora - self._ultimo_request
-        if tiempo_desde_ultimo < RATE_LIMIT_DELAY:
-            await asyncio.sleep(RATE_LIMIT_DELAY - tiempo_desde_ultimo)
-        self._ultimo_request = time.time()
+        espera = self._ultimo_request + RATE_LIMIT_DELAY - ahora
+        # Reservar el turno antes de dormir para que las peticiones
+        # concurrentes (ver extraer_con_pool) queden escalonadas
+        self._ultimo_request = ahora + max(espera, 0)
+        if espera > 0:
+            await asyncio.sleep(espera)
     
     async def _crear_contexto_playwright(self, playwright):
         """
@@ -274,6 +1005,23 @@ class BaseScraper(ABC):
         Returns:
             Tuple con el navegador y la página.
         """
+        browser = await self._lanzar_navegador(playwright)
+        context = await self._crear_contexto(browser)
+        page = await context.new_page()
+        page.set_default_timeout(self.timeout)
+        
+        return browser, page
+    
+    async def _lanzar_navegador(self, playwright):
+        """
+        Lanza Chromium con las opciones del scraper (headless, proxy).
+        
+        Args:
+            playwright: Instancia de Playwright.
+            
+        Returns:
+            Navegador de Playwright.
+        """
         launch_options = {
             "headless": self.headless,
         }
@@ -281,22 +1029,117 @@ class BaseScraper(ABC):
         if self.proxy:
             launch_options["proxy"] = {"server": self.proxy}
         
-        browser = await playwright.chromium.launch(**launch_options)
-        context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            viewport={"width": 1280, "height": 720}
+        return await playwright.chromium.launch(**launch_options)
+    
+    async def _crear_contexto(self, browser):
+        """
+        Crea un contexto de navegador reutilizable para varias páginas.
+        
+        Args:
+            browser: Navegador de Playwright ya lanzado.
+            
+        Returns:
+            BrowserContext con el extractor compilado instalado.
+        """
+        opciones = {
+            "user_agent": USER_AGENT,
+            "viewport": {"width": 1280, "height": 720},
+        }
+        # También en el contexto: el navegador puede ser compartido y no
+        # haberse lanzado con el proxy de este scraper (ver sesion_navegador)
+        if self.proxy:
+            opciones["proxy"] = {"server": self.proxy}
+        context = await browser.new_context(**opciones)
+        # Dejar disponible el extractor compilado en todas las páginas
+        await context.add_init_script(script=JS_EXTRACTOR)
+        for script in self.SCRIPTS_INICIO:
+            await context.add_init_script(script=script)
+        if SCRAPER_BLOQUEAR_RECURSOS:
+            await context.route("**/*", self._filtrar_recursos)
+        return context
+    
+    async def _filtrar_recursos(self, route):
+        """
+        Aborta las peticiones de recursos que no se usan para extraer la receta.
+        
+        Args:
+            route: Ruta interceptada por Playwright.
+        """
+        request = route.request
+        if request.resource_type in TIPOS_RECURSO_BLOQUEADOS or self._es_rastreador(request.url):
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    def _es_rastreador(self, url: str) -> bool:
+        """
+        Verifica si la URL pertenece a un dominio de analítica o publicidad.
+        
+        Args:
+            url: URL de la petición.
+            
+        Returns:
+            True si el host es (o es subdominio de) un dominio de DOMINIOS_RASTREO.
+        """
+        host = urlsplit(url).hostname or ""
+        return any(
+            host == dominio or host.endswith("." + dominio)
+            for dominio in DOMINIOS_RASTREO
         )
-        page = await context.new_page()
-        page.set_default_timeout(self.timeout)
+    
+    @asynccontextmanager
+    async def sesion_navegador(self, navegador=None):
+        """
+        Mantiene un contexto de navegador abierto para varios scrapeos.
         
-        return browser, page
+        Dentro de la sesión, scrapear abre solo una página por receta sobre
+        el mismo contexto (ver extraer_con_pool) en lugar de lanzar Chromium
+        en cada llamada.
+        
+        Args:
+            navegador: Navegador de Playwright ya lanzado (opcional). Si se
+                       pasa, la sesión solo crea y cierra su contexto; si no,
+                       lanza un navegador propio y lo cierra al salir.
+                       
+        Yields:
+            El mismo scraper, listo para usar.
+        """
+        if self._contexto is not None:
+            # Sesión ya abierta: reutilizarla
+            yield self
+            return
+        
+        if navegador is not None:
+            self._contexto = await self._crear_contexto(navegador)
+            try:
+                yield self
+            finally:
+                contexto, self._contexto = self._contexto, None
+                await contexto.close()
+            return
+        
+        from playwright.async_api import async_playwright
+        
+        async with async_playwright() as playwright:
+            browser = await self._lanzar_navegador(playwright)
+            try:
+                self._contexto = await self._crear_contexto(browser)
+                yield self
+            finally:
+                self._contexto = None
+                await browser.close()
     
-    async def scrapear(self, url: str) -> RecetaScraped:
+    async def scrapear(self, url: str, forzar_actualizacion: bool = False) -> RecetaScraped:
         """
         Método principal para scrapear una receta.
         
+        Con una sesión abierta (ver sesion_navegador) reutiliza su contexto;
+        si no, lanza un navegador solo para esta receta.
+        
         Args:
             url: URL de la receta a scrapear.
+            forzar_actualizacion: Ignorar la caché y volver a scrapear (la
+                                  receta nueva reemplaza a la cacheada).
             
         Returns:
             RecetaScraped con los datos extraídos.
@@ -304,22 +1147,221 @@ class BaseScraper(ABC):
         Raises:
             Exception: Si hay un error durante el scraping.
         """
-        from playwright.async_api import async_playwright
+        if self._contexto is not None:
+            return await self.extraer_con_pool(self._contexto, url, forzar_actualizacion)
         
-        await self._esperar_rate_limit()
-        
-        async with async_playwright() as playwright:
-            browser, page = await self._crear_contexto_playwright(playwright)
+        async with _bloqueo_por_url(url):
+            # Evitar navegar de nuevo si la receta ya se scrapeó recientemente
+            receta = None if forzar_actualizacion else obtener_receta_cacheada(url)
+            if receta is not None:
+                self._log(f"♻️ Receta en caché: {url}")
+                return receta
             
-            try:
-                await page.goto(url, wait_until="domcontentloaded")
-                # Esperar un poco más para que carguen elementos dinámicos
-                await asyncio.sleep(2)
+            receta = await self._extraer_receta_http(url, forzar_actualizacion)
+            if receta is not None:
+                guardar_receta_en_cache(url, receta)
+                return receta
+            
+            from playwright.async_api import async_playwright
+            
+            await self._esperar_rate_limit()
+            
+            async with async_playwright() as playwright:
+                browser, page = await self._crear_contexto_playwright(playwright)
                 
-                receta = await self._extraer_receta(page, url)
+                try:
+                    await page.goto(url, wait_until="domcontentloaded")
+                    # Esperar un poco más para que carguen elementos dinámicos
+                    await asyncio.sleep(2)
+                    
+                    receta = await self._extraer_receta(page, url)
+                    guardar_receta_en_cache(url, receta)
+                    return receta
+                finally:
+                    await browser.close()
+    
+    async def extraer_con_pool(
+        self,
+        context,
+        url: str,
+        forzar_actualizacion: bool = False
+    ) -> RecetaScraped:
+        """
+        Scrapea una receta abriendo una página liviana en un contexto compartido.
+        
+        Evita lanzar un navegador por receta: solo se crea y se cierra la
+        página. La cantidad de páginas abiertas en simultáneo está limitada
+        por SCRAPER_MAX_PAGINAS.
+        
+        Args:
+            context: BrowserContext creado con _crear_contexto.
+            url: URL de la receta a scrapear.
+            forzar_actualizacion: Ignorar la caché y volver a scrapear.
+            
+        Returns:
+            RecetaScraped con los datos extraídos.
+        """
+        async with _bloqueo_por_url(url):
+            receta = None if forzar_actualizacion else obtener_receta_cacheada(url)
+            if receta is not None:
+                self._log(f"♻️ Receta en caché: {url}")
                 return receta
-            finally:
-                await browser.close()
+            
+            receta = await self._extraer_receta_http(url, forzar_actualizacion)
+            if receta is not None:
+                guardar_receta_en_cache(url, receta)
+                return receta
+            
+            async with _obtener_semaforo_paginas():
+                await self._esperar_rate_limit()
+                page = await context.new_page()
+                page.set_default_timeout(self.timeout)
+                try:
+                    await page.goto(url, wait_until="domcontentloaded")
+                    # Esperar un poco más para que carguen elementos dinámicos
+                    await asyncio.sleep(2)
+                    receta = await self._extraer_receta(page, url)
+                finally:
+                    await page.close()
+            
+            guardar_receta_en_cache(url, receta)
+            return receta
+    
+    async def _descargar_html(self, url: str, revalidar: bool = False) -> Optional[str]:
+        """
+        Descarga el HTML de una página con una petición HTTP, sin navegador.
+        
+        Pasa por la caché en disco: dentro del TTL no se hace ninguna
+        petición, y después se revalida con If-None-Match/If-Modified-Since
+        para que una respuesta 304 reutilice el HTML guardado. La lectura y
+        escritura del disco corren en un hilo para no frenar el event loop.
+        
+        Args:
+            url: URL de la página.
+            revalidar: Consultar al servidor aunque la copia en disco
+                       no haya expirado.
+            
+        Returns:
+            HTML de la respuesta, o None si la descarga falló.
+        """
+        cacheado = await asyncio.to_thread(leer_html_cacheado, url)
+        if (cacheado is not None and not revalidar
+                and time.time() - cacheado.guardado <= SCRAPER_CACHE_HTML_TTL):
+            return cacheado.html
+        
+        import httpx
+        
+        cabeceras = {"User-Agent": USER_AGENT}
+        if cacheado is not None:
+            if cacheado.etag:
+                cabeceras["If-None-Match"] = cacheado.etag
+            if cacheado.ultima_modificacion:
+                cabeceras["If-Modified-Since"] = cacheado.ultima_modificacion
+        
+        await self._esperar_rate_limit()
+        try:
+            async with httpx.AsyncClient(
+                headers=cabeceras,
+                proxy=self.proxy,
+                timeout=self.timeout / 1000,
+                follow_redirects=True
+            ) as cliente:
+                respuesta = await cliente.get(url)
+        except httpx.HTTPError as e:
+            self._log(f"Error descargando {url}: {e}")
+            return None
+        
+        if respuesta.status_code == 304 and cacheado is not None:
+            # Sin cambios en el servidor: renovar la copia guardada
+            await asyncio.to_thread(
+                guardar_html_en_cache, url, cacheado.html,
+                respuesta.headers.get("etag", cacheado.etag),
+                respuesta.headers.get("last-modified", cacheado.ultima_modificacion)
+            )
+            return cacheado.html
+        if respuesta.status_code != 200:
+            return None
+        
+        await asyncio.to_thread(
+            guardar_html_en_cache, url, respuesta.text,
+            respuesta.headers.get("etag"), respuesta.headers.get("last-modified")
+        )
+        return respuesta.text
+    
+    async def _extraer_receta_http(
+        self,
+        url: str,
+        forzar_actualizacion: bool = False
+    ) -> Optional[RecetaScraped]:
+        """
+        Intenta extraer la receta del HTML del servidor, sin abrir el navegador.
+        
+        Solo aplica a scrapers con HTML_ESTATICO. Si falta título,
+        ingredientes o pasos (contenido generado con JavaScript) devuelve
+        None y la receta se extrae con Playwright.
+        
+        Args:
+            url: URL de la receta.
+            forzar_actualizacion: Revalidar el HTML guardado en disco
+                                  aunque no haya expirado.
+            
+        Returns:
+            RecetaScraped, o None si hay que usar el navegador.
+        """
+        if not (SCRAPER_HTTP_DIRECTO and self.HTML_ESTATICO):
+            return None
+        
+        html = await self._descargar_html(url, revalidar=forzar_actualizacion)
+        if not html:
+            return None
+        
+        from selectolax.lexbor import LexborHTMLParser
+        
+        try:
+            datos = self._extraer_campos_de_arbol(LexborHTMLParser(html))
+        except Exception as e:
+            self._log(f"Error extrayendo sin navegador: {e}")
+            return None
+        if not self._datos_completos(datos):
+            return None
+        
+        self._log(f"⚡ Receta extraída sin navegador: {url}")
+        return RecetaScraped(
+            titulo=datos["titulo"],
+            url_origen=url,
+            sitio_origen=self.nombre_sitio,
+            descripcion=datos.get("descripcion", ""),
+            imagen_url=datos.get("imagen_url", ""),
+            ingredientes=datos["ingredientes"],
+            pasos=datos["pasos"],
+            tiempo_preparacion=datos.get("tiempo_preparacion", ""),
+            tiempo_coccion=datos.get("tiempo_coccion", ""),
+            porciones=datos.get("porciones", "")
+        )
+    
+    def _extraer_campos_de_arbol(self, arbol) -> dict:
+        """
+        Extrae los campos de CAMPOS (y el JSON-LD, si corresponde) de un árbol local.
+        
+        Con JSONLD_ESTATICO sigue el mismo criterio que
+        _extraer_campos_con_jsonld: el JSON-LD completo se usa tal cual y,
+        si no, completa los huecos de CAMPOS.
+        
+        Args:
+            arbol: Árbol LexborHTMLParser (selectolax).
+            
+        Returns:
+            Diccionario con el valor de cada campo.
+        """
+        jsonld = (campos_jsonld_de_arbol(arbol) if self.JSONLD_ESTATICO else None) or {}
+        if self._datos_completos(jsonld):
+            return jsonld
+        
+        datos = extraer_campos_de_arbol(arbol, self.CAMPOS)
+        return {
+            nombre: valor or jsonld.get(nombre, valor)
+            for nombre, valor in datos.items()
+        }
     
     @abstractmethod
     async def _extraer_receta(self, page, url: str) -> RecetaScraped:
@@ -335,69 +1377,276 @@ class BaseScraper(ABC):
         """
         pass
     
-    async def _extraer_texto_seguro(self, page, selector: str, default: str = "") -> str:
+    async def _extraer_campos(self, page, campos: dict, script: Optional[str] = None) -> dict:
         """
-        Extrae texto de un selector de forma segura.
+        Extrae varios campos con una sola llamada al navegador.
+        
+        Usa el extractor compilado (JS_EXTRACTOR) instalado en el contexto,
+        que recorre los selectores de cada campo en orden y devuelve el
+        primer resultado no vacío.
         
         Args:
             page: Página de Playwright.
-            selector: Selector CSS del elemento.
-            default: Valor por defecto si no se encuentra.
+            campos: Especificación de campos (mismo formato que CAMPOS).
+            script: Función JS propia del sitio que recibe los campos, llama a
+                    window.__webscarper.extraer y agrega sus propios valores en
+                    la misma llamada (opcional).
             
         Returns:
-            Texto extraído o valor por defecto.
+            Diccionario con el valor de cada campo ('' o [] si no se encontró).
         """
+        claves = {
+            nombre: (self.nombre_sitio, nombre, id(campo["selectores"]))
+            for nombre, campo in campos.items()
+            if campo["tipo"] != "texto"
+        }
+        campos_priorizados = self._priorizar_selectores(campos, claves)
         try:
-            elemento = await page.query_selector(selector)
-            if elemento:
-                return (await elemento.inner_text()).strip()
-        except Exception:
-            pass
-        return default
+            datos = await page.evaluate(
+                script or '(campos) => window.__webscarper.extraer(campos)',
+                campos_priorizados
+            )
+        except Exception as e:
+            self._log(f"Error en el extractor compilado: {e}")
+            return {
+                nombre: [] if campo["tipo"] == "lista" else ""
+                for nombre, campo in campos.items()
+            }
+        
+        # Recordar qué entrada resolvió cada cascada; si ninguna lo hizo,
+        # el diseño cambió y se vuelve al orden declarado
+        ganadores = datos.pop("__ganadores", None) or {}
+        for nombre, clave in claves.items():
+            indice = ganadores.get(nombre)
+            if indice is None:
+                _selectores_ganadores.pop(clave, None)
+                continue
+            cascada = campos[nombre]["selectores"]
+            ganadora = campos_priorizados[nombre]["selectores"][indice]
+            anterior = _selectores_ganadores.get(clave)
+            if anterior is not None and anterior[0] is cascada and anterior[1] is ganadora:
+                # Mismo ganador: el campo ya compilado sigue sirviendo
+                continue
+            _selectores_ganadores[clave] = (
+                cascada, ganadora, self._compilar_campo(campos[nombre], ganadora)
+            )
+        return datos
+    
+    @staticmethod
+    def _compilar_campo(campo: dict, ganadora) -> dict:
+        """
+        Arma la especificación de un campo con la entrada ganadora primero.
+        
+        Args:
+            campo: Especificación original del campo.
+            ganadora: Entrada de la cascada que resolvió el campo.
+            
+        Returns:
+            El mismo campo si la ganadora ya iba primero, o una copia con la
+            cascada reordenada.
+        """
+        selectores = campo["selectores"]
+        if selectores[0] is ganadora:
+            return campo
+        return {
+            **campo,
+            "selectores": [ganadora] + [s for s in selectores if s is not ganadora],
+        }
+    
+    def _priorizar_selectores(self, campos: dict, claves: dict) -> dict:
+        """
+        Adelanta en cada cascada el selector que ganó en la página anterior.
+        
+        Args:
+            campos: Especificación de campos (mismo formato que CAMPOS).
+            claves: Clave de caché de cada campo con cascada.
+            
+        Returns:
+            Especificación con las cascadas reordenadas (los campos sin
+            ganador conocido se devuelven tal cual).
+        """
+        priorizados = dict(campos)
+        for nombre, clave in claves.items():
+            entrada = _selectores_ganadores.get(clave)
+            if entrada is not None and entrada[0] is campos[nombre]["selectores"]:
+                priorizados[nombre] = entrada[2]
+        return priorizados
     
-    async def _extraer_atributo_seguro(self, page, selector: str, atributo: str, default: str = "") -> str:
+    async def _extraer_jsonld_receta(self, page) -> Optional[dict]:
         """
-        Extrae un atributo de un elemento de forma segura.
+        Extrae los datos de la receta desde su JSON-LD (schema.org Recipe).
         
         Args:
             page: Página de Playwright.
-            selector: Selector CSS del elemento.
-            atributo: Nombre del atributo a extraer.
-            default: Valor por defecto si no se encuentra.
             
         Returns:
-            Valor del atributo o valor por defecto.
+            Diccionario de campos (ver campos_desde_recipe_jsonld) o None
+            si la página no publica un Recipe.
         """
         try:
-            elemento = await page.query_selector(selector)
-            if elemento:
-                valor = await elemento.get_attribute(atributo)
-                return valor.strip() if valor else default
+            payloads = await page.eval_on_selector_all(
+                'script[type="application/ld+json"]',
+                '(els) => els.map(el => el.textContent)'
+            )
         except Exception:
-            pass
-        return default
+            return None
+        
+        recipe = buscar_recipe_jsonld(payloads)
+        return campos_desde_recipe_jsonld(recipe) if recipe else None
     
-    async def _extraer_lista_textos(self, page, selector: str) -> List[str]:
+    async def _extraer_campos_con_jsonld(self, page) -> dict:
         """
-        Extrae una lista de textos de múltiples elementos.
+        Extrae los campos priorizando el JSON-LD de la página.
+        
+        Si el JSON-LD trae título, ingredientes y pasos se usa directamente;
+        si no, se recorre CAMPOS y los huecos se completan con el JSON-LD.
         
         Args:
             page: Página de Playwright.
-            selector: Selector CSS de los elementos.
             
         Returns:
-            Lista de textos extraídos.
+            Diccionario con los valores de cada campo de CAMPOS.
+        """
+        jsonld = await self._extraer_jsonld_receta(page) or {}
+        if self._datos_completos(jsonld):
+            self._log("Receta extraída desde JSON-LD")
+            return jsonld
+        
+        datos = await self._extraer_campos(page, self.CAMPOS)
+        return {
+            nombre: valor or jsonld.get(nombre, valor)
+            for nombre, valor in datos.items()
+        }
+    
+    def _datos_completos(self, datos: dict) -> bool:
+        """
+        Verifica si una extracción trae lo mínimo para no seguir buscando.
+        
+        Args:
+            datos: Campos extraídos.
+            
+        Returns:
+            True si hay título, ingredientes y pasos.
         """
+        return bool(datos.get("titulo") and datos.get("ingredientes") and datos.get("pasos"))
+    
+    async def _extraer_tarjetas(
+        self,
+        page,
+        selectores: Iterable[str],
+        limite: int,
+        filtro_href: Optional[str] = None,
+        url_base: str = "",
+        selector_titulo: Optional[str] = None,
+        selector_imagen: Optional[str] = None
+    ) -> List[TarjetaReceta]:
+        """
+        Extrae las tarjetas de un listado de búsqueda en una sola llamada.
+        
+        Prueba los selectores en orden y devuelve las tarjetas del primero
+        que encuentre resultados.
+        
+        Args:
+            page: Página de Playwright.
+            selectores: Selectores de los enlaces de cada tarjeta.
+            limite: Cantidad máxima de recetas a retornar.
+            filtro_href: Texto que debe contener el href (opcional).
+            url_base: Prefijo para completar hrefs relativos que empiezan con '/'.
+            selector_titulo: Selector del título dentro de la tarjeta
+                             (si es None o no coincide se usa el texto del enlace).
+                             Se ignora si titulos_preview es False.
+            selector_imagen: Selector de la imagen dentro de la tarjeta (opcional).
+            
+        Returns:
+            Lista de TarjetaReceta.
+        """
+        opciones = self._opciones_tarjetas(
+            selectores, limite, filtro_href, url_base, selector_titulo, selector_imagen
+        )
         try:
-            elementos = await page.query_selector_all(selector)
-            textos = []
-            for elemento in elementos:
-                texto = (await elemento.inner_text()).strip()
-                if texto:
-                    textos.append(texto)
-            return textos
-        except Exception:
+            recetas = await page.evaluate(
+                '(opciones) => window.__webscarper.tarjetas(opciones)', opciones
+            )
+        except Exception as e:
+            self._log(f"Error extrayendo el listado: {e}")
             return []
+        return [TarjetaReceta._make(fila) for fila in recetas[:limite]]
+    
+    def _opciones_tarjetas(
+        self,
+        selectores: Iterable[str],
+        limite: int,
+        filtro_href: Optional[str] = None,
+        url_base: str = "",
+        selector_titulo: Optional[str] = None,
+        selector_imagen: Optional[str] = None
+    ) -> dict:
+        """
+        Arma las opciones de tarjetas() (ver _extraer_tarjetas).
+        
+        Returns:
+            Diccionario serializable para el extractor del navegador o
+            para tarjetas_de_arbol.
+        """
+        return {
+            "selectores": list(selectores),
+            "limite": limite,
+            "filtro_href": filtro_href,
+            "url_base": url_base,
+            "selector_titulo": selector_titulo,
+            "con_titulo": self.titulos_preview,
+            "selector_imagen": selector_imagen,
+        }
+    
+    async def _extraer_lista_http(self, url_busqueda: str, limite: int) -> List[TarjetaReceta]:
+        """
+        Intenta leer el listado de búsqueda del HTML del servidor, sin navegador.
+        
+        Solo aplica a scrapers con LISTADO_ESTATICO. La página se revalida
+        siempre con el servidor para no repetir resultados viejos.
+        
+        Args:
+            url_busqueda: URL de la página de resultados.
+            limite: Cantidad máxima de recetas a retornar.
+            
+        Returns:
+            Lista de TarjetaReceta, vacía si hay que usar el navegador.
+        """
+        if not (SCRAPER_HTTP_DIRECTO and self.LISTADO_ESTATICO):
+            return []
+        
+        html = await self._descargar_html(url_busqueda, revalidar=True)
+        if not html:
+            return []
+        
+        from selectolax.lexbor import LexborHTMLParser
+        
+        try:
+            return tarjetas_de_arbol(
+                LexborHTMLParser(html),
+                self._opciones_tarjetas(self.SELECTORES_TARJETA, limite)
+            )
+        except Exception as e:
+            self._log(f"Error extrayendo el listado sin navegador: {e}")
+            return []
+    
+    async def _obtener_arbol_html(self, page):
+        """
+        Toma una única instantánea del HTML renderizado y la parsea localmente.
+        
+        Permite evaluar muchos selectores de respaldo sin un viaje al
+        navegador por cada consulta.
+        
+        Args:
+            page: Página de Playwright.
+            
+        Returns:
+            Árbol LexborHTMLParser (selectolax) del documento.
+        """
+        from selectolax.lexbor import LexborHTMLParser
+        
+        html = await page.content()
+        return LexborHTMLParser(html)
     
     async def _esperar_cualquier_selector(
         self, 
@@ -409,6 +1658,9 @@ class BaseScraper(ABC):
         Espera a que cualquiera de los selectores exista en la página.
         Retorna el selector que encontró primero.
         
+        Todos los selectores se evalúan juntos en el navegador con una sola
+        espera, en lugar de probarlos uno por uno.
+        
         Args:
             page: Página de Playwright.
             selectores: Lista de selectores CSS a probar.
@@ -417,18 +1669,16 @@ class BaseScraper(ABC):
         Returns:
             El selector que se encontró, o None si ninguno existe.
         """
-        tiempo_por_selector = max(timeout // len(selectores), 1000)
-        
-        for selector in selectores:
-            try:
-                await page.wait_for_selector(selector, timeout=tiempo_por_selector)
-                self._log(f"Selector encontrado: {selector}")
-                return selector
-            except Exception:
-                continue
-        
-        self._log(f"Ningún selector encontrado de: {selectores}")
-        return None
+        try:
+            handle = await page.wait_for_function(
+                JS_PRIMER_SELECTOR_VISIBLE, arg=list(selectores), timeout=timeout
+            )
+            selector = await handle.json_value()
+            self._log(f"Selector encontrado: {selector}")
+            return selector
+        except Exception:
+            self._log(f"Ningún selector encontrado de: {selectores}")
+            return None
     
     async def _hacer_scroll_para_lazy_loading(
         self, 
@@ -452,30 +1702,60 @@ class BaseScraper(ABC):
         await page.evaluate('window.scrollTo(0, 0)')
         await page.wait_for_timeout(500)
     
-    async def _esperar_contenido_cargado(self, page, timeout: int = 30000):
+    async def _scroll_hasta_el_final(self, page, timeout: int = 1500):
         """
-        Espera a que el contenido principal esté cargado.
-        Usa múltiples estrategias.
+        Hace un único scroll hasta el final para activar lazy loading.
+        
+        Alternativa corta a _hacer_scroll_para_lazy_loading: en lugar de
+        pausas fijas espera a que la red quede inactiva, como máximo timeout ms.
         
         Args:
             page: Página de Playwright.
             timeout: Tiempo máximo de espera en ms.
         """
+        await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
         try:
-            # Estrategia 1: Esperar networkidle
             await page.wait_for_load_state('networkidle', timeout=timeout)
         except Exception:
             pass
+    
+    async def _esperar_contenido_cargado(self, page, timeout: int = 30000):
+        """
+        Espera a que el contenido principal esté cargado.
+        Usa múltiples estrategias, esperadas en paralelo: el tiempo total
+        es el de la más lenta y no la suma de ambas.
         
-        try:
+        Args:
+            page: Página de Playwright.
+            timeout: Tiempo máximo de espera en ms.
+        """
+        # return_exceptions: un timeout de una estrategia no cancela la otra
+        await asyncio.gather(
+            # Estrategia 1: Esperar networkidle
+            page.wait_for_load_state('networkidle', timeout=timeout),
             # Estrategia 2: Esperar que no haya spinners/loaders
-            await page.wait_for_function('''
+            page.wait_for_function('''
                 () => {
                     const loaders = document.querySelectorAll('.loading, .spinner, [class*="loader"]');
                     return loaders.length === 0 || 
                            Array.from(loaders).every(el => el.offsetParent === null);
                 }
-            ''', timeout=10000)
+            ''', timeout=10000),
+            return_exceptions=True
+        )
+    
+    async def _detener_carga(self, page):
+        """
+        Detiene la carga pendiente de la página (window.stop()).
+        
+        Se usa cuando el contenido a extraer ya está en el DOM, para que
+        los scripts y peticiones restantes del sitio no compitan por CPU.
+        
+        Args:
+            page: Página de Playwright.
+        """
+        try:
+            await page.evaluate('window.stop()')
         except Exception:
             pass
     
@@ -493,7 +1773,7 @@ class BaseScraper(ABC):
         palabra_clave: Optional[str] = None,
         filtros: Optional[dict] = None,
         limite: int = 50
-    ) -> List[dict]:
+    ) -> List[TarjetaReceta]:
         """
         Busca recetas en el sitio según los criterios dados.
         
@@ -507,31 +1787,60 @@ class BaseScraper(ABC):
             limite: Cantidad máxima de recetas a retornar.
             
         Returns:
-            Lista de diccionarios con datos básicos de cada receta encontrada:
-            [{"url": str, "titulo": str, "imagen_preview": str}, ...]
+            Lista de TarjetaReceta (url, titulo, imagen_preview) con los
+            datos básicos de cada receta encontrada.
         """
-        from playwright.async_api import async_playwright
+        url_busqueda = self._construir_url_busqueda(palabra_clave, filtros)
+        
+        # Listados de HTML estático: sin navegador si el servidor ya los trae
+        recetas = await self._extraer_lista_http(url_busqueda, limite)
+        if recetas:
+            return recetas
         
         await self._esperar_rate_limit()
         
+        # Con una sesión abierta el listado es una página más de su contexto
+        if self._contexto is not None:
+            page = await self._contexto.new_page()
+            page.set_default_timeout(self.timeout)
+            try:
+                return await self._listar_en_pagina(page, url_busqueda, limite)
+            finally:
+                await page.close()
+        
+        from playwright.async_api import async_playwright
+        
         async with async_playwright() as playwright:
             browser, page = await self._crear_contexto_playwright(playwright)
             
             try:
-                # Construir y navegar a la URL de búsqueda
-                url_busqueda = self._construir_url_busqueda(palabra_clave, filtros)
-                await page.goto(url_busqueda, wait_until="domcontentloaded")
-                await asyncio.sleep(2)
-                
-                # Extraer la lista de recetas encontradas
-                recetas = await self._extraer_lista_recetas(page, limite)
-                return recetas
-            except Exception as e:
-                # Retornar lista vacía si hay error (el servicio manejará los errores)
-                return []
+                return await self._listar_en_pagina(page, url_busqueda, limite)
             finally:
                 await browser.close()
     
+    async def _listar_en_pagina(self, page, url_busqueda: str, limite: int) -> List[TarjetaReceta]:
+        """
+        Navega a la página de resultados y extrae el listado.
+        
+        Args:
+            page: Página de Playwright.
+            url_busqueda: URL de la página de resultados.
+            limite: Cantidad máxima de recetas a retornar.
+            
+        Returns:
+            Lista de TarjetaReceta, vacía si hubo un error.
+        """
+        try:
+            # Navegar a la URL de búsqueda
+            await page.goto(url_busqueda, wait_until="domcontentloaded")
+            await asyncio.sleep(2)
+            
+            # Extraer la lista de recetas encontradas
+            return await self._extraer_lista_recetas(page, limite)
+        except Exception:
+            # Retornar lista vacía si hay error (el servicio manejará los errores)
+            return []
+    
     def _construir_url_busqueda(
         self, 
         palabra_clave: Optional[str] = None,
@@ -556,7 +1865,7 @@ class BaseScraper(ABC):
             return f"https://{dominio}/search?q={palabra_clave}"
         return f"https://{dominio}/"
     
-    async def _extraer_lista_recetas(self, page, limite: int) -> List[dict]:
+    async def _extraer_lista_recetas(self, page, limite: int) -> List[TarjetaReceta]:
         """
         Extrae la lista de recetas de una página de resultados.
         
@@ -568,7 +1877,7 @@ class BaseScraper(ABC):
             limite: Cantidad máxima de recetas a extraer.
             
         Returns:
-            Lista de diccionarios con URL, título e imagen de cada receta.
+            Lista de TarjetaReceta con URL, título e imagen de cada receta.
         """
         # Implementación por defecto - cada scraper debe sobrescribir
         return []
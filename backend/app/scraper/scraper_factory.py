@@ -4,7 +4,7 @@ Factory para crear el scraper adecuado según la URL.
 Detecta automáticamente qué scraper usar basándose en el dominio de la URL.
 """
 
-from typing import Optional, Type, List
+from typing import Optional, Type, List, Dict
 from urllib.parse import urlparse
 
 from app.scraper.base_scraper import BaseScraper
@@ -21,6 +21,8 @@ class ScraperFactory:
     
     # Lista de clases de scrapers registrados
     _scrapers: List[Type[BaseScraper]] = []
+    # Índice nombre de sitio -> clase, armado una vez a partir de _scrapers
+    _scrapers_por_nombre: Dict[str, Type[BaseScraper]] = {}
     _proxy_manager: Optional[ProxyManager] = None
     
     @classmethod
@@ -33,6 +35,7 @@ class ScraperFactory:
         """
         if scraper_class not in cls._scrapers:
             cls._scrapers.append(scraper_class)
+            cls._scrapers_por_nombre = {}
     
     @classmethod
     def establecer_proxy_manager(cls, proxy_manager: ProxyManager):
@@ -60,13 +63,69 @@ class ScraperFactory:
         
         for scraper_class in cls._scrapers:
             if scraper_class.soporta_url(url):
-                proxy = None
-                if cls._proxy_manager:
-                    proxy = cls._proxy_manager.obtener_proxy()
-                return scraper_class(proxy=proxy)
+                return cls._instanciar(scraper_class)
         
         return None
     
+    @classmethod
+    def obtener_scraper_por_nombre(cls, nombre_sitio: str) -> Optional[BaseScraper]:
+        """
+        Obtiene el scraper de un sitio a partir de su nombre.
+        
+        Args:
+            nombre_sitio: Nombre del sitio (ej: "Cookpad").
+            
+        Returns:
+            Instancia del scraper o None si no hay un sitio con ese nombre.
+        """
+        scraper_class = cls._indice_por_nombre().get(nombre_sitio)
+        if scraper_class is None:
+            return None
+        return cls._instanciar(scraper_class)
+    
+    @classmethod
+    def obtener_nombres_sitios(cls) -> List[str]:
+        """
+        Obtiene los nombres de los sitios soportados, en orden de registro.
+        
+        Returns:
+            Lista con el nombre de cada sitio.
+        """
+        return list(cls._indice_por_nombre())
+    
+    @classmethod
+    def _indice_por_nombre(cls) -> Dict[str, Type[BaseScraper]]:
+        """
+        Devuelve el índice nombre de sitio -> clase, armándolo la primera vez.
+        
+        Returns:
+            Diccionario con la clase de scraper de cada sitio.
+        """
+        cls._cargar_scrapers()
+        
+        if not cls._scrapers_por_nombre:
+            cls._scrapers_por_nombre = {
+                scraper_class.nombre_sitio: scraper_class
+                for scraper_class in cls._scrapers
+            }
+        return cls._scrapers_por_nombre
+    
+    @classmethod
+    def _instanciar(cls, scraper_class: Type[BaseScraper]) -> BaseScraper:
+        """
+        Crea un scraper con el siguiente proxy del gestor, si hay uno.
+        
+        Args:
+            scraper_class: Clase del scraper a instanciar.
+            
+        Returns:
+            Instancia del scraper.
+        """
+        proxy = None
+        if cls._proxy_manager:
+            proxy = cls._proxy_manager.obtener_proxy()
+        return scraper_class(proxy=proxy)
+    
     @classmethod
     def obtener_sitios_soportados(cls) -> List[dict]:
         """
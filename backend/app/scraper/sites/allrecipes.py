@@ -7,7 +7,7 @@ Usa las versiones en español del sitio.
 
 from typing import List, Optional
 from urllib.parse import quote
-from app.scraper.base_scraper import BaseScraper, RecetaScraped
+from app.scraper.base_scraper import BaseScraper, RecetaScraped, TarjetaReceta
 
 
 class AllRecipesScraper(BaseScraper):
@@ -21,6 +21,59 @@ class AllRecipesScraper(BaseScraper):
     # Priorizamos los dominios en español
     dominios_soportados = ["allrecipes.com.mx", "recetas.allrecipes.com", "allrecipes.com"]
     
+    # Selectores de las tarjetas de recetas en el listado de búsqueda
+    SELECTORES_TARJETA = ('a[href*="/recipe/"]', '.card__title-link', '.mntl-card-list-items a')
+    SELECTOR_TITULO_TARJETA = '.card__title, span'
+    
+    # Especificación compilada de campos (ver JS_EXTRACTOR en base_scraper)
+    CAMPOS = {
+        "titulo": {
+            "tipo": "texto",
+            "selector": 'h1.article-heading, h1.headline, h1',
+        },
+        "descripcion": {
+            "tipo": "texto",
+            "selector": '.article-subheading, .recipe-summary p, .article-body p:first-of-type',
+        },
+        "imagen_url": {
+            "tipo": "atributo",
+            "selectores": ['.primary-image img, .recipe-image img, article img'],
+            # Si no hay src, data-src (lazy loading)
+            "atributos": ['src', 'data-src'],
+            "requiere_http": False,
+        },
+        "ingredientes": {
+            "tipo": "lista",
+            "selectores": [
+                '.mntl-structured-ingredients__list-item',
+                '.ingredients-item-name',
+                '.recipe-ingredients li',
+                '[class*="ingredient"] li',
+            ],
+        },
+        "pasos": {
+            "tipo": "lista",
+            "selectores": [
+                '.mntl-sc-block-group--LI p',
+                '.instructions-section-item .paragraph',
+                '.recipe-directions__list li',
+                '[class*="directions"] li',
+            ],
+        },
+        "tiempo_preparacion": {
+            "tipo": "texto",
+            "selector": '.recipe-prep-time .meta-value, [class*="prep-time"] .mntl-recipe-details__value',
+        },
+        "tiempo_coccion": {
+            "tipo": "texto",
+            "selector": '.recipe-cook-time .meta-value, [class*="cook-time"] .mntl-recipe-details__value',
+        },
+        "porciones": {
+            "tipo": "texto",
+            "selector": '.recipe-servings .meta-value, [class*="servings"] .mntl-recipe-details__value',
+        },
+    }
+    
     def _construir_url_busqueda(
         self, 
         palabra_clave: Optional[str] = None,
@@ -37,36 +90,15 @@ class AllRecipesScraper(BaseScraper):
             return f"https://www.allrecipes.com.mx/recetas/buscar/?texto={query}"
         return "https://www.allrecipes.com.mx/recetas/"
     
-    async def _extraer_lista_recetas(self, page, limite: int) -> List[dict]:
+    async def _extraer_lista_recetas(self, page, limite: int) -> List[TarjetaReceta]:
         """Extrae la lista de recetas de la página de búsqueda."""
-        recetas = []
-        selectores = ['a[href*="/recipe/"]', '.card__title-link', '.mntl-card-list-items a']
-        
-        for selector in selectores:
-            try:
-                elementos = await page.query_selector_all(selector)
-                for elemento in elementos[:limite]:
-                    try:
-                        href = await elemento.get_attribute("href")
-                        if not href or "/recipe/" not in href:
-                            continue
-                        titulo_elem = await elemento.query_selector('.card__title, span')
-                        titulo = ""
-                        if titulo_elem:
-                            titulo = (await titulo_elem.inner_text()).strip()
-                        else:
-                            titulo = (await elemento.inner_text()).strip()
-                        if href:
-                            recetas.append({"url": href, "titulo": titulo, "imagen_preview": ""})
-                        if len(recetas) >= limite:
-                            break
-                    except Exception:
-                        continue
-                if recetas:
-                    break
-            except Exception:
-                continue
-        return recetas[:limite]
+        return await self._extraer_tarjetas(
+            page,
+            self.SELECTORES_TARJETA,
+            limite,
+            filtro_href="/recipe/",
+            selector_titulo=self.SELECTOR_TITULO_TARJETA
+        )
     
     async def _extraer_receta(self, page, url: str) -> RecetaScraped:
         """
@@ -79,96 +111,18 @@ class AllRecipesScraper(BaseScraper):
         Returns:
             RecetaScraped con los datos extraídos.
         """
-        # Título
-        titulo = await self._extraer_texto_seguro(
-            page, 
-            'h1.article-heading, h1.headline, h1'
-        )
-        
-        # Descripción
-        descripcion = await self._extraer_texto_seguro(
-            page,
-            '.article-subheading, .recipe-summary p, .article-body p:first-of-type'
-        )
-        
-        # Imagen
-        imagen_url = await self._extraer_atributo_seguro(
-            page,
-            '.primary-image img, .recipe-image img, article img',
-            'src'
-        )
-        
-        # Si no hay src, intentar data-src
-        if not imagen_url:
-            imagen_url = await self._extraer_atributo_seguro(
-                page,
-                '.primary-image img, .recipe-image img',
-                'data-src'
-            )
-        
-        # Ingredientes
-        ingredientes = await self._extraer_ingredientes(page)
-        
-        # Pasos
-        pasos = await self._extraer_pasos(page)
-        
-        # Metadatos
-        tiempo_preparacion = await self._extraer_texto_seguro(
-            page,
-            '.recipe-prep-time .meta-value, [class*="prep-time"] .mntl-recipe-details__value'
-        )
-        
-        tiempo_coccion = await self._extraer_texto_seguro(
-            page,
-            '.recipe-cook-time .meta-value, [class*="cook-time"] .mntl-recipe-details__value'
-        )
-        
-        porciones = await self._extraer_texto_seguro(
-            page,
-            '.recipe-servings .meta-value, [class*="servings"] .mntl-recipe-details__value'
-        )
+        # Todos los campos en una sola pasada por el DOM
+        datos = await self._extraer_campos(page, self.CAMPOS)
         
         return RecetaScraped(
-            titulo=titulo or "Sin título",
+            titulo=datos["titulo"] or "Sin título",
             url_origen=url,
             sitio_origen=self.nombre_sitio,
-            descripcion=descripcion,
-            imagen_url=imagen_url,
-            ingredientes=ingredientes,
-            pasos=pasos,
-            tiempo_preparacion=tiempo_preparacion,
-            tiempo_coccion=tiempo_coccion,
-            porciones=porciones
+            descripcion=datos["descripcion"],
+            imagen_url=datos["imagen_url"],
+            ingredientes=datos["ingredientes"],
+            pasos=datos["pasos"],
+            tiempo_preparacion=datos["tiempo_preparacion"],
+            tiempo_coccion=datos["tiempo_coccion"],
+            porciones=datos["porciones"]
         )
-    
-    async def _extraer_ingredientes(self, page) -> List[str]:
-        """Extrae la lista de ingredientes."""
-        selectores = [
-            '.mntl-structured-ingredients__list-item',
-            '.ingredients-item-name',
-            '.recipe-ingredients li',
-            '[class*="ingredient"] li'
-        ]
-        
-        for selector in selectores:
-            ingredientes = await self._extraer_lista_textos(page, selector)
-            if ingredientes:
-                return ingredientes
-        
-        return []
-    
-    async def _extraer_pasos(self, page) -> List[str]:
-        """Extrae los pasos de preparación."""
-        selectores = [
-            '.mntl-sc-block-group--LI p',
-            '.instructions-section-item .paragraph',
-            '.recipe-directions__list li',
-            '[class*="directions"] li'
-        ]
-        
-        for selector in selectores:
-            pasos = await self._extraer_lista_textos(page, selector)
-            if pasos:
-                return pasos
-        
-        return []
@@ -6,9 +6,13 @@ Soporta WordPress con estructuras personalizadas típicas de medios argentinos.
 """
 
 import re
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 from urllib.parse import quote
-from app.scraper.base_scraper import BaseScraper, RecetaScraped
+from app.scraper.base_scraper import BaseScraper, RecetaScraped, TarjetaReceta
+
+
+# Separador de palabras para tokenizar el texto de los encabezados
+PATRON_SEPARADOR_PALABRAS = re.compile(r'\W+')
 
 
 class CocinerosArgentinosScraper(BaseScraper):
@@ -26,9 +30,89 @@ class CocinerosArgentinosScraper(BaseScraper):
     dominios_soportados = ["cocinerosargentinos.com"]
     
     # Títulos que identifican la sección de ingredientes
-    TITULOS_INGREDIENTES = ["ingredientes", "ingrediente"]
+    TITULOS_INGREDIENTES = frozenset(("ingredientes", "ingrediente"))
     # Títulos que identifican la sección de pasos/preparación
-    TITULOS_PASOS = ["preparación", "preparacion", "procedimiento", "elaboración", "elaboracion", "pasos"]
+    TITULOS_PASOS = frozenset((
+        "preparación", "preparacion", "procedimiento", "elaboración", "elaboracion", "pasos"
+    ))
+    
+    # Selectores de los enlaces a recetas en el listado de búsqueda
+    SELECTORES_TARJETA = ('article a', '.entry-title a', 'a[href*="receta"]')
+    
+    # Listas genéricas de WordPress usadas como último recurso
+    SELECTORES_RESPALDO_INGREDIENTES = (
+        '.entry-content ul:first-of-type li',
+        '.post-content ul:first-of-type li'
+    )
+    SELECTORES_RESPALDO_PASOS = (
+        '.entry-content ol li',
+        '.post-content ol li'
+    )
+    
+    # Especificación compilada de campos (ver JS_EXTRACTOR en base_scraper).
+    # Las búsquedas por encabezado quedan como respaldo en Python.
+    CAMPOS = {
+        "titulo": {
+            "tipo": "texto",
+            "selector": 'h1.recipe-title, h1.entry-title, h1.post-title, h1',
+        },
+        "descripcion": {
+            "tipo": "texto",
+            "selector": '.recipe-description, .entry-content > p:first-of-type, .post-excerpt',
+        },
+        "imagen_url": {
+            "tipo": "atributo",
+            "selectores": [
+                '.post-thumbnail img',
+                '.featured-image img',
+                'figure.wp-block-image img',
+                '.wp-post-image',
+                '.recipe-image img',
+                '.entry-content img',
+                'article img',
+            ],
+            "atributos": ['src', 'data-src', 'data-lazy-src', 'data-original'],
+            "requiere_http": True,
+        },
+        "ingredientes": {
+            "tipo": "lista",
+            "selectores": [
+                '.recipe-ingredients li',
+                '.receta-ingredientes li',
+                '[class*="ingredientes"] li',
+                '.wprm-recipe-ingredient',
+                '.ingredients-list li',
+                'ul.ingredients li',
+            ],
+        },
+        "pasos": {
+            "tipo": "lista",
+            "selectores": [
+                '.recipe-directions li',
+                '.recipe-instructions li',
+                '.receta-preparacion li',
+                '[class*="preparacion"] li',
+                '[class*="procedimiento"] li',
+                '[class*="elaboracion"] li',
+                '.wprm-recipe-instruction',
+                '.recipe-steps li',
+                'ol.directions li',
+                'ol.instructions li',
+            ],
+        },
+        "tiempo_preparacion": {
+            "tipo": "texto",
+            "selector": '.prep-time, [class*="tiempo-prep"], .recipe-prep-time',
+        },
+        "tiempo_coccion": {
+            "tipo": "texto",
+            "selector": '.cook-time, [class*="tiempo-coccion"], .recipe-cook-time',
+        },
+        "porciones": {
+            "tipo": "texto",
+            "selector": '.servings, [class*="porciones"], .recipe-servings',
+        },
+    }
     
     def _construir_url_busqueda(
         self, 
@@ -41,31 +125,9 @@ class CocinerosArgentinosScraper(BaseScraper):
             return f"https://www.cocinerosargentinos.com/?s={query}"
         return "https://www.cocinerosargentinos.com/recetas/"
     
-    async def _extraer_lista_recetas(self, page, limite: int) -> List[dict]:
+    async def _extraer_lista_recetas(self, page, limite: int) -> List[TarjetaReceta]:
         """Extrae la lista de recetas de la página de búsqueda."""
-        recetas = []
-        selectores = ['article a', '.entry-title a', 'a[href*="receta"]']
-        
-        for selector in selectores:
-            try:
-                elementos = await page.query_selector_all(selector)
-                for elemento in elementos[:limite]:
-                    try:
-                        href = await elemento.get_attribute("href")
-                        if not href:
-                            continue
-                        titulo = (await elemento.inner_text()).strip()
-                        if href:
-                            recetas.append({"url": href, "titulo": titulo, "imagen_preview": ""})
-                        if len(recetas) >= limite:
-                            break
-                    except Exception:
-                        continue
-                if recetas:
-                    break
-            except Exception:
-                continue
-        return recetas[:limite]
+        return await self._extraer_tarjetas(page, self.SELECTORES_TARJETA, limite)
     
     async def _extraer_receta(self, page, url: str) -> RecetaScraped:
         """
@@ -87,42 +149,18 @@ class CocinerosArgentinosScraper(BaseScraper):
         # Hacer scroll para cargar contenido lazy
         await self._hacer_scroll_para_lazy_loading(page, scrolls=5, delay_ms=500)
         
-        # Título
-        titulo = await self._extraer_texto_seguro(
-            page, 
-            'h1.recipe-title, h1.entry-title, h1.post-title, h1'
-        )
+        # Todos los campos en una sola pasada por el DOM
+        datos = await self._extraer_campos(page, self.CAMPOS)
+        titulo = datos["titulo"]
         
-        # Descripción
-        descripcion = await self._extraer_texto_seguro(
-            page,
-            '.recipe-description, .entry-content > p:first-of-type, .post-excerpt'
-        )
-        
-        # Imagen (con soporte para lazy loading)
-        imagen_url = await self._extraer_imagen(page)
-        
-        # Ingredientes
-        ingredientes = await self._extraer_ingredientes(page)
-        
-        # Pasos
-        pasos = await self._extraer_pasos(page)
-        
-        # Metadatos
-        tiempo_preparacion = await self._extraer_texto_seguro(
-            page,
-            '.prep-time, [class*="tiempo-prep"], .recipe-prep-time'
-        )
-        
-        tiempo_coccion = await self._extraer_texto_seguro(
-            page,
-            '.cook-time, [class*="tiempo-coccion"], .recipe-cook-time'
-        )
-        
-        porciones = await self._extraer_texto_seguro(
-            page,
-            '.servings, [class*="porciones"], .recipe-servings'
-        )
+        # Respaldo por encabezados / contenido genérico si las cascadas no encontraron nada,
+        # evaluado sobre una sola instantánea del HTML
+        ingredientes = datos["ingredientes"]
+        pasos = datos["pasos"]
+        if not ingredientes or not pasos:
+            arbol = await self._obtener_arbol_html(page)
+            ingredientes = ingredientes or self._extraer_ingredientes_respaldo(arbol)
+            pasos = pasos or self._extraer_pasos_respaldo(arbol)
         
         self._log(f"✅ Receta extraída: {titulo}")
         
@@ -130,123 +168,94 @@ class CocinerosArgentinosScraper(BaseScraper):
             titulo=titulo or "Sin título",
             url_origen=url,
             sitio_origen=self.nombre_sitio,
-            descripcion=descripcion,
-            imagen_url=imagen_url,
+            descripcion=datos["descripcion"],
+            imagen_url=datos["imagen_url"],
             ingredientes=ingredientes,
             pasos=pasos,
-            tiempo_preparacion=tiempo_preparacion,
-            tiempo_coccion=tiempo_coccion,
-            porciones=porciones
+            tiempo_preparacion=datos["tiempo_preparacion"],
+            tiempo_coccion=datos["tiempo_coccion"],
+            porciones=datos["porciones"]
         )
     
-    async def _extraer_imagen(self, page) -> str:
+    def _extraer_contenido_por_encabezado(
+        self, 
+        arbol, 
+        titulos_buscar: FrozenSet[str]
+    ) -> List[str]:
         """
-        Extrae la URL de la imagen de la receta.
-        Soporta lazy loading (data-src, data-lazy-src) y múltiples selectores.
+        Extrae contenido que sigue a un encabezado específico (h2, h3).
+        Busca el encabezado por texto y extrae la lista o párrafo siguiente.
         
         Args:
-            page: Página de Playwright.
+            arbol: Árbol HTML local (ver _obtener_arbol_html).
+            titulos_buscar: Conjunto de palabras a buscar (case insensitive).
             
         Returns:
-            URL de la imagen o cadena vacía.
+            Lista de textos extraídos.
         """
-        selectores_imagen = [
-            '.post-thumbnail img',
-            '.featured-image img',
-            'figure.wp-block-image img',
-            '.wp-post-image',
-            '.recipe-image img',
-            '.entry-content img',
-            'article img'
-        ]
+        # Buscar en encabezados h2 y h3
+        for nivel in ['h2', 'h3']:
+            for encabezado in arbol.css(nivel):
+                texto_encabezado = encabezado.text(separator=' ', strip=True).lower()
+                
+                # Verificar si alguna palabra del encabezado es un título buscado
+                if not self._encabezado_coincide(texto_encabezado, titulos_buscar):
+                    continue
+                
+                # Siguiente elemento hermano (saltando nodos de texto y comentarios)
+                siguiente = encabezado.next
+                while siguiente is not None and siguiente.tag.startswith(('-', '_')):
+                    siguiente = siguiente.next
+                if siguiente is None:
+                    continue
+                
+                # Intentar extraer de lista ul/ol
+                resultado = [
+                    texto for texto in (
+                        item.text(separator=' ', strip=True)
+                        for item in siguiente.css('li')
+                    ) if texto
+                ]
+                if resultado:
+                    return resultado
+                
+                # Si no hay lista, extraer texto del párrafo
+                resultado = self._parsear_contenido_con_br(siguiente.html or "")
+                if resultado:
+                    return resultado
         
-        atributos_imagen = ['src', 'data-src', 'data-lazy-src', 'data-original']
+        return []
+    
+    def _encabezado_coincide(self, texto_encabezado: str, titulos_buscar: FrozenSet[str]) -> bool:
+        """
+        Verifica si el encabezado contiene alguna de las palabras buscadas.
         
-        for selector in selectores_imagen:
-            for atributo in atributos_imagen:
-                imagen_url = await self._extraer_atributo_seguro(page, selector, atributo)
-                if imagen_url and imagen_url.startswith('http'):
-                    return imagen_url
+        Tokeniza el texto una sola vez y compara por palabra completa,
+        evitando falsos positivos por coincidencias parciales.
         
-        return ""
+        Args:
+            texto_encabezado: Texto del encabezado en minúsculas.
+            titulos_buscar: Conjunto de palabras a buscar.
+            
+        Returns:
+            True si alguna palabra del encabezado está en el conjunto.
+        """
+        palabras = set(PATRON_SEPARADOR_PALABRAS.split(texto_encabezado))
+        return not titulos_buscar.isdisjoint(palabras)
     
-    async def _extraer_contenido_por_encabezado(
-        self, 
-        page, 
-        titulos_buscar: List[str]
-    ) -> List[str]:
+    def _textos_de_nodos(self, arbol, selector: str) -> List[str]:
         """
-        Extrae contenido que sigue a un encabezado específico (h2, h3).
-        Busca el encabezado por texto y extrae la lista o párrafo siguiente.
+        Extrae el texto no vacío de todos los nodos que coinciden con el selector.
         
         Args:
-            page: Página de Playwright.
-            titulos_buscar: Lista de títulos a buscar (case insensitive).
+            arbol: Árbol HTML local.
+            selector: Selector CSS.
             
         Returns:
-            Lista de textos extraídos.
+            Lista de textos.
         """
-        resultado = []
-        
-        try:
-            # Buscar en encabezados h2 y h3
-            for nivel in ['h2', 'h3']:
-                encabezados = await page.query_selector_all(nivel)
-                for encabezado in encabezados:
-                    texto_encabezado = (await encabezado.inner_text()).strip().lower()
-                    
-                    # Verificar si el encabezado coincide con alguno de los títulos buscados
-                    if any(titulo in texto_encabezado for titulo in titulos_buscar):
-                        # Buscar el siguiente elemento hermano
-                        siguiente = await encabezado.evaluate_handle(
-                            '(el) => el.nextElementSibling'
-                        )
-                        if siguiente:
-                            elemento_siguiente = siguiente.as_element()
-                            if elemento_siguiente:
-                                # Intentar extraer de lista ul/ol
-                                items_lista = await elemento_siguiente.query_selector_all('li')
-                                if items_lista:
-                                    for item in items_lista:
-                                        texto = (await item.inner_text()).strip()
-                                        if texto:
-                                            resultado.append(texto)
-                                    if resultado:
-                                        return resultado
-                                
-                                # Si no hay lista, extraer texto del párrafo
-                                contenido = await elemento_siguiente.inner_html()
-                                if contenido:
-                                    resultado = self._parsear_contenido_con_br(contenido)
-                                    if resultado:
-                                        return resultado
-                        
-                        # Si nextElementSibling no funcionó, buscar ul/ol/p inmediatamente después
-                        # Escapar comillas en el texto para uso seguro en selectores
-                        texto_escapado = texto_encabezado.replace('"', '\\"').replace("'", "\\'")
-                        for siguiente_tag in ['ul', 'ol', 'p', 'div']:
-                            selector_siguiente = f'{nivel}:has-text("{texto_escapado}") + {siguiente_tag}'
-                            try:
-                                elemento = await page.query_selector(selector_siguiente)
-                                if elemento:
-                                    if siguiente_tag in ['ul', 'ol']:
-                                        items = await elemento.query_selector_all('li')
-                                        for item in items:
-                                            texto = (await item.inner_text()).strip()
-                                            if texto:
-                                                resultado.append(texto)
-                                    else:
-                                        contenido = await elemento.inner_html()
-                                        resultado = self._parsear_contenido_con_br(contenido)
-                                    
-                                    if resultado:
-                                        return resultado
-                            except Exception:
-                                continue
-        except Exception:
-            pass
-        
-        return resultado
+        textos = (nodo.text(separator=' ', strip=True) for nodo in arbol.css(selector))
+        return [texto for texto in textos if texto]
     
     def _parsear_contenido_con_br(self, html_contenido: str) -> List[str]:
         """
@@ -273,91 +282,45 @@ class CocinerosArgentinosScraper(BaseScraper):
         
         return resultado
     
-    async def _extraer_ingredientes(self, page) -> List[str]:
+    def _extraer_ingredientes_respaldo(self, arbol) -> List[str]:
         """
-        Extrae la lista de ingredientes.
-        Intenta múltiples estrategias:
-        1. Selectores CSS específicos
-        2. Búsqueda por encabezado "Ingredientes"
-        3. Contenido genérico de WordPress
-        """
-        # Estrategia 1: Selectores específicos de recetas
-        selectores = [
-            '.recipe-ingredients li',
-            '.receta-ingredientes li',
-            '[class*="ingredientes"] li',
-            '.wprm-recipe-ingredient',
-            '.ingredients-list li',
-            'ul.ingredients li'
-        ]
-        
-        for selector in selectores:
-            ingredientes = await self._extraer_lista_textos(page, selector)
-            if ingredientes:
-                return ingredientes
+        Respaldo de ingredientes cuando la cascada de CAMPOS no encontró nada.
         
-        # Estrategia 2: Buscar por encabezado
-        ingredientes = await self._extraer_contenido_por_encabezado(
-            page, self.TITULOS_INGREDIENTES
+        Primero busca por encabezado "Ingredientes" y después en el contenido
+        genérico de WordPress, sobre el árbol HTML local.
+        """
+        # Buscar por encabezado
+        ingredientes = self._extraer_contenido_por_encabezado(
+            arbol, self.TITULOS_INGREDIENTES
         )
         if ingredientes:
             return ingredientes
         
-        # Estrategia 3: Contenido genérico de WordPress (entry-content)
-        selectores_fallback = [
-            '.entry-content ul:first-of-type li',
-            '.post-content ul:first-of-type li'
-        ]
-        
-        for selector in selectores_fallback:
-            ingredientes = await self._extraer_lista_textos(page, selector)
+        # Contenido genérico de WordPress (entry-content)
+        for selector in self.SELECTORES_RESPALDO_INGREDIENTES:
+            ingredientes = self._textos_de_nodos(arbol, selector)
             if ingredientes:
                 return ingredientes
         
         return []
     
-    async def _extraer_pasos(self, page) -> List[str]:
+    def _extraer_pasos_respaldo(self, arbol) -> List[str]:
         """
-        Extrae los pasos de preparación.
-        Intenta múltiples estrategias:
-        1. Selectores CSS específicos
-        2. Búsqueda por encabezado "Preparación"/"Procedimiento"
-        3. Listas ordenadas genéricas
-        """
-        # Estrategia 1: Selectores específicos de recetas
-        selectores = [
-            '.recipe-directions li',
-            '.recipe-instructions li',
-            '.receta-preparacion li',
-            '[class*="preparacion"] li',
-            '[class*="procedimiento"] li',
-            '[class*="elaboracion"] li',
-            '.wprm-recipe-instruction',
-            '.recipe-steps li',
-            'ol.directions li',
-            'ol.instructions li'
-        ]
-        
-        for selector in selectores:
-            pasos = await self._extraer_lista_textos(page, selector)
-            if pasos:
-                return pasos
+        Respaldo de pasos cuando la cascada de CAMPOS no encontró nada.
         
-        # Estrategia 2: Buscar por encabezado
-        pasos = await self._extraer_contenido_por_encabezado(
-            page, self.TITULOS_PASOS
+        Primero busca por encabezado "Preparación"/"Procedimiento" y después
+        en las listas ordenadas genéricas, sobre el árbol HTML local.
+        """
+        # Buscar por encabezado
+        pasos = self._extraer_contenido_por_encabezado(
+            arbol, self.TITULOS_PASOS
         )
         if pasos:
             return pasos
         
-        # Estrategia 3: Listas ordenadas genéricas
-        selectores_fallback = [
-            '.entry-content ol li',
-            '.post-content ol li'
-        ]
-        
-        for selector in selectores_fallback:
-            pasos = await self._extraer_lista_textos(page, selector)
+        # Listas ordenadas genéricas
+        for selector in self.SELECTORES_RESPALDO_PASOS:
+            pasos = self._textos_de_nodos(arbol, selector)
             if pasos:
                 return pasos
         
@@ -4,9 +4,10 @@ Scraper para Directo al Paladar (directoalpaladar.com).
 Blog de recetas español con amplia variedad de platos.
 """
 
+from functools import lru_cache
 from typing import List, Optional
 from urllib.parse import quote
-from app.scraper.base_scraper import BaseScraper, RecetaScraped
+from app.scraper.base_scraper import BaseScraper, RecetaScraped, TarjetaReceta
 
 
 class DirectoAlPaladarScraper(BaseScraper):
@@ -19,42 +20,83 @@ class DirectoAlPaladarScraper(BaseScraper):
     nombre_sitio = "Directo al Paladar"
     dominios_soportados = ["directoalpaladar.com"]
     
+    # Selectores de los enlaces a recetas en el listado de búsqueda
+    SELECTORES_TARJETA = ('article a[href*="/receta"]', '.post-title a', 'a.entry-title')
+    
+    # El artículo y su JSON-LD vienen en el HTML del servidor
+    HTML_ESTATICO = True
+    JSONLD_ESTATICO = True
+    
+    # Especificación compilada de campos (ver JS_EXTRACTOR en base_scraper)
+    CAMPOS = {
+        "titulo": {
+            "tipo": "texto",
+            "selector": 'h1.title, h1.article-title, h1',
+        },
+        # Primer párrafo del artículo
+        "descripcion": {
+            "tipo": "texto",
+            "selector": '.article-content p:first-of-type, .recipe-intro',
+        },
+        "imagen_url": {
+            "tipo": "atributo",
+            "selectores": ['.article-image img, .featured-image img, article img'],
+            "atributos": ['src'],
+            "requiere_http": False,
+        },
+        "ingredientes": {
+            "tipo": "lista",
+            "selectores": [
+                '.recipe-ingredients li',
+                '[class*="ingredientes"] li',
+                '.ingredients-list li',
+                'ul.ingredients li',
+            ],
+        },
+        "pasos": {
+            "tipo": "lista",
+            "selectores": [
+                '.recipe-directions li',
+                '[class*="elaboracion"] li',
+                '.recipe-steps li',
+                'ol.directions li',
+            ],
+        },
+        "tiempo_preparacion": {
+            "tipo": "texto",
+            "selector": '.recipe-prep-time, [class*="prep-time"]',
+        },
+        "tiempo_coccion": {
+            "tipo": "texto",
+            "selector": '.recipe-cook-time, [class*="cook-time"]',
+        },
+        "porciones": {
+            "tipo": "texto",
+            "selector": '.recipe-servings, [class*="servings"], [class*="comensales"]',
+        },
+    }
+    
     def _construir_url_busqueda(
         self, 
         palabra_clave: Optional[str] = None,
         filtros: Optional[dict] = None
     ) -> str:
         """Construye la URL de búsqueda para Directo al Paladar."""
+        # El sitio no admite filtros dietéticos en la URL: solo importa la palabra clave
+        return self._url_busqueda(palabra_clave)
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _url_busqueda(palabra_clave: Optional[str]) -> str:
+        """Arma (y memoriza) la URL de búsqueda para una palabra clave."""
         if palabra_clave:
             query = quote(palabra_clave)
             return f"https://www.directoalpaladar.com/search?q={query}"
         return "https://www.directoalpaladar.com/recetas"
     
-    async def _extraer_lista_recetas(self, page, limite: int) -> List[dict]:
+    async def _extraer_lista_recetas(self, page, limite: int) -> List[TarjetaReceta]:
         """Extrae la lista de recetas de la página de búsqueda."""
-        recetas = []
-        selectores = ['article a[href*="/receta"]', '.post-title a', 'a.entry-title']
-        
-        for selector in selectores:
-            try:
-                elementos = await page.query_selector_all(selector)
-                for elemento in elementos[:limite]:
-                    try:
-                        href = await elemento.get_attribute("href")
-                        if not href:
-                            continue
-                        titulo = (await elemento.inner_text()).strip()
-                        if href:
-                            recetas.append({"url": href, "titulo": titulo, "imagen_preview": ""})
-                        if len(recetas) >= limite:
-                            break
-                    except Exception:
-                        continue
-                if recetas:
-                    break
-            except Exception:
-                continue
-        return recetas[:limite]
+        return await self._extraer_tarjetas(page, self.SELECTORES_TARJETA, limite)
     
     async def _extraer_receta(self, page, url: str) -> RecetaScraped:
         """
@@ -67,88 +109,18 @@ class DirectoAlPaladarScraper(BaseScraper):
         Returns:
             RecetaScraped con los datos extraídos.
         """
-        # Título
-        titulo = await self._extraer_texto_seguro(
-            page, 
-            'h1.title, h1.article-title, h1'
-        )
-        
-        # Descripción - primer párrafo del artículo
-        descripcion = await self._extraer_texto_seguro(
-            page,
-            '.article-content p:first-of-type, .recipe-intro'
-        )
-        
-        # Imagen principal
-        imagen_url = await self._extraer_atributo_seguro(
-            page,
-            '.article-image img, .featured-image img, article img',
-            'src'
-        )
-        
-        # Ingredientes
-        ingredientes = await self._extraer_ingredientes(page)
-        
-        # Pasos
-        pasos = await self._extraer_pasos(page)
-        
-        # Tiempo y porciones
-        tiempo_preparacion = await self._extraer_texto_seguro(
-            page,
-            '.recipe-prep-time, [class*="prep-time"]'
-        )
-        
-        tiempo_coccion = await self._extraer_texto_seguro(
-            page,
-            '.recipe-cook-time, [class*="cook-time"]'
-        )
-        
-        porciones = await self._extraer_texto_seguro(
-            page,
-            '.recipe-servings, [class*="servings"], [class*="comensales"]'
-        )
+        # JSON-LD primero; si está incompleto, una sola pasada por el DOM
+        datos = await self._extraer_campos_con_jsonld(page)
         
         return RecetaScraped(
-            titulo=titulo or "Sin título",
+            titulo=datos["titulo"] or "Sin título",
             url_origen=url,
             sitio_origen=self.nombre_sitio,
-            descripcion=descripcion,
-            imagen_url=imagen_url,
-            ingredientes=ingredientes,
-            pasos=pasos,
-            tiempo_preparacion=tiempo_preparacion,
-            tiempo_coccion=tiempo_coccion,
-            porciones=porciones
+            descripcion=datos["descripcion"],
+            imagen_url=datos["imagen_url"],
+            ingredientes=datos["ingredientes"],
+            pasos=datos["pasos"],
+            tiempo_preparacion=datos["tiempo_preparacion"],
+            tiempo_coccion=datos["tiempo_coccion"],
+            porciones=datos["porciones"]
         )
-    
-    async def _extraer_ingredientes(self, page) -> List[str]:
-        """Extrae la lista de ingredientes."""
-        selectores = [
-            '.recipe-ingredients li',
-            '[class*="ingredientes"] li',
-            '.ingredients-list li',
-            'ul.ingredients li'
-        ]
-        
-        for selector in selectores:
-            ingredientes = await self._extraer_lista_textos(page, selector)
-            if ingredientes:
-                return ingredientes
-        
-        return []
-    
-    async def _extraer_pasos(self, page) -> List[str]:
-        """Extrae los pasos de preparación."""
-        selectores = [
-            '.recipe-directions li',
-            '[class*="elaboracion"] li',
-            '.recipe-steps li',
-            'ol.directions li'
-        ]
-        
-        for selector in selectores:
-            pasos = await self._extraer_lista_textos(page, selector)
-            if pasos:
-                return pasos
-        
-        return []
@@ -7,7 +7,7 @@ Usa las versiones en español del sitio.
 
 from typing import List, Optional
 from urllib.parse import quote
-from app.scraper.base_scraper import BaseScraper, RecetaScraped
+from app.scraper.base_scraper import BaseScraper, RecetaScraped, TarjetaReceta
 
 
 class HelloFreshScraper(BaseScraper):
@@ -21,6 +21,101 @@ class HelloFreshScraper(BaseScraper):
     # Priorizamos los dominios en español
     dominios_soportados = ["hellofresh.es", "hellofresh.com.ar", "hellofresh.com"]
     
+    # Selectores de las tarjetas de recetas en el listado de búsqueda
+    SELECTORES_TARJETA = ('a[href*="/recipes/"]', '[data-test-id*="recipe-card"] a')
+    SELECTOR_TITULO_TARJETA = 'h3, .recipe-card-title'
+    
+    # Camino rápido: solo los atributos data-test-id estables de HelloFresh
+    CAMPOS_DATA_TEST_ID = {
+        "titulo": {
+            "tipo": "texto",
+            "selector": '[data-test-id="recipeDetailFragment.recipe-name"]',
+        },
+        "descripcion": {
+            "tipo": "texto",
+            "selector": '[data-test-id="recipeDetailFragment.recipe-description"]',
+        },
+        "imagen_url": {
+            "tipo": "atributo",
+            "selectores": ['[data-test-id="recipeDetailFragment.recipe-image"] img'],
+            "atributos": ['src'],
+            "requiere_http": False,
+        },
+        "ingredientes": {
+            "tipo": "lista",
+            "selectores": ['[data-test-id="recipeDetailFragment.ingredient-item"]'],
+        },
+        "pasos": {
+            "tipo": "lista",
+            "selectores": ['[data-test-id="recipeDetailFragment.instructions.step"]'],
+        },
+        "tiempo_coccion": {
+            "tipo": "texto",
+            "selector": '[data-test-id="recipeDetailFragment.cooking-time"]',
+        },
+        "porciones": {
+            "tipo": "texto",
+            "selector": '[data-test-id="recipeDetailFragment.servings"]',
+        },
+        "tiempo_preparacion": {
+            "tipo": "texto",
+            "selector": '[data-test-id="recipeDetailFragment.preparation-time"]',
+        },
+    }
+    
+    # Especificación completa, con respaldos por si cambia el marcado
+    CAMPOS = {
+        "titulo": {
+            "tipo": "texto",
+            "selector": 'h1[data-test-id="recipeDetailFragment.recipe-name"], h1',
+        },
+        # HelloFresh suele tener tags descriptivos
+        "descripcion": {
+            "tipo": "texto",
+            "selector": '[data-test-id="recipeDetailFragment.recipe-description"], .recipe-description',
+        },
+        "imagen_url": {
+            "tipo": "atributo",
+            "selectores": [
+                '[data-test-id="recipeDetailFragment.recipe-image"] img, .recipe-header img',
+            ],
+            "atributos": ['src'],
+            "requiere_http": False,
+        },
+        "ingredientes": {
+            "tipo": "lista",
+            "selectores": [
+                '[data-test-id="recipeDetailFragment.ingredient-item"]',
+                '.recipe-ingredients li',
+                '[class*="ingredient"] li',
+                '.ingredients-list li',
+            ],
+        },
+        "pasos": {
+            "tipo": "lista",
+            "selectores": [
+                '[data-test-id="recipeDetailFragment.instructions.step"]',
+                '.recipe-steps li',
+                '[class*="instruction"] li',
+                '.instructions li',
+            ],
+        },
+        # Metadatos - HelloFresh usa formato específico
+        "tiempo_coccion": {
+            "tipo": "texto",
+            "selector": '[data-test-id="recipeDetailFragment.cooking-time"], .cooking-time',
+        },
+        "porciones": {
+            "tipo": "texto",
+            "selector": '[data-test-id="recipeDetailFragment.servings"], .servings',
+        },
+        # HelloFresh a veces tiene nivel de dificultad en lugar de tiempo de prep
+        "tiempo_preparacion": {
+            "tipo": "texto",
+            "selector": '[data-test-id="recipeDetailFragment.preparation-time"], .prep-time',
+        },
+    }
+    
     def _construir_url_busqueda(
         self, 
         palabra_clave: Optional[str] = None,
@@ -37,36 +132,16 @@ class HelloFreshScraper(BaseScraper):
             return f"https://www.hellofresh.es/recipes/search?q={query}"
         return "https://www.hellofresh.es/recipes"
     
-    async def _extraer_lista_recetas(self, page, limite: int) -> List[dict]:
+    async def _extraer_lista_recetas(self, page, limite: int) -> List[TarjetaReceta]:
         """Extrae la lista de recetas de la página de búsqueda."""
-        recetas = []
-        selectores = ['a[href*="/recipes/"]', '[data-test-id*="recipe-card"] a']
-        
-        for selector in selectores:
-            try:
-                elementos = await page.query_selector_all(selector)
-                for elemento in elementos[:limite]:
-                    try:
-                        href = await elemento.get_attribute("href")
-                        if not href or "/recipes/" not in href:
-                            continue
-                        if href.startswith("/"):
-                            href = f"https://www.hellofresh.com{href}"
-                        titulo_elem = await elemento.query_selector('h3, .recipe-card-title')
-                        titulo = ""
-                        if titulo_elem:
-                            titulo = (await titulo_elem.inner_text()).strip()
-                        if href:
-                            recetas.append({"url": href, "titulo": titulo, "imagen_preview": ""})
-                        if len(recetas) >= limite:
-                            break
-                    except Exception:
-                        continue
-                if recetas:
-                    break
-            except Exception:
-                continue
-        return recetas[:limite]
+        return await self._extraer_tarjetas(
+            page,
+            self.SELECTORES_TARJETA,
+            limite,
+            filtro_href="/recipes/",
+            url_base="https://www.hellofresh.com",
+            selector_titulo=self.SELECTOR_TITULO_TARJETA
+        )
     
     async def _extraer_receta(self, page, url: str) -> RecetaScraped:
         """
@@ -79,89 +154,21 @@ class HelloFreshScraper(BaseScraper):
         Returns:
             RecetaScraped con los datos extraídos.
         """
-        # Título
-        titulo = await self._extraer_texto_seguro(
-            page, 
-            'h1[data-test-id="recipeDetailFragment.recipe-name"], h1'
-        )
-        
-        # Descripción (HelloFresh suele tener tags descriptivos)
-        descripcion = await self._extraer_texto_seguro(
-            page,
-            '[data-test-id="recipeDetailFragment.recipe-description"], .recipe-description'
-        )
-        
-        # Imagen
-        imagen_url = await self._extraer_atributo_seguro(
-            page,
-            '[data-test-id="recipeDetailFragment.recipe-image"] img, .recipe-header img',
-            'src'
-        )
-        
-        # Ingredientes
-        ingredientes = await self._extraer_ingredientes(page)
-        
-        # Pasos
-        pasos = await self._extraer_pasos(page)
-        
-        # Metadatos - HelloFresh usa formato específico
-        tiempo_coccion = await self._extraer_texto_seguro(
-            page,
-            '[data-test-id="recipeDetailFragment.cooking-time"], .cooking-time'
-        )
-        
-        porciones = await self._extraer_texto_seguro(
-            page,
-            '[data-test-id="recipeDetailFragment.servings"], .servings'
-        )
-        
-        # HelloFresh a veces tiene nivel de dificultad en lugar de tiempo de prep
-        tiempo_preparacion = await self._extraer_texto_seguro(
-            page,
-            '[data-test-id="recipeDetailFragment.preparation-time"], .prep-time'
-        )
+        # Camino rápido por data-test-id; si el marcado cambió,
+        # JSON-LD y luego la especificación completa
+        datos = await self._extraer_campos(page, self.CAMPOS_DATA_TEST_ID)
+        if not self._datos_completos(datos):
+            datos = await self._extraer_campos_con_jsonld(page)
         
         return RecetaScraped(
-            titulo=titulo or "Sin título",
+            titulo=datos["titulo"] or "Sin título",
             url_origen=url,
             sitio_origen=self.nombre_sitio,
-            descripcion=descripcion,
-            imagen_url=imagen_url,
-            ingredientes=ingredientes,
-            pasos=pasos,
-            tiempo_preparacion=tiempo_preparacion,
-            tiempo_coccion=tiempo_coccion,
-            porciones=porciones
+            descripcion=datos["descripcion"],
+            imagen_url=datos["imagen_url"],
+            ingredientes=datos["ingredientes"],
+            pasos=datos["pasos"],
+            tiempo_preparacion=datos["tiempo_preparacion"],
+            tiempo_coccion=datos["tiempo_coccion"],
+            porciones=datos["porciones"]
         )
-    
-    async def _extraer_ingredientes(self, page) -> List[str]:
-        """Extrae la lista de ingredientes."""
-        selectores = [
-            '[data-test-id="recipeDetailFragment.ingredient-item"]',
-            '.recipe-ingredients li',
-            '[class*="ingredient"] li',
-            '.ingredients-list li'
-        ]
-        
-        for selector in selectores:
-            ingredientes = await self._extraer_lista_textos(page, selector)
-            if ingredientes:
-                return ingredientes
-        
-        return []
-    
-    async def _extraer_pasos(self, page) -> List[str]:
-        """Extrae los pasos de preparación."""
-        selectores = [
-            '[data-test-id="recipeDetailFragment.instructions.step"]',
-            '.recipe-steps li',
-            '[class*="instruction"] li',
-            '.instructions li'
-        ]
-        
-        for selector in selectores:
-            pasos = await self._extraer_lista_textos(page, selector)
-            if pasos:
-                return pasos
-        
-        return []
@@ -4,9 +4,10 @@ Scraper para Paulina Cocina (paulinacocina.net).
 Blog de cocina argentino con recetas caseras.
 """
 
+import asyncio
 from typing import List, Optional
 from urllib.parse import quote
-from app.scraper.base_scraper import BaseScraper, RecetaScraped
+from app.scraper.base_scraper import BaseScraper, RecetaScraped, TarjetaReceta
 
 
 class PaulinaCocinaScraper(BaseScraper):
@@ -19,6 +20,73 @@ class PaulinaCocinaScraper(BaseScraper):
     nombre_sitio = "Paulina Cocina"
     dominios_soportados = ["paulinacocina.net"]
     
+    # Selectores de las tarjetas de recetas en el listado de búsqueda
+    SELECTORES_TARJETA = ('article a', '.entry-title a', 'a[href*="/receta"]')
+    
+    # Selectores cuya aparición indica que ingredientes y pasos ya cargaron
+    SELECTORES_ESPERA_INGREDIENTES = (
+        '.wprm-recipe-ingredient',
+        '.recipe-ingredients li',
+        '[class*="ingredientes"] li',
+        '.ingredients li'
+    )
+    SELECTORES_ESPERA_PASOS = (
+        '.wprm-recipe-instruction-text',
+        '.wprm-recipe-instruction',
+        '.recipe-instructions li',
+        '[class*="preparacion"] li',
+        '.instructions li'
+    )
+    
+    # Especificación compilada de campos (ver JS_EXTRACTOR en base_scraper)
+    CAMPOS = {
+        "titulo": {
+            "tipo": "texto",
+            "selector": 'h1.entry-title, h1.post-title, h1',
+        },
+        "descripcion": {
+            "tipo": "texto",
+            "selector": '.entry-content > p:first-of-type, .recipe-summary',
+        },
+        "imagen_url": {
+            "tipo": "atributo",
+            "selectores": ['.wp-post-image, .entry-content img, article img'],
+            "atributos": ['src'],
+            "requiere_http": False,
+        },
+        "ingredientes": {
+            "tipo": "lista",
+            "selectores": [
+                '.wprm-recipe-ingredient',
+                '.recipe-ingredients li',
+                '[class*="ingredientes"] li',
+                '.ingredients li',
+            ],
+        },
+        "pasos": {
+            "tipo": "lista",
+            "selectores": [
+                '.wprm-recipe-instruction-text',
+                '.recipe-instructions li',
+                '[class*="preparacion"] li',
+                '.instructions li',
+            ],
+        },
+        # Metadatos de WP Recipe Maker
+        "tiempo_preparacion": {
+            "tipo": "texto",
+            "selector": '.wprm-recipe-prep-time-container, [class*="prep-time"]',
+        },
+        "tiempo_coccion": {
+            "tipo": "texto",
+            "selector": '.wprm-recipe-cook-time-container, [class*="cook-time"]',
+        },
+        "porciones": {
+            "tipo": "texto",
+            "selector": '.wprm-recipe-servings-container, [class*="servings"]',
+        },
+    }
+    
     def _construir_url_busqueda(
         self, 
         palabra_clave: Optional[str] = None,
@@ -30,31 +98,11 @@ class PaulinaCocinaScraper(BaseScraper):
             return f"https://www.paulinacocina.net/?s={query}"
         return "https://www.paulinacocina.net/recetas"
     
-    async def _extraer_lista_recetas(self, page, limite: int) -> List[dict]:
+    async def _extraer_lista_recetas(self, page, limite: int) -> List[TarjetaReceta]:
         """Extrae la lista de recetas de la página de búsqueda."""
-        recetas = []
-        selectores = ['article a', '.entry-title a', 'a[href*="/receta"]']
-        
-        for selector in selectores:
-            try:
-                elementos = await page.query_selector_all(selector)
-                for elemento in elementos[:limite]:
-                    try:
-                        href = await elemento.get_attribute("href")
-                        if not href:
-                            continue
-                        titulo = (await elemento.inner_text()).strip() if elemento else ""
-                        if href and "/receta" in href.lower():
-                            recetas.append({"url": href, "titulo": titulo, "imagen_preview": ""})
-                        if len(recetas) >= limite:
-                            break
-                    except Exception:
-                        continue
-                if recetas:
-                    break
-            except Exception:
-                continue
-        return recetas[:limite]
+        return await self._extraer_tarjetas(
+            page, self.SELECTORES_TARJETA, limite, filtro_href="/receta"
+        )
     
     async def _extraer_receta(self, page, url: str) -> RecetaScraped:
         """
@@ -73,77 +121,23 @@ class PaulinaCocinaScraper(BaseScraper):
         # Esperar a que el contenido dinámico cargue
         await self._esperar_contenido_cargado(page)
         
-        # Selectores específicos de Paulina Cocina para ingredientes
-        selectores_ingredientes = [
-            '.wprm-recipe-ingredient',
-            '.recipe-ingredients li',
-            '[class*="ingredientes"] li',
-            '.ingredients li'
-        ]
-        
-        # Selectores específicos de Paulina Cocina para pasos
-        selectores_pasos = [
-            '.wprm-recipe-instruction-text',
-            '.wprm-recipe-instruction',
-            '.recipe-instructions li',
-            '[class*="preparacion"] li',
-            '.instructions li'
-        ]
-        
-        # Esperar al menos uno de los selectores de ingredientes
-        selector_ing = await self._esperar_cualquier_selector(
-            page, selectores_ingredientes, timeout=15000
+        # Esperar ingredientes y pasos en paralelo (peor caso 15s en lugar de 30s)
+        selector_ing, selector_pasos = await asyncio.gather(
+            self._esperar_cualquier_selector(
+                page, self.SELECTORES_ESPERA_INGREDIENTES, timeout=15000
+            ),
+            self._esperar_cualquier_selector(
+                page, self.SELECTORES_ESPERA_PASOS, timeout=15000
+            )
         )
         if not selector_ing:
             self._log("⚠️ No se encontraron selectores de ingredientes")
-        
-        # Esperar al menos uno de los selectores de pasos
-        selector_pasos = await self._esperar_cualquier_selector(
-            page, selectores_pasos, timeout=15000
-        )
         if not selector_pasos:
             self._log("⚠️ No se encontraron selectores de pasos")
         
-        # Título
-        titulo = await self._extraer_texto_seguro(
-            page, 
-            'h1.entry-title, h1.post-title, h1'
-        )
-        
-        # Descripción
-        descripcion = await self._extraer_texto_seguro(
-            page,
-            '.entry-content > p:first-of-type, .recipe-summary'
-        )
-        
-        # Imagen
-        imagen_url = await self._extraer_atributo_seguro(
-            page,
-            '.wp-post-image, .entry-content img, article img',
-            'src'
-        )
-        
-        # Ingredientes
-        ingredientes = await self._extraer_ingredientes(page)
-        
-        # Pasos
-        pasos = await self._extraer_pasos(page)
-        
-        # Metadatos
-        tiempo_preparacion = await self._extraer_texto_seguro(
-            page,
-            '.wprm-recipe-prep-time-container, [class*="prep-time"]'
-        )
-        
-        tiempo_coccion = await self._extraer_texto_seguro(
-            page,
-            '.wprm-recipe-cook-time-container, [class*="cook-time"]'
-        )
-        
-        porciones = await self._extraer_texto_seguro(
-            page,
-            '.wprm-recipe-servings-container, [class*="servings"]'
-        )
+        # Todos los campos en una sola pasada por el DOM
+        datos = await self._extraer_campos(page, self.CAMPOS)
+        titulo = datos["titulo"]
         
         self._log(f"✅ Receta extraída: {titulo}")
         
@@ -151,43 +145,11 @@ class PaulinaCocinaScraper(BaseScraper):
             titulo=titulo or "Sin título",
             url_origen=url,
             sitio_origen=self.nombre_sitio,
-            descripcion=descripcion,
-            imagen_url=imagen_url,
-            ingredientes=ingredientes,
-            pasos=pasos,
-            tiempo_preparacion=tiempo_preparacion,
-            tiempo_coccion=tiempo_coccion,
-            porciones=porciones
+            descripcion=datos["descripcion"],
+            imagen_url=datos["imagen_url"],
+            ingredientes=datos["ingredientes"],
+            pasos=datos["pasos"],
+            tiempo_preparacion=datos["tiempo_preparacion"],
+            tiempo_coccion=datos["tiempo_coccion"],
+            porciones=datos["porciones"]
         )
-    
-    async def _extraer_ingredientes(self, page) -> List[str]:
-        """Extrae la lista de ingredientes."""
-        selectores = [
-            '.wprm-recipe-ingredient',
-            '.recipe-ingredients li',
-            '[class*="ingredientes"] li',
-            '.ingredients li'
-        ]
-        
-        for selector in selectores:
-            ingredientes = await self._extraer_lista_textos(page, selector)
-            if ingredientes:
-                return ingredientes
-        
-        return []
-    
-    async def _extraer_pasos(self, page) -> List[str]:
-        """Extrae los pasos de preparación."""
-        selectores = [
-            '.wprm-recipe-instruction-text',
-            '.recipe-instructions li',
-            '[class*="preparacion"] li',
-            '.instructions li'
-        ]
-        
-        for selector in selectores:
-            pasos = await self._extraer_lista_textos(page, selector)
-            if pasos:
-                return pasos
-        
-        return []
@@ -6,7 +6,7 @@ Blog de cocina española con recetas tradicionales.
 
 from typing import List, Optional
 from urllib.parse import quote
-from app.scraper.base_scraper import BaseScraper, RecetaScraped
+from app.scraper.base_scraper import BaseScraper, RecetaScraped, TarjetaReceta
 
 
 class RechupeteScraper(BaseScraper):
@@ -19,6 +19,62 @@ class RechupeteScraper(BaseScraper):
     nombre_sitio = "Recetas de Rechupete"
     dominios_soportados = ["recetasderechupete.com"]
     
+    # Selectores de las tarjetas de recetas en el listado de búsqueda
+    SELECTORES_TARJETA = ('article a', '.entry-title a', 'a[href*="receta"]')
+    # Los resultados de búsqueda de WordPress vienen en el HTML del servidor
+    LISTADO_ESTATICO = True
+    
+    # WordPress: la receta viene en el HTML del servidor
+    HTML_ESTATICO = True
+    
+    # Especificación compilada de campos (ver JS_EXTRACTOR en base_scraper)
+    CAMPOS = {
+        "titulo": {
+            "tipo": "texto",
+            "selector": 'h1.entry-title, h1.post-title, h1',
+        },
+        "descripcion": {
+            "tipo": "texto",
+            "selector": '.entry-content > p:first-of-type, .recipe-summary',
+        },
+        "imagen_url": {
+            "tipo": "atributo",
+            "selectores": ['.entry-content img, .post-thumbnail img, article img'],
+            "atributos": ['src'],
+            "requiere_http": False,
+        },
+        "ingredientes": {
+            "tipo": "lista",
+            "selectores": [
+                '.wprm-recipe-ingredient',
+                '.recipe-ingredients li',
+                '[class*="ingredientes"] li',
+                '.ingredients li',
+            ],
+        },
+        "pasos": {
+            "tipo": "lista",
+            "selectores": [
+                '.wprm-recipe-instruction',
+                '.recipe-instructions li',
+                '[class*="elaboracion"] li',
+                '.instructions li',
+            ],
+        },
+        "tiempo_preparacion": {
+            "tipo": "texto",
+            "selector": '.recipe-prep-time, [class*="tiempo-prep"]',
+        },
+        "tiempo_coccion": {
+            "tipo": "texto",
+            "selector": '.recipe-cook-time, [class*="tiempo-coccion"]',
+        },
+        "porciones": {
+            "tipo": "texto",
+            "selector": '.recipe-servings, [class*="raciones"]',
+        },
+    }
+    
     def _construir_url_busqueda(
         self, 
         palabra_clave: Optional[str] = None,
@@ -30,31 +86,9 @@ class RechupeteScraper(BaseScraper):
             return f"https://www.recetasderechupete.com/?s={query}"
         return "https://www.recetasderechupete.com/recetas/"
     
-    async def _extraer_lista_recetas(self, page, limite: int) -> List[dict]:
+    async def _extraer_lista_recetas(self, page, limite: int) -> List[TarjetaReceta]:
         """Extrae la lista de recetas de la página de búsqueda."""
-        recetas = []
-        selectores = ['article a', '.entry-title a', 'a[href*="receta"]']
-        
-        for selector in selectores:
-            try:
-                elementos = await page.query_selector_all(selector)
-                for elemento in elementos[:limite]:
-                    try:
-                        href = await elemento.get_attribute("href")
-                        if not href:
-                            continue
-                        titulo = (await elemento.inner_text()).strip()
-                        if href:
-                            recetas.append({"url": href, "titulo": titulo, "imagen_preview": ""})
-                        if len(recetas) >= limite:
-                            break
-                    except Exception:
-                        continue
-                if recetas:
-                    break
-            except Exception:
-                continue
-        return recetas[:limite]
+        return await self._extraer_tarjetas(page, self.SELECTORES_TARJETA, limite)
     
     async def _extraer_receta(self, page, url: str) -> RecetaScraped:
         """
@@ -76,76 +110,23 @@ class RechupeteScraper(BaseScraper):
         # Hacer scroll para cargar contenido lazy
         await self._hacer_scroll_para_lazy_loading(page, scrolls=5, delay_ms=500)
         
-        # Selectores específicos de Rechupete para ingredientes
-        selectores_ingredientes = [
-            '.wprm-recipe-ingredient',
-            '.recipe-ingredients li',
-            '[class*="ingredientes"] li',
-            '.ingredients li'
-        ]
-        
-        # Selectores específicos de Rechupete para pasos
-        selectores_pasos = [
-            '.wprm-recipe-instruction',
-            '.recipe-instructions li',
-            '[class*="elaboracion"] li',
-            '.instructions li'
-        ]
-        
         # Esperar al menos uno de los selectores de ingredientes
         selector_ing = await self._esperar_cualquier_selector(
-            page, selectores_ingredientes, timeout=15000
+            page, self.CAMPOS["ingredientes"]["selectores"], timeout=15000
         )
         if not selector_ing:
             self._log("⚠️ No se encontraron selectores de ingredientes")
         
         # Esperar al menos uno de los selectores de pasos
         selector_pasos = await self._esperar_cualquier_selector(
-            page, selectores_pasos, timeout=15000
+            page, self.CAMPOS["pasos"]["selectores"], timeout=15000
         )
         if not selector_pasos:
             self._log("⚠️ No se encontraron selectores de pasos")
         
-        # Título
-        titulo = await self._extraer_texto_seguro(
-            page, 
-            'h1.entry-title, h1.post-title, h1'
-        )
-        
-        # Descripción
-        descripcion = await self._extraer_texto_seguro(
-            page,
-            '.entry-content > p:first-of-type, .recipe-summary'
-        )
-        
-        # Imagen
-        imagen_url = await self._extraer_atributo_seguro(
-            page,
-            '.entry-content img, .post-thumbnail img, article img',
-            'src'
-        )
-        
-        # Ingredientes
-        ingredientes = await self._extraer_ingredientes(page)
-        
-        # Pasos
-        pasos = await self._extraer_pasos(page)
-        
-        # Metadatos
-        tiempo_preparacion = await self._extraer_texto_seguro(
-            page,
-            '.recipe-prep-time, [class*="tiempo-prep"]'
-        )
-        
-        tiempo_coccion = await self._extraer_texto_seguro(
-            page,
-            '.recipe-cook-time, [class*="tiempo-coccion"]'
-        )
-        
-        porciones = await self._extraer_texto_seguro(
-            page,
-            '.recipe-servings, [class*="raciones"]'
-        )
+        # Todos los campos en una sola pasada por el DOM
+        datos = await self._extraer_campos(page, self.CAMPOS)
+        titulo = datos["titulo"]
         
         self._log(f"✅ Receta extraída: {titulo}")
         
@@ -153,43 +134,11 @@ class RechupeteScraper(BaseScraper):
             titulo=titulo or "Sin título",
             url_origen=url,
             sitio_origen=self.nombre_sitio,
-            descripcion=descripcion,
-            imagen_url=imagen_url,
-            ingredientes=ingredientes,
-            pasos=pasos,
-            tiempo_preparacion=tiempo_preparacion,
-            tiempo_coccion=tiempo_coccion,
-            porciones=porciones
+            descripcion=datos["descripcion"],
+            imagen_url=datos["imagen_url"],
+            ingredientes=datos["ingredientes"],
+            pasos=datos["pasos"],
+            tiempo_preparacion=datos["tiempo_preparacion"],
+            tiempo_coccion=datos["tiempo_coccion"],
+            porciones=datos["porciones"]
         )
-    
-    async def _extraer_ingredientes(self, page) -> List[str]:
-        """Extrae la lista de ingredientes."""
-        selectores = [
-            '.wprm-recipe-ingredient',
-            '.recipe-ingredients li',
-            '[class*="ingredientes"] li',
-            '.ingredients li'
-        ]
-        
-        for selector in selectores:
-            ingredientes = await self._extraer_lista_textos(page, selector)
-            if ingredientes:
-                return ingredientes
-        
-        return []
-    
-    async def _extraer_pasos(self, page) -> List[str]:
-        """Extrae los pasos de preparación."""
-        selectores = [
-            '.wprm-recipe-instruction',
-            '.recipe-instructions li',
-            '[class*="elaboracion"] li',
-            '.instructions li'
-        ]
-        
-        for selector in selectores:
-            pasos = await self._extraer_lista_textos(page, selector)
-            if pasos:
-                return pasos
-        
-        return []
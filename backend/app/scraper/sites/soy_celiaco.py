@@ -7,7 +7,23 @@ Blog especializado en recetas sin gluten/sin TACC.
 import re
 from typing import List, Optional, Tuple
 from urllib.parse import quote
-from app.scraper.base_scraper import BaseScraper, RecetaScraped
+from app.scraper.base_scraper import BaseScraper, RecetaScraped, TarjetaReceta
+
+
+# Patrones del párrafo de metadatos, compilados una sola vez
+PATRON_PORCIONES = re.compile(
+    r'(?:rinde\s+(?:para\s+)?(\d+)\s*(?:porciones?|pancitos?|unidades?)?|'
+    r'(\d+)\s*porciones?)',
+    re.IGNORECASE
+)
+PATRON_TIEMPO_PREPARACION = re.compile(
+    r'tiempo\s+de\s+preparaci[oó]n[:\s]+(\d+\s*(?:minutos?|min|horas?|h))',
+    re.IGNORECASE
+)
+PATRON_TIEMPO_COCCION = re.compile(
+    r'tiempo\s+de\s+cocci[oó]n[:\s]+(\d+\s*(?:minutos?|min|horas?|h)(?:\s*[^\n<]*)?)',
+    re.IGNORECASE
+)
 
 
 class SoyCeliacoScraper(BaseScraper):
@@ -26,8 +42,214 @@ class SoyCeliacoScraper(BaseScraper):
     nombre_sitio = "Soy Celíaco No Extraterrestre"
     dominios_soportados = ["soyceliaconoextraterrestre.com"]
     
+    # Selectores de las tarjetas de recetas en el listado de búsqueda
+    SELECTORES_TARJETA = ('article a', '.entry-title a', 'a[href*="receta"]')
+    # Los resultados de búsqueda de WordPress vienen en el HTML del servidor
+    LISTADO_ESTATICO = True
+    
+    # Especificación compilada de campos (ver JS_EXTRACTOR en base_scraper).
+    # Ingredientes y pasos son el respaldo cuando la estructura por
+    # encabezados no está: selectores clásicos de plugins de recetas.
+    CAMPOS = {
+        "titulo": {
+            "tipo": "texto",
+            "selector": 'h1.entry-title, h1.post-title, h1',
+        },
+        "descripcion": {
+            "tipo": "texto",
+            "selector": '.entry-content > p:first-of-type, .recipe-description',
+        },
+        # data-src primero: las imágenes usan lazy loading
+        "imagen_url": {
+            "tipo": "atributo",
+            "selectores": [
+                '.wp-block-image img',
+                'figure.wp-block-image img',
+                '.wp-post-image',
+                '.entry-content img',
+                '.post-thumbnail img',
+            ],
+            "atributos": ['data-src', 'src'],
+            "requiere_http": False,
+        },
+        "ingredientes": {
+            "tipo": "lista",
+            "selectores": [
+                '.wprm-recipe-ingredient',
+                '.recipe-ingredients li',
+                '[class*="ingredientes"] li',
+                '.entry-content ul li',
+            ],
+        },
+        "pasos": {
+            "tipo": "lista",
+            "selectores": [
+                '.wprm-recipe-instruction',
+                '.recipe-instructions li',
+                '[class*="preparacion"] li',
+                '.entry-content ol li',
+            ],
+        },
+    }
+    
+    # Ingredientes: el primer <p> después del <h2> "Ingredientes", dividido por <br>
+    JS_INGREDIENTES_POR_ENCABEZADO = r'''
+    () => {
+        const h2Elements = document.querySelectorAll('h2');
+        for (const h2 of h2Elements) {
+            if (h2.textContent.toLowerCase().includes('ingredientes')) {
+                // Buscar el siguiente elemento <p> hermano
+                let sibling = h2.nextElementSibling;
+                while (sibling) {
+                    if (sibling.tagName.toLowerCase() === 'p') {
+                        // Recorrer los nodos hijos cortando en cada <br>,
+                        // sin reserializar ni reparsear el HTML
+                        const items = [];
+                        let texto = '';
+                        for (const nodo of sibling.childNodes) {
+                            if (nodo.nodeType === 1 && nodo.tagName === 'BR') {
+                                const item = texto.trim();
+                                if (item) items.push(item);
+                                texto = '';
+                            } else {
+                                texto += nodo.textContent;
+                            }
+                        }
+                        const ultimo = texto.trim();
+                        if (ultimo) items.push(ultimo);
+                        if (items.length > 0) {
+                            return items;
+                        }
+                    }
+                    sibling = sibling.nextElementSibling;
+                }
+            }
+        }
+        return [];
+    }
+    '''
+    
+    # Pasos: cada <h4> con sus <p> siguientes, a partir del <h2> "paso a paso"
+    JS_PASOS_POR_ENCABEZADO = r'''
+    () => {
+        const h2Elements = document.querySelectorAll('h2');
+        let startH2 = null;
+        
+        // Buscar el h2 con "paso a paso"
+        for (const h2 of h2Elements) {
+            if (h2.textContent.toLowerCase().includes('paso a paso')) {
+                startH2 = h2;
+                break;
+            }
+        }
+        
+        if (!startH2) {
+            return [];
+        }
+        
+        // Contenido no relevante a filtrar (links internos, ads, redes)
+        const filtro = /publicidad|suscribite|seguinos|compartir|facebook|instagram|twitter|pinterest|youtube|te puede interesar/i;
+        
+        const pasos = [];
+        // Paso abierto: el <h4> actual y sus <p> consecutivos
+        let enPaso = false;
+        let titulo = '';
+        let parrafos = [];
+        
+        const cerrarPaso = () => {
+            if (enPaso && parrafos.length) {
+                const contenido = parrafos.join(' ');
+                pasos.push(titulo ? titulo + ': ' + contenido : contenido);
+            }
+            enPaso = false;
+            titulo = '';
+            parrafos = [];
+        };
+        
+        // Una sola pasada por los hermanos, hasta el próximo h2
+        for (let sibling = startH2.nextElementSibling; sibling; sibling = sibling.nextElementSibling) {
+            const tagName = sibling.tagName.toLowerCase();
+            
+            if (tagName === 'h2') {
+                break;
+            }
+            
+            if (tagName === 'h4') {
+                // Título de un nuevo paso
+                cerrarPaso();
+                const texto = sibling.textContent.trim();
+                enPaso = true;
+                titulo = filtro.test(texto) ? '' : texto;
+            } else if (tagName === 'p') {
+                const texto = sibling.textContent.trim();
+                if (!texto || filtro.test(texto)) {
+                    continue;
+                }
+                if (enPaso) {
+                    parrafos.push(texto);
+                } else if (texto.length > 20) {
+                    // Párrafo suelto (sin h4 previo)
+                    pasos.push(texto);
+                }
+            } else {
+                // Solo cuentan los párrafos consecutivos al h4
+                cerrarPaso();
+            }
+        }
+        cerrarPaso();
+        
+        return pasos;
+    }
+    '''
+    
+    # Párrafo con la información de tiempo/porciones (o el primero del contenido)
+    JS_PARRAFO_METADATOS = r'''
+    () => {
+        const paragraphs = document.querySelectorAll('.entry-content p');
+        for (const p of paragraphs) {
+            const texto = p.textContent.trim();
+            // Buscar párrafos que contengan información de tiempo/porciones
+            if (texto.toLowerCase().includes('rinde') ||
+                texto.toLowerCase().includes('tiempo') ||
+                texto.toLowerCase().includes('porciones') ||
+                texto.toLowerCase().includes('minutos')) {
+                return texto;
+            }
+        }
+        // Si no encontramos con criterios específicos, retornar el primero
+        const firstP = document.querySelector('.entry-content p');
+        return firstP ? firstP.textContent.trim() : '';
+    }
+    '''
+    
+    # Receta completa en una sola llamada: los campos compilados más los
+    # recorridos por encabezado, que tienen prioridad sobre el respaldo
+    JS_RECETA = r'''
+    (campos) => {
+        const sitio = window.__soyCeliaco;
+        const datos = window.__webscarper.extraer(campos);
+        const ingredientes = sitio.ingredientes();
+        if (ingredientes.length) datos.ingredientes = ingredientes;
+        const pasos = sitio.pasos();
+        if (pasos.length) datos.pasos = pasos;
+        datos.parrafo_metadatos = sitio.parrafoMetadatos();
+        return datos;
+    }
+    '''
+    
+    # Las funciones quedan instaladas en cada página del contexto: las
+    # llamadas por receta envían solo los argumentos, no el código
+    SCRIPTS_INICIO = (
+        "window.__soyCeliaco = {"
+        + "ingredientes: " + JS_INGREDIENTES_POR_ENCABEZADO + ","
+        + "pasos: " + JS_PASOS_POR_ENCABEZADO + ","
+        + "parrafoMetadatos: " + JS_PARRAFO_METADATOS + ","
+        + "receta: " + JS_RECETA
+        + "};",
+    )
+    
     def _construir_url_busqueda(
-        self, 
+        self,
         palabra_clave: Optional[str] = None,
         filtros: Optional[dict] = None
     ) -> str:
@@ -37,31 +259,9 @@ class SoyCeliacoScraper(BaseScraper):
             return f"https://www.soyceliaconoextraterrestre.com/?s={query}"
         return "https://www.soyceliaconoextraterrestre.com/recetas/"
     
-    async def _extraer_lista_recetas(self, page, limite: int) -> List[dict]:
+    async def _extraer_lista_recetas(self, page, limite: int) -> List[TarjetaReceta]:
         """Extrae la lista de recetas de la página de búsqueda."""
-        recetas = []
-        selectores = ['article a', '.entry-title a', 'a[href*="receta"]']
-        
-        for selector in selectores:
-            try:
-                elementos = await page.query_selector_all(selector)
-                for elemento in elementos[:limite]:
-                    try:
-                        href = await elemento.get_attribute("href")
-                        if not href:
-                            continue
-                        titulo = (await elemento.inner_text()).strip() if elemento else ""
-                        if href:
-                            recetas.append({"url": href, "titulo": titulo, "imagen_preview": ""})
-                        if len(recetas) >= limite:
-                            break
-                    except Exception:
-                        continue
-                if recetas:
-                    break
-            except Exception:
-                continue
-        return recetas[:limite]
+        return await self._extraer_tarjetas(page, self.SELECTORES_TARJETA, limite)
     
     async def _extraer_receta(self, page, url: str) -> RecetaScraped:
         """
@@ -70,288 +270,39 @@ class SoyCeliacoScraper(BaseScraper):
         Args:
             page: Página de Playwright con el contenido.
             url: URL original de la receta.
-            
+        
         Returns:
             RecetaScraped con los datos extraídos.
         """
-        # Título
-        titulo = await self._extraer_texto_seguro(
-            page, 
-            'h1.entry-title, h1.post-title, h1'
+        # Todos los campos, ingredientes y pasos por encabezado y el párrafo
+        # de metadatos en una sola pasada por el DOM
+        datos = await self._extraer_campos(
+            page, self.CAMPOS, '(campos) => window.__soyCeliaco.receta(campos)'
         )
-        
-        # Descripción
-        descripcion = await self._extraer_texto_seguro(
-            page,
-            '.entry-content > p:first-of-type, .recipe-description'
+        tiempo_preparacion, tiempo_coccion, porciones = self._parsear_metadatos(
+            datos.get("parrafo_metadatos", "")
         )
         
-        # Imagen (con soporte para lazy loading)
-        imagen_url = await self._extraer_imagen_con_lazy_loading(page)
-        
-        # Ingredientes (desde párrafo con <br>)
-        ingredientes = await self._extraer_ingredientes(page)
-        
-        # Pasos (desde secciones <h4> + <p>)
-        pasos = await self._extraer_pasos(page)
-        
-        # Metadatos (desde el primer párrafo)
-        tiempo_preparacion, tiempo_coccion, porciones = await self._extraer_metadatos(page)
-        
         return RecetaScraped(
-            titulo=titulo or "Sin título",
+            titulo=datos["titulo"] or "Sin título",
             url_origen=url,
             sitio_origen=self.nombre_sitio,
-            descripcion=descripcion,
-            imagen_url=imagen_url,
-            ingredientes=ingredientes,
-            pasos=pasos,
+            descripcion=datos["descripcion"],
+            imagen_url=datos["imagen_url"],
+            ingredientes=datos["ingredientes"],
+            pasos=datos["pasos"],
             tiempo_preparacion=tiempo_preparacion,
             tiempo_coccion=tiempo_coccion,
             porciones=porciones
         )
     
-    async def _extraer_imagen_con_lazy_loading(self, page) -> str:
+    def _parsear_metadatos(self, primer_parrafo: str) -> Tuple[str, str, str]:
         """
-        Extrae la URL de la imagen, soportando lazy loading.
-        
-        Busca primero en data-src (lazy loading), luego en src.
+        Obtiene tiempos y porciones del párrafo de metadatos.
         
         Args:
-            page: Página de Playwright.
-            
-        Returns:
-            URL de la imagen o string vacío.
-        """
-        selectores = [
-            '.wp-block-image img',
-            'figure.wp-block-image img',
-            '.wp-post-image',
-            '.entry-content img',
-            '.post-thumbnail img'
-        ]
+            primer_parrafo: Texto del párrafo (ver JS_PARRAFO_METADATOS).
         
-        for selector in selectores:
-            try:
-                elemento = await page.query_selector(selector)
-                if elemento:
-                    # Intentar data-src primero (lazy loading)
-                    data_src = await elemento.get_attribute('data-src')
-                    if data_src and data_src.strip():
-                        return data_src.strip()
-                    # Luego intentar src
-                    src = await elemento.get_attribute('src')
-                    if src and src.strip():
-                        return src.strip()
-            except Exception:
-                continue
-        
-        return ""
-    
-    async def _extraer_ingredientes(self, page) -> List[str]:
-        """
-        Extrae la lista de ingredientes.
-        
-        Busca un <h2> que contenga "Ingredientes" (case insensitive),
-        luego obtiene el siguiente elemento <p> hermano y divide
-        el contenido por <br> para obtener cada ingrediente.
-        
-        Args:
-            page: Página de Playwright.
-            
-        Returns:
-            Lista de ingredientes.
-        """
-        try:
-            # Buscar h2 que contenga "Ingredientes"
-            ingredientes = await page.evaluate('''() => {
-                const h2Elements = document.querySelectorAll('h2');
-                for (const h2 of h2Elements) {
-                    if (h2.textContent.toLowerCase().includes('ingredientes')) {
-                        // Buscar el siguiente elemento <p> hermano
-                        let sibling = h2.nextElementSibling;
-                        while (sibling) {
-                            if (sibling.tagName.toLowerCase() === 'p') {
-                                // Obtener el HTML interno y dividir por <br>
-                                const html = sibling.innerHTML;
-                                const items = html.split(/<br\\s*\\/?>/gi)
-                                    .map(item => {
-                                        // Crear elemento temporal para obtener texto
-                                        const temp = document.createElement('div');
-                                        temp.innerHTML = item;
-                                        return temp.textContent.trim();
-                                    })
-                                    .filter(item => item.length > 0);
-                                if (items.length > 0) {
-                                    return items;
-                                }
-                            }
-                            sibling = sibling.nextElementSibling;
-                        }
-                    }
-                }
-                return [];
-            }''')
-            
-            if ingredientes:
-                return ingredientes
-        except Exception:
-            pass
-        
-        # Fallback: intentar selectores tradicionales
-        selectores_fallback = [
-            '.wprm-recipe-ingredient',
-            '.recipe-ingredients li',
-            '[class*="ingredientes"] li',
-            '.entry-content ul li'
-        ]
-        
-        for selector in selectores_fallback:
-            ingredientes = await self._extraer_lista_textos(page, selector)
-            if ingredientes:
-                return ingredientes
-        
-        return []
-    
-    async def _extraer_pasos(self, page) -> List[str]:
-        """
-        Extrae los pasos de preparación.
-        
-        Busca un <h2> que contenga "paso a paso" (case insensitive),
-        luego extrae todos los <h4> y sus párrafos <p> siguientes
-        para formar cada paso combinando el título con el contenido.
-        
-        Args:
-            page: Página de Playwright.
-            
-        Returns:
-            Lista de pasos de preparación.
-        """
-        try:
-            pasos = await page.evaluate('''() => {
-                const h2Elements = document.querySelectorAll('h2');
-                let startH2 = null;
-                
-                // Buscar el h2 con "paso a paso"
-                for (const h2 of h2Elements) {
-                    if (h2.textContent.toLowerCase().includes('paso a paso')) {
-                        startH2 = h2;
-                        break;
-                    }
-                }
-                
-                if (!startH2) {
-                    return [];
-                }
-                
-                const pasos = [];
-                let sibling = startH2.nextElementSibling;
-                
-                // Contenido no relevante a filtrar
-                const filtrarContenido = (texto) => {
-                    const lower = texto.toLowerCase();
-                    // Filtrar links internos, ads, scripts
-                    if (lower.includes('publicidad') || 
-                        lower.includes('suscribite') ||
-                        lower.includes('seguinos') ||
-                        lower.includes('compartir') ||
-                        lower.includes('facebook') ||
-                        lower.includes('instagram') ||
-                        lower.includes('twitter') ||
-                        lower.includes('pinterest') ||
-                        lower.includes('youtube') ||
-                        lower.includes('también te puede interesar') ||
-                        lower.includes('te puede interesar')) {
-                        return true;
-                    }
-                    return false;
-                };
-                
-                while (sibling) {
-                    const tagName = sibling.tagName.toLowerCase();
-                    
-                    // Detenerse si encontramos otro h2 (nueva sección)
-                    if (tagName === 'h2') {
-                        break;
-                    }
-                    
-                    // Si es un h4, es el título de un paso
-                    if (tagName === 'h4') {
-                        const titulo = sibling.textContent.trim();
-                        let contenido = '';
-                        
-                        // Buscar el siguiente <p> para el contenido
-                        let nextSibling = sibling.nextElementSibling;
-                        while (nextSibling && nextSibling.tagName.toLowerCase() === 'p') {
-                            const texto = nextSibling.textContent.trim();
-                            if (texto && !filtrarContenido(texto)) {
-                                contenido += (contenido ? ' ' : '') + texto;
-                            }
-                            nextSibling = nextSibling.nextElementSibling;
-                            // Solo tomar párrafos consecutivos
-                            if (nextSibling && nextSibling.tagName.toLowerCase() !== 'p') {
-                                break;
-                            }
-                        }
-                        
-                        // Combinar título y contenido
-                        if (titulo && contenido && !filtrarContenido(titulo)) {
-                            pasos.push(titulo + ': ' + contenido);
-                        } else if (contenido && !filtrarContenido(contenido)) {
-                            pasos.push(contenido);
-                        }
-                    }
-                    // Si es un párrafo suelto (sin h4 previo), agregarlo directamente
-                    else if (tagName === 'p') {
-                        const texto = sibling.textContent.trim();
-                        // Solo agregar si es contenido relevante
-                        if (texto && texto.length > 20 && !filtrarContenido(texto)) {
-                            // Verificar que no sea un párrafo que ya procesamos con un h4
-                            const prevSibling = sibling.previousElementSibling;
-                            if (!prevSibling || prevSibling.tagName.toLowerCase() !== 'h4') {
-                                pasos.push(texto);
-                            }
-                        }
-                    }
-                    
-                    sibling = sibling.nextElementSibling;
-                }
-                
-                return pasos;
-            }''')
-            
-            if pasos:
-                return pasos
-        except Exception:
-            pass
-        
-        # Fallback: intentar selectores tradicionales
-        selectores_fallback = [
-            '.wprm-recipe-instruction',
-            '.recipe-instructions li',
-            '[class*="preparacion"] li',
-            '.entry-content ol li'
-        ]
-        
-        for selector in selectores_fallback:
-            pasos = await self._extraer_lista_textos(page, selector)
-            if pasos:
-                return pasos
-        
-        return []
-    
-    async def _extraer_metadatos(self, page) -> Tuple[str, str, str]:
-        """
-        Extrae metadatos de tiempo y porciones.
-        
-        Busca en el primer párrafo de la página patrones como:
-        - "Rinde para X" o "X porciones"
-        - "Tiempo de preparación: X"
-        - "Tiempo de cocción: X"
-        
-        Args:
-            page: Página de Playwright.
-            
         Returns:
             Tupla (tiempo_preparacion, tiempo_coccion, porciones).
         """
@@ -359,55 +310,21 @@ class SoyCeliacoScraper(BaseScraper):
         tiempo_coccion = ""
         porciones = ""
         
-        try:
-            # Obtener el primer párrafo del contenido
-            primer_parrafo = await page.evaluate('''() => {
-                const paragraphs = document.querySelectorAll('.entry-content p');
-                for (const p of paragraphs) {
-                    const texto = p.textContent.trim();
-                    // Buscar párrafos que contengan información de tiempo/porciones
-                    if (texto.toLowerCase().includes('rinde') || 
-                        texto.toLowerCase().includes('tiempo') ||
-                        texto.toLowerCase().includes('porciones') ||
-                        texto.toLowerCase().includes('minutos')) {
-                        return texto;
-                    }
-                }
-                // Si no encontramos con criterios específicos, retornar el primero
-                const firstP = document.querySelector('.entry-content p');
-                return firstP ? firstP.textContent.trim() : '';
-            }''')
+        if primer_parrafo:
+            # Extraer porciones
+            match_porciones = PATRON_PORCIONES.search(primer_parrafo)
+            if match_porciones:
+                num = match_porciones.group(1) or match_porciones.group(2)
+                porciones = f"{num} porciones"
+            
+            # Extraer tiempo de preparación
+            match_prep = PATRON_TIEMPO_PREPARACION.search(primer_parrafo)
+            if match_prep:
+                tiempo_preparacion = match_prep.group(1)
             
-            if primer_parrafo:
-                # Extraer porciones
-                patron_porciones = re.compile(
-                    r'(?:rinde\s+(?:para\s+)?(\d+)\s*(?:porciones?|pancitos?|unidades?)?|'
-                    r'(\d+)\s*porciones?)',
-                    re.IGNORECASE
-                )
-                match_porciones = patron_porciones.search(primer_parrafo)
-                if match_porciones:
-                    num = match_porciones.group(1) or match_porciones.group(2)
-                    porciones = f"{num} porciones"
-                
-                # Extraer tiempo de preparación
-                patron_prep = re.compile(
-                    r'tiempo\s+de\s+preparaci[oó]n[:\s]+(\d+\s*(?:minutos?|min|horas?|h))',
-                    re.IGNORECASE
-                )
-                match_prep = patron_prep.search(primer_parrafo)
-                if match_prep:
-                    tiempo_preparacion = match_prep.group(1)
-                
-                # Extraer tiempo de cocción
-                patron_coccion = re.compile(
-                    r'tiempo\s+de\s+cocci[oó]n[:\s]+(\d+\s*(?:minutos?|min|horas?|h)(?:\s*[^\n<]*)?)',
-                    re.IGNORECASE
-                )
-                match_coccion = patron_coccion.search(primer_parrafo)
-                if match_coccion:
-                    tiempo_coccion = match_coccion.group(1).strip()
-        except Exception:
-            pass
+            # Extraer tiempo de cocción
+            match_coccion = PATRON_TIEMPO_COCCION.search(primer_parrafo)
+            if match_coccion:
+                tiempo_coccion = match_coccion.group(1).strip()
         
         return tiempo_preparacion, tiempo_coccion, porciones
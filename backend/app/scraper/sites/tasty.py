@@ -7,7 +7,7 @@ NOTA: Tasty está principalmente en inglés, pero intentamos filtrar contenido e
 
 from typing import List, Optional
 from urllib.parse import quote
-from app.scraper.base_scraper import BaseScraper, RecetaScraped
+from app.scraper.base_scraper import BaseScraper, RecetaScraped, TarjetaReceta
 
 
 class TastyScraper(BaseScraper):
@@ -22,6 +22,77 @@ class TastyScraper(BaseScraper):
     nombre_sitio = "Tasty"
     dominios_soportados = ["tasty.co"]
     
+    # Aunque el sitio es una SPA, el HTML del servidor ya trae la receta
+    # (render del servidor y JSON-LD): el navegador queda de respaldo
+    HTML_ESTATICO = True
+    JSONLD_ESTATICO = True
+    
+    # Selectores de las tarjetas de recetas en el listado de búsqueda
+    SELECTORES_TARJETA = ('a[href*="/recipe/"]', '.feed-item a')
+    SELECTOR_TITULO_TARJETA = 'h3, .feed-item__title'
+    
+    # Selectores cuya aparición indica que ingredientes y pasos ya cargaron
+    SELECTORES_ESPERA_INGREDIENTES = (
+        '[data-testid="ingredient"]',
+        '[class*="ingredient-list"] li',
+        '.ingredient-list li',
+        '[class*="ingredients"] li',
+        '.ingredients li'
+    )
+    SELECTORES_ESPERA_PASOS = (
+        '[data-testid="instruction"]',
+        '[class*="preparation-list"] li',
+        '.preparation-list li',
+        '[class*="instructions"] li',
+        '.instructions li'
+    )
+    
+    # Especificación compilada de campos (ver JS_EXTRACTOR en base_scraper).
+    # Las listas son cascadas: el primer selector con resultados gana
+    CAMPOS = {
+        "titulo": {
+            "tipo": "texto",
+            "selector": 'h1[class*="recipe-name"], h1.recipe-title, h1',
+        },
+        "descripcion": {
+            "tipo": "texto",
+            "selector": '[class*="recipe-description"], .recipe-description',
+        },
+        "imagen_url": {
+            "tipo": "atributo",
+            "selectores": ['.recipe-photo img, picture img, [class*="recipe-image"] img'],
+            "atributos": ['src'],
+            "requiere_http": False,
+        },
+        # Metadatos - Tasty usa formato específico
+        "porciones": {
+            "tipo": "texto",
+            "selector": '[class*="servings"], .servings-display',
+        },
+        "tiempo_coccion": {
+            "tipo": "texto",
+            "selector": '[class*="cook-time"], .total-time',
+        },
+        "ingredientes": {
+            "tipo": "lista",
+            "selectores": [
+                '[class*="ingredient-list"] li',
+                '.ingredient-list li',
+                '[class*="ingredients"] li',
+                '.ingredients li',
+            ],
+        },
+        "pasos": {
+            "tipo": "lista",
+            "selectores": [
+                '[class*="preparation-list"] li',
+                '.preparation-list li',
+                '[class*="instructions"] li',
+                '.instructions li',
+            ],
+        },
+    }
+    
     def _construir_url_busqueda(
         self, 
         palabra_clave: Optional[str] = None,
@@ -39,36 +110,16 @@ class TastyScraper(BaseScraper):
         # Buscar recetas con términos en español como fallback
         return "https://tasty.co/search?q=receta"
     
-    async def _extraer_lista_recetas(self, page, limite: int) -> List[dict]:
+    async def _extraer_lista_recetas(self, page, limite: int) -> List[TarjetaReceta]:
         """Extrae la lista de recetas de la página de búsqueda."""
-        recetas = []
-        selectores = ['a[href*="/recipe/"]', '.feed-item a']
-        
-        for selector in selectores:
-            try:
-                elementos = await page.query_selector_all(selector)
-                for elemento in elementos[:limite]:
-                    try:
-                        href = await elemento.get_attribute("href")
-                        if not href or "/recipe/" not in href:
-                            continue
-                        if href.startswith("/"):
-                            href = f"https://tasty.co{href}"
-                        titulo_elem = await elemento.query_selector('h3, .feed-item__title')
-                        titulo = ""
-                        if titulo_elem:
-                            titulo = (await titulo_elem.inner_text()).strip()
-                        if href:
-                            recetas.append({"url": href, "titulo": titulo, "imagen_preview": ""})
-                        if len(recetas) >= limite:
-                            break
-                    except Exception:
-                        continue
-                if recetas:
-                    break
-            except Exception:
-                continue
-        return recetas[:limite]
+        return await self._extraer_tarjetas(
+            page,
+            self.SELECTORES_TARJETA,
+            limite,
+            filtro_href="/recipe/",
+            url_base="https://tasty.co",
+            selector_titulo=self.SELECTOR_TITULO_TARJETA
+        )
     
     async def _extraer_receta(self, page, url: str) -> RecetaScraped:
         """
@@ -84,122 +135,65 @@ class TastyScraper(BaseScraper):
         """
         self._log(f"Iniciando extracción de: {url}")
         
+        # El JSON-LD llega con el HTML: si está completo no hace falta
+        # esperar a que la SPA termine de renderizar
+        jsonld = await self._extraer_jsonld_receta(page) or {}
+        if self._datos_completos(jsonld):
+            self._log(f"✅ Receta extraída desde JSON-LD: {jsonld['titulo']}")
+            return self._crear_receta(jsonld, url)
+        
         # Tasty es una SPA pesada, esperar networkidle
         await self._esperar_contenido_cargado(page, timeout=45000)
         
         # Hacer scroll para activar lazy loading de imágenes y contenido
         await self._hacer_scroll_para_lazy_loading(page, scrolls=5, delay_ms=500)
         
-        # Selectores específicos de Tasty para ingredientes
-        selectores_ingredientes = [
-            '[data-testid="ingredient"]',
-            '[class*="ingredient-list"] li',
-            '.ingredient-list li',
-            '[class*="ingredients"] li',
-            '.ingredients li'
-        ]
-        
-        # Selectores específicos de Tasty para pasos
-        selectores_pasos = [
-            '[data-testid="instruction"]',
-            '[class*="preparation-list"] li',
-            '.preparation-list li',
-            '[class*="instructions"] li',
-            '.instructions li'
-        ]
-        
         # Esperar al menos uno de los selectores de ingredientes
         selector_ing = await self._esperar_cualquier_selector(
-            page, selectores_ingredientes, timeout=20000
+            page, self.SELECTORES_ESPERA_INGREDIENTES, timeout=20000
         )
         if not selector_ing:
             self._log("⚠️ No se encontraron selectores de ingredientes")
         
         # Esperar al menos uno de los selectores de pasos
         selector_pasos = await self._esperar_cualquier_selector(
-            page, selectores_pasos, timeout=20000
+            page, self.SELECTORES_ESPERA_PASOS, timeout=20000
         )
         if not selector_pasos:
             self._log("⚠️ No se encontraron selectores de pasos")
         
-        # Título
-        titulo = await self._extraer_texto_seguro(
-            page, 
-            'h1[class*="recipe-name"], h1.recipe-title, h1'
-        )
-        
-        # Descripción
-        descripcion = await self._extraer_texto_seguro(
-            page,
-            '[class*="recipe-description"], .recipe-description'
-        )
-        
-        # Imagen
-        imagen_url = await self._extraer_atributo_seguro(
-            page,
-            '.recipe-photo img, picture img, [class*="recipe-image"] img',
-            'src'
-        )
-        
-        # Ingredientes
-        ingredientes = await self._extraer_ingredientes(page)
-        
-        # Pasos
-        pasos = await self._extraer_pasos(page)
+        # Todos los campos en una sola pasada por el DOM; los huecos se
+        # completan con lo que haya traído el JSON-LD
+        datos = await self._extraer_campos(page, self.CAMPOS)
+        datos = {
+            nombre: valor or jsonld.get(nombre, valor)
+            for nombre, valor in datos.items()
+        }
         
-        # Metadatos - Tasty usa formato específico
-        porciones = await self._extraer_texto_seguro(
-            page,
-            '[class*="servings"], .servings-display'
-        )
-        
-        tiempo_coccion = await self._extraer_texto_seguro(
-            page,
-            '[class*="cook-time"], .total-time'
-        )
+        self._log(f"✅ Receta extraída: {datos['titulo']}")
         
-        self._log(f"✅ Receta extraída: {titulo}")
+        return self._crear_receta(datos, url)
+    
+    def _crear_receta(self, datos: dict, url: str) -> RecetaScraped:
+        """
+        Arma la receta a partir de los campos extraídos.
         
+        Args:
+            datos: Campos de CAMPOS o del JSON-LD.
+            url: URL original de la receta.
+            
+        Returns:
+            RecetaScraped con los datos extraídos.
+        """
         return RecetaScraped(
-            titulo=titulo or "Sin título",
+            titulo=datos["titulo"] or "Sin título",
             url_origen=url,
             sitio_origen=self.nombre_sitio,
-            descripcion=descripcion,
-            imagen_url=imagen_url,
-            ingredientes=ingredientes,
-            pasos=pasos,
-            tiempo_coccion=tiempo_coccion,
-            porciones=porciones
+            descripcion=datos["descripcion"],
+            imagen_url=datos["imagen_url"],
+            ingredientes=datos["ingredientes"],
+            pasos=datos["pasos"],
+            tiempo_preparacion=datos.get("tiempo_preparacion", ""),
+            tiempo_coccion=datos["tiempo_coccion"],
+            porciones=datos["porciones"]
         )
-    
-    async def _extraer_ingredientes(self, page) -> List[str]:
-        """Extrae la lista de ingredientes."""
-        selectores = [
-            '[class*="ingredient-list"] li',
-            '.ingredient-list li',
-            '[class*="ingredients"] li',
-            '.ingredients li'
-        ]
-        
-        for selector in selectores:
-            ingredientes = await self._extraer_lista_textos(page, selector)
-            if ingredientes:
-                return ingredientes
-        
-        return []
-    
-    async def _extraer_pasos(self, page) -> List[str]:
-        """Extrae los pasos de preparación."""
-        selectores = [
-            '[class*="preparation-list"] li',
-            '.preparation-list li',
-            '[class*="instructions"] li',
-            '.instructions li'
-        ]
-        
-        for selector in selectores:
-            pasos = await self._extraer_lista_textos(page, selector)
-            if pasos:
-                return pasos
-        
-        return []
@@ -6,13 +6,21 @@ con soporte para búsqueda paralela o secuencial según el límite.
 """
 
 import asyncio
+import threading
 import uuid
 import time
 import logging
-from typing import Optional, List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Set, Callable
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.config import SCRAPER_HEADLESS
+from app.database import SessionLocal
 from app.models import Receta
+from app.scraper.base_scraper import normalizar_url
 from app.scraper.scraper_factory import ScraperFactory
 
 
@@ -33,8 +41,25 @@ class RecetaDescartadaError(Exception):
         self.tipo = tipo
 
 
-# Almacén en memoria para el estado de las búsquedas activas
+# INSERT con ON CONFLICT por dialecto: url_origen es única y la base de
+# datos descarta las repetidas sin abortar el lote
+_INSERTS_SIN_CONFLICTO = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+# Almacén en memoria para el estado de las búsquedas activas. Lo escriben
+# la tarea de la búsqueda (event loop) y los endpoints síncronos (threadpool),
+# así que altas, bajas y consultas pasan por el lock
 _busquedas_activas: Dict[str, dict] = {}
+_bloqueo_busquedas = threading.Lock()
+
+# URLs (normalizadas) descartadas por idioma en búsquedas anteriores, con
+# el momento del descarte (reloj monotónico). Las guardadas ya quedan en la
+# base de datos; estas no, y sin este registro se volverían a navegar en cada
+# búsqueda. Las descartadas por vacías no se recuerdan: suelen ser una carga
+# fallida o un bloqueo pasajero, y la próxima búsqueda las vuelve a intentar.
+_urls_descartadas: Dict[str, float] = {}
 
 
 class BusquedaService:
@@ -49,17 +74,49 @@ class BusquedaService:
     UMBRAL_PARALELO = 50
     # Máximo de sitios a buscar en paralelo
     MAX_PARALELO = 3
+    # Máximo de recetas de un mismo sitio scrapeándose a la vez (el rate
+    # limit del scraper sigue espaciando el inicio de cada una)
+    MAX_RECETAS_PARALELO = 3
+    # Recetas nuevas de un sitio por INSERT (además del lote al terminar
+    # el sitio): un executemany y un commit por lote en lugar de por receta
+    LOTE_GUARDADO = 25
     # Delay entre sitios en búsqueda secuencial (segundos)
     DELAY_SECUENCIAL = 3.0
+    # Máximo de URLs descartadas recordadas (se olvidan las más antiguas)
+    MAX_URLS_DESCARTADAS = 10000
+    # Segundos que se recuerda una URL descartada por idioma
+    TTL_URLS_DESCARTADAS = 24 * 3600
+    # URLs por consulta al buscar duplicados (SQLite limita los parámetros)
+    LOTE_CONSULTA_URLS = 500
+    # Segundos que se conserva el estado de una búsqueda ya terminada
+    TTL_BUSQUEDAS = 3600
+    # Máximo de búsquedas en memoria (se olvidan las terminadas más antiguas)
+    MAX_BUSQUEDAS = 1000
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, fabrica_sesiones: Callable[[], Session] = SessionLocal):
         """
         Inicializa el servicio con una sesión de base de datos.
         
         Args:
-            db: Sesión de SQLAlchemy.
+            db: Sesión de SQLAlchemy de la petición.
+            fabrica_sesiones: Crea la sesión propia de la búsqueda en segundo
+                              plano (ver _sesion_busqueda).
         """
         self.db = db
+        self._fabrica_sesiones = fabrica_sesiones
+        # Sesión de la búsqueda en segundo plano: una Session no es segura
+        # entre hilos, así que no se usa la de la petición sino una propia,
+        # creada y usada solo en el hilo de la base de datos
+        self._sesion_db: Optional[Session] = None
+        # Chromium compartido por todos los sitios de una búsqueda: se lanza
+        # con el primer sitio y cada sitio abre solo su contexto
+        self._playwright = None
+        self._navegador = None
+        self._bloqueo_navegador = asyncio.Lock()
+        # Hilo propio para las operaciones de base de datos: la sesión es
+        # síncrona y no debe bloquear el event loop que atiende a Playwright.
+        # Un solo hilo, para que la sesión nunca se use desde dos a la vez
+        self._ejecutor_db: Optional[ThreadPoolExecutor] = None
     
     def iniciar_busqueda_automatica(
         self,
@@ -86,15 +143,16 @@ class BusquedaService:
         busqueda_id = str(uuid.uuid4())
         
         # Obtener lista de sitios a buscar
-        sitios_disponibles = ScraperFactory.obtener_sitios_soportados()
+        sitios_disponibles = ScraperFactory.obtener_nombres_sitios()
         
         if "todos" in sitios:
-            sitios_a_buscar = [s["nombre"] for s in sitios_disponibles]
+            sitios_a_buscar = sitios_disponibles
         else:
-            sitios_a_buscar = [s for s in sitios if s in [sd["nombre"] for sd in sitios_disponibles]]
+            nombres_validos = set(sitios_disponibles)
+            sitios_a_buscar = [s for s in sitios if s in nombres_validos]
         
         if not sitios_a_buscar:
-            sitios_a_buscar = [s["nombre"] for s in sitios_disponibles]
+            sitios_a_buscar = sitios_disponibles
         
         # Calcular límite por sitio
         limite_por_sitio = max(1, limite // len(sitios_a_buscar))
@@ -103,7 +161,7 @@ class BusquedaService:
         tipo_busqueda = "paralelo" if limite <= self.UMBRAL_PARALELO else "secuencial"
         
         # Inicializar estado de la búsqueda
-        _busquedas_activas[busqueda_id] = {
+        estado = {
             "busqueda_id": busqueda_id,
             "estado": "en_progreso",
             "tipo_busqueda": tipo_busqueda,
@@ -130,14 +188,57 @@ class BusquedaService:
             "total_duplicadas": 0,
             "total_descartadas_vacias": 0,
             "total_descartadas_idioma": 0,
+            # Sitios terminados (completados o con error), para el progreso
+            "sitios_terminados": 0,
             "errores": [],
-            "tiempo_inicio": time.time(),
+            # Reloj monotónico: los ajustes de la hora del sistema no alteran
+            # la duración ni el vencimiento (solo se usa para restar)
+            "tiempo_inicio": time.monotonic(),
             "tiempo_transcurrido": 0,
+            "tiempo_fin": None,
             "cancelado": False
         }
         
+        with _bloqueo_busquedas:
+            self._purgar_busquedas()
+            _busquedas_activas[busqueda_id] = estado
+        
         return busqueda_id
     
+    def _purgar_busquedas(self):
+        """
+        Olvida las búsquedas terminadas hace más de TTL_BUSQUEDAS segundos.
+        
+        Si aun así quedan más de MAX_BUSQUEDAS, descarta también las
+        terminadas más antiguas. Las que siguen en curso no se tocan.
+        Debe llamarse con _bloqueo_busquedas tomado.
+        """
+        vencimiento = time.monotonic() - self.TTL_BUSQUEDAS
+        terminadas = [
+            busqueda_id for busqueda_id, estado in _busquedas_activas.items()
+            if estado.get("tiempo_fin") is not None
+        ]
+        # Los dict conservan el orden de inserción: primero las más antiguas
+        for busqueda_id in terminadas:
+            if (
+                _busquedas_activas[busqueda_id]["tiempo_fin"] < vencimiento
+                or len(_busquedas_activas) >= self.MAX_BUSQUEDAS
+            ):
+                del _busquedas_activas[busqueda_id]
+    
+    def _obtener_estado(self, busqueda_id: str) -> Optional[dict]:
+        """
+        Obtiene el estado de una búsqueda del almacén en memoria.
+        
+        Args:
+            busqueda_id: ID de la búsqueda.
+            
+        Returns:
+            Diccionario de estado o None si no existe.
+        """
+        with _bloqueo_busquedas:
+            return _busquedas_activas.get(busqueda_id)
+    
     def obtener_tipo_busqueda(self, busqueda_id: str) -> str:
         """
         Obtiene el tipo de búsqueda (paralelo o secuencial).
@@ -148,8 +249,9 @@ class BusquedaService:
         Returns:
             'paralelo' o 'secuencial'.
         """
-        if busqueda_id in _busquedas_activas:
-            return _busquedas_activas[busqueda_id].get("tipo_busqueda", "secuencial")
+        estado = self._obtener_estado(busqueda_id)
+        if estado is not None:
+            return estado.get("tipo_busqueda", "secuencial")
         return "secuencial"
     
     async def ejecutar_busqueda(self, busqueda_id: str):
@@ -162,11 +264,10 @@ class BusquedaService:
         Args:
             busqueda_id: ID de la búsqueda a ejecutar.
         """
-        if busqueda_id not in _busquedas_activas:
+        estado = self._obtener_estado(busqueda_id)
+        if estado is None:
             return
         
-        estado = _busquedas_activas[busqueda_id]
-        
         try:
             if estado["tipo_busqueda"] == "paralelo":
                 await self._busqueda_paralela(busqueda_id)
@@ -181,39 +282,114 @@ class BusquedaService:
             estado["estado"] = "error"
             estado["errores"].append(f"Error general: {str(e)}")
         finally:
-            estado["tiempo_transcurrido"] = time.time() - estado["tiempo_inicio"]
+            await self._cerrar_navegador()
+            if self._ejecutor_db is not None:
+                try:
+                    await self._en_db(self._cerrar_sesion_busqueda)
+                finally:
+                    self._ejecutor_db.shutdown(wait=False)
+                    self._ejecutor_db = None
+            estado["tiempo_fin"] = time.monotonic()
+            estado["tiempo_transcurrido"] = estado["tiempo_fin"] - estado["tiempo_inicio"]
+    
+    async def _obtener_navegador(self):
+        """
+        Devuelve el navegador compartido de la búsqueda, lanzándolo la primera vez.
+        
+        Returns:
+            Navegador de Playwright.
+        """
+        async with self._bloqueo_navegador:
+            if self._navegador is None:
+                from playwright.async_api import async_playwright
+                
+                self._playwright = await async_playwright().start()
+                try:
+                    self._navegador = await self._playwright.chromium.launch(
+                        headless=SCRAPER_HEADLESS
+                    )
+                except Exception:
+                    await self._playwright.stop()
+                    self._playwright = None
+                    raise
+            return self._navegador
+    
+    async def _en_db(self, funcion, *args):
+        """
+        Ejecuta una operación de base de datos fuera del event loop.
+        
+        Args:
+            funcion: Método síncrono que usa la sesión de la búsqueda.
+            *args: Argumentos para la función.
+            
+        Returns:
+            El resultado de la función.
+        """
+        if self._ejecutor_db is None:
+            self._ejecutor_db = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="busqueda-db"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._ejecutor_db, funcion, *args)
+    
+    def _sesion_busqueda(self) -> Session:
+        """
+        Devuelve la sesión propia de la búsqueda, creándola la primera vez.
+        
+        Se llama desde el hilo de la base de datos (ver _en_db), así que la
+        sesión se crea y se usa siempre en ese hilo.
+        
+        Returns:
+            Sesión de SQLAlchemy.
+        """
+        if self._sesion_db is None:
+            self._sesion_db = self._fabrica_sesiones()
+        return self._sesion_db
+    
+    def _cerrar_sesion_busqueda(self):
+        """Cierra la sesión propia de la búsqueda, si se llegó a abrir."""
+        sesion, self._sesion_db = self._sesion_db, None
+        if sesion is not None:
+            sesion.close()
+    
+    async def _cerrar_navegador(self):
+        """Cierra el navegador compartido, si se llegó a lanzar."""
+        navegador, self._navegador = self._navegador, None
+        playwright, self._playwright = self._playwright, None
+        try:
+            if navegador is not None:
+                await navegador.close()
+        finally:
+            if playwright is not None:
+                await playwright.stop()
     
     async def _busqueda_paralela(self, busqueda_id: str):
         """
         Ejecuta búsqueda en paralelo (para límites bajos).
         
         Busca en varios sitios simultáneamente, con un máximo de
-        MAX_PARALELO sitios a la vez para evitar sobrecarga.
+        MAX_PARALELO sitios a la vez para evitar sobrecarga. La ventana
+        es móvil: apenas termina un sitio empieza el siguiente, sin
+        esperar al más lento de un lote.
         
         Args:
             busqueda_id: ID de la búsqueda.
         """
         estado = _busquedas_activas[busqueda_id]
         sitios = list(estado["sitios"].keys())
+        limite = asyncio.Semaphore(self.MAX_PARALELO)
         
-        # Procesar en lotes de MAX_PARALELO sitios
-        for i in range(0, len(sitios), self.MAX_PARALELO):
-            if estado.get("cancelado", False):
-                break
+        async def buscar(sitio: str):
+            async with limite:
+                if estado.get("cancelado", False):
+                    return
+                await self._buscar_en_sitio(busqueda_id, sitio)
                 
-            lote = sitios[i:i + self.MAX_PARALELO]
-            tareas = [
-                self._buscar_en_sitio(busqueda_id, sitio)
-                for sitio in lote
-            ]
-            await asyncio.gather(*tareas)
-            
-            # Actualizar progreso
-            completados = sum(
-                1 for s in estado["sitios"].values() 
-                if s["estado"] in ["completado", "error"]
-            )
-            estado["progreso_porcentaje"] = int((completados / len(sitios)) * 100)
+                # Actualizar progreso
+                terminados = estado["sitios_terminados"]
+                estado["progreso_porcentaje"] = int((terminados / len(sitios)) * 100)
+        
+        await asyncio.gather(*(buscar(sitio) for sitio in sitios))
     
     async def _busqueda_secuencial(self, busqueda_id: str):
         """
@@ -266,54 +442,172 @@ class BusquedaService:
                 estado_sitio["error_mensaje"] = "Scraper no encontrado"
                 return
             
-            # Buscar recetas
-            recetas_encontradas = await scraper.buscar_recetas(
-                palabra_clave=estado["palabra_clave"],
-                filtros=estado["filtros"],
-                limite=estado["limite_por_sitio"]
-            )
-            
-            estado_sitio["encontradas"] = len(recetas_encontradas)
-            estado["total_encontradas"] += len(recetas_encontradas)
+            # Del listado solo se usa la URL: el título sale de cada receta
+            scraper.titulos_preview = False
             
-            # Procesar cada receta encontrada
-            for receta_data in recetas_encontradas:
-                if estado.get("cancelado", False):
-                    break
+            # Listado y recetas comparten un contexto sobre el navegador de
+            # la búsqueda: ni un Chromium por receta ni uno por sitio
+            navegador = await self._obtener_navegador()
+            async with scraper.sesion_navegador(navegador):
+                # Buscar recetas
+                recetas_encontradas = await scraper.buscar_recetas(
+                    palabra_clave=estado["palabra_clave"],
+                    filtros=estado["filtros"],
+                    limite=estado["limite_por_sitio"]
+                )
+                
+                estado_sitio["encontradas"] = len(recetas_encontradas)
+                estado["total_encontradas"] += len(recetas_encontradas)
+                
+                # Las ya guardadas se consultan todas juntas, no una por receta
+                urls_existentes = await self._en_db(
+                    self._urls_existentes,
+                    [receta_data.url for receta_data in recetas_encontradas if receta_data.url]
+                )
+                
+                # Filtrar las recetas encontradas: las que ya se conocen se cuentan
+                # sin navegar, el resto queda pendiente de scrapear
+                vistas = set()
+                pendientes = []
+                for receta_data in recetas_encontradas:
+                    if estado.get("cancelado", False):
+                        break
+                        
+                    url = receta_data.url
+                    if not url:
+                        continue
+                    
+                    # La misma receta puede aparecer varias veces en el listado
+                    # (parámetros de seguimiento, fragmentos, barra final)
+                    clave = normalizar_url(url)
+                    if clave in vistas:
+                        estado_sitio["duplicadas"] += 1
+                        estado["total_duplicadas"] += 1
+                        continue
+                    vistas.add(clave)
                     
-                url = receta_data.get("url", "")
-                if not url:
-                    continue
+                    # Descartada por idioma en una búsqueda anterior: no se
+                    # vuelve a navegar
+                    if self._descartada_antes(clave):
+                        self._contar_descarte(estado, estado_sitio, "idioma")
+                        continue
+                    
+                    # Verificar duplicado
+                    if url in urls_existentes:
+                        estado_sitio["duplicadas"] += 1
+                        estado["total_duplicadas"] += 1
+                    else:
+                        pendientes.append((clave, url))
+                
+                # Scrapear las pendientes en paralelo, con un máximo por sitio
+                limite = asyncio.Semaphore(self.MAX_RECETAS_PARALELO)
+                por_guardar: List[dict] = []
                 
-                # Verificar duplicado
-                if self._verificar_duplicado(url):
-                    estado_sitio["duplicadas"] += 1
-                    estado["total_duplicadas"] += 1
-                else:
-                    # Intentar scrapear y guardar la receta completa
+                async def guardar_lote():
+                    if not por_guardar:
+                        return
+                    # El lote se toma antes de ceder el control: lo que se
+                    # scrapee mientras se inserta va al lote siguiente
+                    lote = por_guardar[:]
+                    por_guardar.clear()
                     try:
-                        await self._scrapear_y_guardar_receta(scraper, url)
-                        estado_sitio["nuevas"] += 1
-                        estado["total_nuevas"] += 1
-                    except RecetaDescartadaError as e:
-                        # Receta descartada por validación (vacía o en inglés)
-                        if e.tipo == "idioma":
-                            estado_sitio["descartadas_idioma"] += 1
-                            estado["total_descartadas_idioma"] += 1
-                        else:
-                            estado_sitio["descartadas_vacias"] += 1
-                            estado["total_descartadas_vacias"] += 1
-                    except Exception as e:
-                        # Si falla el scraping individual, continuar con las demás
-                        logger.debug(f"Error scraping {url}: {str(e)}")
-                        pass
-            
+                        insertadas = await self._en_db(self._guardar_lote, lote)
+                    except Exception:
+                        # El lote se revirtió entero: ninguna quedó guardada
+                        estado_sitio["nuevas"] -= len(lote)
+                        estado["total_nuevas"] -= len(lote)
+                        raise
+                    # Las que la base de datos ya tenía (guardadas por otra
+                    # búsqueda mientras tanto) pasan de nuevas a duplicadas
+                    omitidas = len(lote) - insertadas
+                    estado_sitio["nuevas"] -= omitidas
+                    estado["total_nuevas"] -= omitidas
+                    estado_sitio["duplicadas"] += omitidas
+                    estado["total_duplicadas"] += omitidas
+                
+                async def procesar(clave: str, url: str):
+                    async with limite:
+                        if estado.get("cancelado", False):
+                            return
+                        # Intentar scrapear la receta completa
+                        try:
+                            por_guardar.append(await self._scrapear_receta(scraper, url))
+                            estado_sitio["nuevas"] += 1
+                            estado["total_nuevas"] += 1
+                            if len(por_guardar) >= self.LOTE_GUARDADO:
+                                await guardar_lote()
+                        except RecetaDescartadaError as e:
+                            # Receta descartada por validación (vacía o en inglés)
+                            self._recordar_descarte(clave, e.tipo)
+                            self._contar_descarte(estado, estado_sitio, e.tipo)
+                        except Exception as e:
+                            # Si falla el scraping individual, continuar con las demás
+                            logger.debug(f"Error scraping {url}: {str(e)}")
+                
+                await asyncio.gather(*(procesar(clave, url) for clave, url in pendientes))
+                
+                # Un solo INSERT para las recetas que quedaron del último lote
+                await guardar_lote()
             estado_sitio["estado"] = "completado"
             
         except Exception as e:
             estado_sitio["estado"] = "error"
             estado_sitio["error_mensaje"] = str(e)
             estado["errores"].append(f"{nombre_sitio}: {str(e)}")
+        finally:
+            estado["sitios_terminados"] += 1
+    
+    def _contar_descarte(self, estado: dict, estado_sitio: dict, tipo: str):
+        """
+        Suma una receta descartada a los contadores del sitio y de la búsqueda.
+        
+        Args:
+            estado: Estado de la búsqueda.
+            estado_sitio: Estado del sitio dentro de la búsqueda.
+            tipo: Tipo de descarte ('invalida' o 'idioma').
+        """
+        if tipo == "idioma":
+            estado_sitio["descartadas_idioma"] += 1
+            estado["total_descartadas_idioma"] += 1
+        else:
+            estado_sitio["descartadas_vacias"] += 1
+            estado["total_descartadas_vacias"] += 1
+    
+    def _recordar_descarte(self, clave: str, tipo: str):
+        """
+        Registra una URL descartada por idioma para no volver a scrapearla.
+        
+        Los descartes por receta vacía no se registran (ver _urls_descartadas).
+        
+        Args:
+            clave: URL normalizada (ver normalizar_url).
+            tipo: Tipo de descarte ('invalida' o 'idioma').
+        """
+        if tipo != "idioma":
+            return
+        _urls_descartadas.pop(clave, None)
+        _urls_descartadas[clave] = time.monotonic()
+        if len(_urls_descartadas) > self.MAX_URLS_DESCARTADAS:
+            # Los dict conservan el orden de inserción: la primera es la más antigua
+            del _urls_descartadas[next(iter(_urls_descartadas))]
+    
+    def _descartada_antes(self, clave: str) -> bool:
+        """
+        Indica si la URL se descartó por idioma hace menos de TTL_URLS_DESCARTADAS.
+        
+        Args:
+            clave: URL normalizada (ver normalizar_url).
+            
+        Returns:
+            True si hay que saltearla; las entradas vencidas se olvidan.
+        """
+        descartada = _urls_descartadas.get(clave)
+        if descartada is None:
+            return False
+        if time.monotonic() - descartada > self.TTL_URLS_DESCARTADAS:
+            del _urls_descartadas[clave]
+            return False
+        return True
     
     def _obtener_scraper_por_nombre(self, nombre_sitio: str):
         """
@@ -325,40 +619,92 @@ class BusquedaService:
         Returns:
             Instancia del scraper o None si no se encuentra.
         """
-        sitios = ScraperFactory.obtener_sitios_soportados()
-        for sitio in sitios:
-            if sitio["nombre"] == nombre_sitio:
-                # Crear una URL ficticia para obtener el scraper
-                dominio = sitio["dominios"][0] if sitio.get("dominios") else ""
-                if dominio:
-                    url_ficticia = f"https://{dominio}/"
-                    return ScraperFactory.obtener_scraper(url_ficticia)
-        return None
+        return ScraperFactory.obtener_scraper_por_nombre(nombre_sitio)
+    
+    def _guardar_lote(self, filas: List[dict]) -> int:
+        """
+        Inserta en la base de datos las recetas acumuladas y las confirma.
+        
+        En SQLite y PostgreSQL todas las filas van en un único INSERT con
+        ON CONFLICT DO NOTHING ejecutado como executemany, seguido de un solo
+        commit: las URLs que ya existen se omiten sin abortar el resto del
+        lote. En otros dialectos cada fila se inserta en su propio SAVEPOINT,
+        así una URL repetida revierte solo esa fila. Se ejecuta en el hilo de
+        la base de datos (ver _en_db).
+        
+        Args:
+            filas: Columnas de cada receta (ver _scrapear_receta).
+            
+        Returns:
+            Cantidad de recetas insertadas.
+            
+        Raises:
+            Exception: Si el INSERT o el commit fallan (la sesión queda revertida).
+        """
+        if not filas:
+            return 0
+        db = self._sesion_busqueda()
+        try:
+            insertar = _INSERTS_SIN_CONFLICTO.get(db.get_bind().dialect.name)
+            if insertar is None:
+                insertadas = 0
+                for fila in filas:
+                    try:
+                        with db.begin_nested():
+                            db.execute(insert(Receta), fila)
+                        insertadas += 1
+                    except IntegrityError:
+                        pass
+            else:
+                sentencia = (
+                    insertar(Receta)
+                    .on_conflict_do_nothing(index_elements=["url_origen"])
+                    .returning(Receta.id)
+                )
+                insertadas = len(db.execute(sentencia, filas).all())
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return insertadas
     
-    def _verificar_duplicado(self, url: str) -> bool:
+    def _urls_existentes(self, urls: List[str]) -> Set[str]:
         """
-        Verifica si una receta ya existe en la base de datos.
+        Obtiene cuáles de las URLs ya tienen una receta en la base de datos.
         
         Args:
-            url: URL de origen de la receta.
+            urls: URLs de origen candidatas.
             
         Returns:
-            True si la receta ya existe, False si es nueva.
+            Conjunto con las URLs que ya existen.
         """
-        existente = self.db.query(Receta).filter(Receta.url_origen == url).first()
-        return existente is not None
+        db = self._sesion_busqueda()
+        existentes = set()
+        for i in range(0, len(urls), self.LOTE_CONSULTA_URLS):
+            lote = urls[i:i + self.LOTE_CONSULTA_URLS]
+            existentes.update(
+                url for (url,) in db.query(Receta.url_origen)
+                .filter(Receta.url_origen.in_(lote))
+            )
+        return existentes
     
-    async def _scrapear_y_guardar_receta(self, scraper, url: str):
+    async def _scrapear_receta(self, scraper, url: str) -> dict:
         """
-        Scrapea una receta completa, valida y la guarda en la base de datos.
+        Scrapea una receta completa, la valida y devuelve sus columnas.
+        
+        El guardado queda a cargo de _buscar_en_sitio (ver _guardar_lote),
+        que inserta las recetas por lotes.
         
         Args:
             scraper: Instancia del scraper a usar.
             url: URL de la receta a scrapear.
             
+        Returns:
+            Diccionario con las columnas de la receta para insertar.
+            
         Raises:
             RecetaDescartadaError: Si la receta no pasa la validación (vacía o en inglés).
-            Exception: Si hay error durante el scraping o guardado.
+            Exception: Si hay error durante el scraping.
         """
         # Scrapear la receta completa
         datos = await scraper.scrapear(url)
@@ -375,22 +721,19 @@ class BusquedaService:
             logger.warning(f"Receta descartada (en inglés): {url}")
             raise RecetaDescartadaError("Contenido en inglés", tipo="idioma")
         
-        # Crear la receta en la base de datos
-        receta = Receta(
-            url_origen=datos.url_origen,
-            sitio_origen=datos.sitio_origen,
-            titulo=datos.titulo,
-            descripcion=datos.descripcion,
-            imagen_url=datos.imagen_url,
-            ingredientes=datos.ingredientes,
-            pasos=datos.pasos,
-            tiempo_preparacion=datos.tiempo_preparacion,
-            tiempo_coccion=datos.tiempo_coccion,
-            porciones=datos.porciones
-        )
-        
-        self.db.add(receta)
-        self.db.commit()
+        # Columnas de la receta para la base de datos
+        return {
+            "url_origen": datos.url_origen,
+            "sitio_origen": datos.sitio_origen,
+            "titulo": datos.titulo,
+            "descripcion": datos.descripcion,
+            "imagen_url": datos.imagen_url,
+            "ingredientes": datos.ingredientes,
+            "pasos": datos.pasos,
+            "tiempo_preparacion": datos.tiempo_preparacion,
+            "tiempo_coccion": datos.tiempo_coccion,
+            "porciones": datos.porciones
+        }
     
     def obtener_progreso(self, busqueda_id: str) -> Optional[dict]:
         """
@@ -402,14 +745,16 @@ class BusquedaService:
         Returns:
             Diccionario con el estado de progreso o None si no existe.
         """
-        if busqueda_id not in _busquedas_activas:
+        estado = self._obtener_estado(busqueda_id)
+        if estado is None:
             return None
         
-        estado = _busquedas_activas[busqueda_id]
-        
-        # Actualizar tiempo transcurrido
-        if estado["estado"] == "en_progreso":
-            estado["tiempo_transcurrido"] = time.time() - estado["tiempo_inicio"]
+        # Mientras la tarea no termine el tiempo se calcula al vuelo, sin
+        # escribir en el estado compartido en cada consulta
+        if estado["tiempo_fin"] is None:
+            tiempo_transcurrido = time.monotonic() - estado["tiempo_inicio"]
+        else:
+            tiempo_transcurrido = estado["tiempo_transcurrido"]
         
         return {
             "busqueda_id": estado["busqueda_id"],
@@ -422,7 +767,7 @@ class BusquedaService:
             "total_descartadas_vacias": estado.get("total_descartadas_vacias", 0),
             "total_descartadas_idioma": estado.get("total_descartadas_idioma", 0),
             "errores": estado["errores"],
-            "tiempo_transcurrido": estado["tiempo_transcurrido"]
+            "tiempo_transcurrido": tiempo_transcurrido
         }
     
     def obtener_resultado(self, busqueda_id: str) -> Optional[dict]:
@@ -435,11 +780,10 @@ class BusquedaService:
         Returns:
             Diccionario con el resultado final o None si no existe.
         """
-        if busqueda_id not in _busquedas_activas:
+        estado = self._obtener_estado(busqueda_id)
+        if estado is None:
             return None
         
-        estado = _busquedas_activas[busqueda_id]
-        
         return {
             "busqueda_id": estado["busqueda_id"],
             "estado": estado["estado"],
@@ -463,11 +807,10 @@ class BusquedaService:
         Returns:
             True si se canceló, False si no existe o ya terminó.
         """
-        if busqueda_id not in _busquedas_activas:
+        estado = self._obtener_estado(busqueda_id)
+        if estado is None:
             return False
         
-        estado = _busquedas_activas[busqueda_id]
-        
         if estado["estado"] != "en_progreso":
             return False
         
@@ -485,7 +828,5 @@ class BusquedaService:
         Returns:
             True si se eliminó, False si no existía.
         """
-        if busqueda_id in _busquedas_activas:
-            del _busquedas_activas[busqueda_id]
-            return True
-        return False
+        with _bloqueo_busquedas:
+            return _busquedas_activas.pop(busqueda_id, None) is not None
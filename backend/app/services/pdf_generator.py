@@ -5,12 +5,13 @@ Genera PDFs individuales o múltiples con diseño atractivo.
 """
 
 import os
-from typing import List
+import threading
+from typing import List, Optional
 from io import BytesIO
 from pathlib import Path
 
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib.units import cm
 from reportlab.lib.colors import HexColor
 from reportlab.platypus import (
@@ -23,6 +24,11 @@ from app.models import Receta
 from app.config import PDF_TEMP_DIR
 
 
+# Protege la construcción perezosa de la hoja de estilos compartida: los
+# endpoints de PDF son síncronos y corren en el threadpool
+_bloqueo_estilos = threading.Lock()
+
+
 class PDFGenerator:
     """
     Generador de PDFs para recetas.
@@ -37,78 +43,107 @@ class PDFGenerator:
     COLOR_TEXTO = HexColor("#333333")
     COLOR_GRIS = HexColor("#666666")
     
+    # Hoja de estilos compartida (ver _obtener_estilos)
+    _estilos: Optional[StyleSheet1] = None
+    
     def __init__(self):
         """Inicializa el generador de PDFs."""
         # Asegurar que existe el directorio temporal
         Path(PDF_TEMP_DIR).mkdir(parents=True, exist_ok=True)
         
-        # Configurar estilos
-        self.estilos = getSampleStyleSheet()
-        self._configurar_estilos()
+        # Estilos compartidos entre instancias (se construyen una sola vez)
+        self.estilos = self._obtener_estilos()
     
-    def _configurar_estilos(self):
-        """Configura los estilos personalizados para el PDF."""
+    @classmethod
+    def _obtener_estilos(cls) -> StyleSheet1:
+        """
+        Devuelve la hoja de estilos del PDF, construyéndola la primera vez.
+        
+        Se crea un generador por request, así que la hoja de ReportLab y
+        los estilos propios se arman una vez por proceso y se comparten:
+        ninguna instancia los modifica después.
+        
+        Returns:
+            Hoja de estilos con los estilos personalizados.
+        """
+        with _bloqueo_estilos:
+            if cls._estilos is None:
+                cls._estilos = cls._configurar_estilos()
+            return cls._estilos
+    
+    @classmethod
+    def _configurar_estilos(cls) -> StyleSheet1:
+        """
+        Crea la hoja de estilos base y le agrega los estilos personalizados.
+        
+        Returns:
+            Hoja de estilos con los estilos personalizados.
+        """
+        estilos = getSampleStyleSheet()
+        
         # Título principal
-        self.estilos.add(ParagraphStyle(
+        estilos.add(ParagraphStyle(
             name='TituloReceta',
-            parent=self.estilos['Heading1'],
+            parent=estilos['Heading1'],
             fontSize=24,
-            textColor=self.COLOR_PRIMARIO,
+            textColor=cls.COLOR_PRIMARIO,
             spaceAfter=20,
             alignment=TA_CENTER,
             fontName='Helvetica-Bold'
         ))
         
         # Subtítulos (secciones)
-        self.estilos.add(ParagraphStyle(
+        estilos.add(ParagraphStyle(
             name='Seccion',
-            parent=self.estilos['Heading2'],
+            parent=estilos['Heading2'],
             fontSize=16,
-            textColor=self.COLOR_PRIMARIO,
+            textColor=cls.COLOR_PRIMARIO,
             spaceBefore=15,
             spaceAfter=10,
             fontName='Helvetica-Bold'
         ))
         
         # Texto normal
-        self.estilos.add(ParagraphStyle(
+        estilos.add(ParagraphStyle(
             name='TextoNormal',
-            parent=self.estilos['Normal'],
+            parent=estilos['Normal'],
             fontSize=11,
-            textColor=self.COLOR_TEXTO,
+            textColor=cls.COLOR_TEXTO,
             alignment=TA_JUSTIFY,
             spaceAfter=6
         ))
         
         # Metadatos (tiempo, porciones)
-        self.estilos.add(ParagraphStyle(
+        estilos.add(ParagraphStyle(
             name='Metadatos',
-            parent=self.estilos['Normal'],
+            parent=estilos['Normal'],
             fontSize=10,
-            textColor=self.COLOR_GRIS,
+            textColor=cls.COLOR_GRIS,
             alignment=TA_CENTER,
             spaceAfter=15
         ))
         
         # Items de lista
-        self.estilos.add(ParagraphStyle(
+        estilos.add(ParagraphStyle(
             name='ItemLista',
-            parent=self.estilos['Normal'],
+            parent=estilos['Normal'],
             fontSize=11,
-            textColor=self.COLOR_TEXTO,
+            textColor=cls.COLOR_TEXTO,
             leftIndent=20,
             spaceAfter=4
         ))
         
         # Origen
-        self.estilos.add(ParagraphStyle(
+        estilos.add(ParagraphStyle(
             name='Origen',
-            parent=self.estilos['Normal'],
+            parent=estilos['Normal'],
             fontSize=9,
-            textColor=self.COLOR_GRIS,
+            textColor=cls.COLOR_GRIS,
             alignment=TA_CENTER,
             spaceBefore=20
         ))
+        
+        return estilos
     
     def generar_pdf_individual(self, receta: Receta) -> BytesIO:
         """
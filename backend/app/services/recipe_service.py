@@ -110,12 +110,15 @@ class RecipeService:
         """
         return self.db.query(Receta).filter(Receta.url_origen == url).first()
     
-    async def scrapear_y_guardar(self, url: str) -> Receta:
+    async def scrapear_y_guardar(self, url: str, forzar_actualizacion: bool = False) -> Receta:
         """
         Scrapea una receta desde una URL y la guarda en la base de datos.
         
         Args:
             url: URL de la receta a scrapear.
+            forzar_actualizacion: Ignorar la caché de recetas scrapeadas y
+                                  revalidar el HTML guardado en disco (por
+                                  ejemplo, si la página cambió en el sitio).
             
         Returns:
             Receta guardada en la base de datos.
@@ -137,7 +140,7 @@ class RecipeService:
             raise ValueError(f"URL no soportada. Sitios soportados: {nombres}")
         
         # Realizar el scraping
-        datos = await scraper.scrapear(str(url))
+        datos = await scraper.scrapear(str(url), forzar_actualizacion=forzar_actualizacion)
         
         # Validar que la receta tenga contenido mínimo
         es_valida, mensaje_error = datos.validar()
@@ -0,0 +1,266 @@
+"""
+Tests para el servicio de búsqueda automática de recetas.
+"""
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from contextlib import asynccontextmanager
+
+from app.scraper.base_scraper import RecetaScraped, TarjetaReceta
+from app.services import busqueda_service
+from app.services.busqueda_service import BusquedaService
+
+
+def fila_receta(url: str) -> dict:
+    """Columnas de una receta lista para _guardar_lote."""
+    return {
+        "url_origen": url,
+        "sitio_origen": "Cookpad",
+        "titulo": "Flan casero",
+        "ingredientes": ["4 huevos", "1 litro de leche"],
+        "pasos": ["Batir los huevos con la leche", "Cocinar a baño maría"],
+    }
+
+
+def urls_guardadas(fabrica_sesiones) -> list:
+    """URLs de las recetas guardadas, leídas con una sesión nueva."""
+    from app.models import Receta
+    
+    with fabrica_sesiones() as db:
+        return sorted(url for (url,) in db.query(Receta.url_origen))
+
+
+class ScraperFalso:
+    """Scraper que lista las URLs indicadas y devuelve recetas válidas en español."""
+    
+    titulos_preview = True
+    
+    def __init__(self, urls):
+        self.urls = urls
+    
+    @asynccontextmanager
+    async def sesion_navegador(self, navegador=None):
+        yield self
+    
+    async def buscar_recetas(self, palabra_clave, filtros, limite):
+        return [TarjetaReceta(url) for url in self.urls]
+    
+    async def scrapear(self, url):
+        return RecetaScraped(**fila_receta(url))
+
+
+async def sin_navegador():
+    """Reemplaza el lanzamiento de Chromium."""
+    return None
+
+
+@pytest.fixture
+def fabrica_sesiones():
+    """Fábrica de sesiones sobre una base SQLite en memoria con las tablas creadas."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+    from app.database import Base
+    from app.models import Receta  # noqa: F401
+    
+    # StaticPool: todas las sesiones, de cualquier hilo, ven la misma base
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def almacenes_vacios():
+    """Aísla cada test de las búsquedas y descartes que dejaron los demás."""
+    busqueda_service._busquedas_activas.clear()
+    busqueda_service._urls_descartadas.clear()
+    yield
+    busqueda_service._busquedas_activas.clear()
+    busqueda_service._urls_descartadas.clear()
+
+
+class TestUrlsDescartadas:
+    """Tests para el registro de URLs descartadas entre búsquedas."""
+    
+    def test_solo_se_recuerdan_los_descartes_por_idioma(self):
+        """Verifica que una receta vacía se vuelve a intentar y una en inglés no."""
+        service = BusquedaService(None)
+        
+        service._recordar_descarte("https://cookpad.com/ar/recetas/1", "invalida")
+        service._recordar_descarte("https://cookpad.com/ar/recetas/2", "idioma")
+        
+        assert not service._descartada_antes("https://cookpad.com/ar/recetas/1")
+        assert service._descartada_antes("https://cookpad.com/ar/recetas/2")
+    
+    def test_descartes_vencidos_se_olvidan(self, monkeypatch):
+        """Verifica que pasado TTL_URLS_DESCARTADAS la URL vuelve a scrapearse."""
+        service = BusquedaService(None)
+        service._recordar_descarte("https://tasty.co/recipe/pancakes", "idioma")
+        
+        monkeypatch.setattr(BusquedaService, "TTL_URLS_DESCARTADAS", -1)
+        
+        assert not service._descartada_antes("https://tasty.co/recipe/pancakes")
+        assert "https://tasty.co/recipe/pancakes" not in busqueda_service._urls_descartadas
+    
+    def test_descartes_limitados_a_los_mas_recientes(self, monkeypatch):
+        """Verifica que al superar MAX_URLS_DESCARTADAS se olvida la más antigua."""
+        monkeypatch.setattr(BusquedaService, "MAX_URLS_DESCARTADAS", 2)
+        service = BusquedaService(None)
+        
+        for i in range(3):
+            service._recordar_descarte(f"https://tasty.co/recipe/{i}", "idioma")
+        
+        assert list(busqueda_service._urls_descartadas) == [
+            "https://tasty.co/recipe/1", "https://tasty.co/recipe/2"
+        ]
+
+
+class TestGuardarLote:
+    """Tests para el guardado por lotes de las recetas encontradas."""
+    
+    def test_lote_omite_urls_existentes(self, fabrica_sesiones):
+        """Verifica que una URL ya guardada se omite sin perder el resto del lote."""
+        service = BusquedaService(None, fabrica_sesiones)
+        assert service._guardar_lote([fila_receta("https://cookpad.com/ar/recetas/1")]) == 1
+        
+        lote = [fila_receta(f"https://cookpad.com/ar/recetas/{i}") for i in range(1, 4)]
+        assert service._guardar_lote(lote) == 2
+        assert service._guardar_lote([]) == 0
+        assert len(urls_guardadas(fabrica_sesiones)) == 3
+    
+    def test_lote_sin_on_conflict_usa_savepoints(self, fabrica_sesiones, monkeypatch):
+        """Verifica que en un dialecto sin ON CONFLICT la fila repetida no revierte el lote."""
+        monkeypatch.setattr(busqueda_service, "_INSERTS_SIN_CONFLICTO", {})
+        service = BusquedaService(None, fabrica_sesiones)
+        service._guardar_lote([fila_receta("https://cookpad.com/ar/recetas/2")])
+        
+        lote = [fila_receta(f"https://cookpad.com/ar/recetas/{i}") for i in range(1, 4)]
+        assert service._guardar_lote(lote) == 2
+        assert urls_guardadas(fabrica_sesiones) == [
+            f"https://cookpad.com/ar/recetas/{i}" for i in range(1, 4)
+        ]
+    
+    def test_repetidas_al_guardar_pasan_a_duplicadas(self, fabrica_sesiones):
+        """Verifica los contadores cuando otra búsqueda guardó la receta mientras tanto."""
+        import asyncio
+        
+        urls = [f"https://cookpad.com/ar/recetas/{i}" for i in range(1, 4)]
+        service = BusquedaService(None, fabrica_sesiones)
+        service._guardar_lote([fila_receta(urls[0])])
+        
+        busqueda_id = service.iniciar_busqueda_automatica(None, {}, ["Cookpad"], limite=10)
+        service._obtener_scraper_por_nombre = lambda nombre: ScraperFalso(urls)
+        service._obtener_navegador = sin_navegador
+        # La primera se guardó después de consultar las existentes
+        service._urls_existentes = lambda urls: set()
+        asyncio.run(service._buscar_en_sitio(busqueda_id, "Cookpad"))
+        
+        sitio = service.obtener_progreso(busqueda_id)["sitios"][0]
+        assert sitio["estado"] == "completado"
+        assert (sitio["nuevas"], sitio["duplicadas"]) == (2, 1)
+        assert urls_guardadas(fabrica_sesiones) == urls
+    
+    def test_busqueda_usa_sesion_propia_en_el_hilo_de_db(self, fabrica_sesiones):
+        """Verifica que la búsqueda en segundo plano no usa la sesión de la petición."""
+        import asyncio
+        import threading
+        
+        hilos = []
+        
+        def fabrica():
+            hilos.append(threading.current_thread().name)
+            return fabrica_sesiones()
+        
+        class SesionDePeticion:
+            def __getattr__(self, nombre):
+                raise AssertionError("la sesión de la petición no debe usarse")
+        
+        urls = ["https://cookpad.com/ar/recetas/1", "https://cookpad.com/ar/recetas/2"]
+        service = BusquedaService(SesionDePeticion(), fabrica)
+        busqueda_id = service.iniciar_busqueda_automatica(None, {}, ["Cookpad"], limite=10)
+        service._obtener_scraper_por_nombre = lambda nombre: ScraperFalso(urls)
+        service._obtener_navegador = sin_navegador
+        asyncio.run(service.ejecutar_busqueda(busqueda_id))
+        
+        assert service.obtener_resultado(busqueda_id)["total_nuevas"] == 2
+        assert len(hilos) == 1 and hilos[0].startswith("busqueda-db")
+        assert service._sesion_db is None
+        assert urls_guardadas(fabrica_sesiones) == urls
+
+
+class TestEstadoBusquedas:
+    """Tests para el progreso y la limpieza de las búsquedas en memoria."""
+    
+    def test_progreso_calcula_el_tiempo_mientras_corre(self):
+        """Verifica que el progreso en curso mide el tiempo sin escribir en el estado."""
+        service = BusquedaService(None)
+        busqueda_id = service.iniciar_busqueda_automatica("flan", {}, ["Cookpad", "Tasty"], limite=10)
+        estado = busqueda_service._busquedas_activas[busqueda_id]
+        estado["tiempo_inicio"] -= 5
+        
+        progreso = service.obtener_progreso(busqueda_id)
+        
+        assert progreso["estado"] == "en_progreso"
+        assert [sitio["nombre"] for sitio in progreso["sitios"]] == ["Cookpad", "Tasty"]
+        assert progreso["tiempo_transcurrido"] >= 5
+        assert estado["tiempo_transcurrido"] == 0
+        assert service.obtener_progreso("no-existe") is None
+    
+    def test_progreso_de_busqueda_terminada_usa_tiempo_final(self, fabrica_sesiones):
+        """Verifica el progreso y el tiempo congelado de una búsqueda paralela terminada."""
+        import asyncio
+        
+        urls = ["https://cookpad.com/ar/recetas/1"]
+        service = BusquedaService(None, fabrica_sesiones)
+        busqueda_id = service.iniciar_busqueda_automatica(None, {}, ["Cookpad", "Tasty"], limite=10)
+        service._obtener_scraper_por_nombre = lambda nombre: ScraperFalso(urls)
+        service._obtener_navegador = sin_navegador
+        asyncio.run(service.ejecutar_busqueda(busqueda_id))
+        
+        progreso = service.obtener_progreso(busqueda_id)
+        estado = busqueda_service._busquedas_activas[busqueda_id]
+        
+        assert progreso["estado"] == "completado"
+        assert progreso["progreso_porcentaje"] == 100
+        assert estado["sitios_terminados"] == 2
+        # La segunda vez que aparece la URL ya está guardada
+        assert (progreso["total_nuevas"], progreso["total_duplicadas"]) == (1, 1)
+        assert progreso["tiempo_transcurrido"] == estado["tiempo_fin"] - estado["tiempo_inicio"]
+    
+    def test_purga_busquedas_terminadas_vencidas(self):
+        """Verifica que se olvidan las terminadas hace más de TTL_BUSQUEDAS y no las en curso."""
+        service = BusquedaService(None)
+        vencida = service.iniciar_busqueda_automatica(None, {}, ["Cookpad"])
+        reciente = service.iniciar_busqueda_automatica(None, {}, ["Cookpad"])
+        en_curso = service.iniciar_busqueda_automatica(None, {}, ["Cookpad"])
+        en_curso_vieja = busqueda_service._busquedas_activas[en_curso]
+        en_curso_vieja["tiempo_inicio"] -= 2 * service.TTL_BUSQUEDAS
+        
+        ahora = busqueda_service.time.monotonic()
+        busqueda_service._busquedas_activas[vencida]["tiempo_fin"] = ahora - service.TTL_BUSQUEDAS - 1
+        busqueda_service._busquedas_activas[reciente]["tiempo_fin"] = ahora
+        
+        nueva = service.iniciar_busqueda_automatica(None, {}, ["Cookpad"])
+        
+        assert list(busqueda_service._busquedas_activas) == [reciente, en_curso, nueva]
+    
+    def test_purga_respeta_el_maximo_de_busquedas(self, monkeypatch):
+        """Verifica que al llegar a MAX_BUSQUEDAS se descartan primero las terminadas más antiguas."""
+        monkeypatch.setattr(BusquedaService, "MAX_BUSQUEDAS", 3)
+        service = BusquedaService(None)
+        primera, segunda, en_curso = (
+            service.iniciar_busqueda_automatica(None, {}, ["Cookpad"]) for _ in range(3)
+        )
+        for busqueda_id in (primera, segunda):
+            busqueda_service._busquedas_activas[busqueda_id]["tiempo_fin"] = busqueda_service.time.monotonic()
+        
+        nueva = service.iniciar_busqueda_automatica(None, {}, ["Cookpad"])
+        
+        assert list(busqueda_service._busquedas_activas) == [segunda, en_curso, nueva]
+        assert service.limpiar_busqueda(segunda)
+        assert not service.limpiar_busqueda(segunda)
@@ -13,6 +13,115 @@ from app.scraper.base_scraper import (
 )
 
 
+# ============================================
+# Dobles de prueba compartidos
+# ============================================
+
+async def sin_espera(*args, **kwargs):
+    """Reemplaza esperas y sleeps: vuelve enseguida."""
+    return None
+
+
+async def no_debe_esperar(*args, **kwargs):
+    """Reemplaza una espera que el código bajo prueba no debería hacer."""
+    raise AssertionError("no debería esperar")
+
+
+def receta_valida(url: str, titulo: str = "Flan") -> RecetaScraped:
+    """Crea una receta que pasa la validación (título, ingredientes y pasos)."""
+    return RecetaScraped(
+        titulo=titulo,
+        url_origen=url,
+        sitio_origen="Cookpad",
+        ingredientes=["4 huevos"],
+        pasos=["Batir"]
+    )
+
+
+class PaginaFalsa:
+    """
+    Página de Playwright mínima.
+    
+    evaluate registra el script y sus argumentos y devuelve respuesta(argumentos)
+    o, si no hay función, el valor fijo resultado. eval_on_selector_all devuelve
+    resultado_todos si se indicó. Cualquier consulta elemento por elemento falla:
+    los extractores deben resolver todo en una sola llamada.
+    """
+    
+    def __init__(self, resultado=None, respuesta=None, resultado_todos=None):
+        self.resultado = resultado
+        self.respuesta = respuesta
+        self.resultado_todos = resultado_todos
+        self.scripts = []
+        self.llamadas = []
+        self.selectores = []
+        self.cerrada = False
+    
+    def set_default_timeout(self, timeout):
+        pass
+    
+    async def goto(self, url, wait_until=None):
+        pass
+    
+    async def wait_for_load_state(self, *args, **kwargs):
+        pass
+    
+    async def close(self):
+        self.cerrada = True
+    
+    async def evaluate(self, script, argumentos=None):
+        self.scripts.append(script)
+        self.llamadas.append(argumentos)
+        if self.respuesta is not None:
+            return self.respuesta(argumentos)
+        return self.resultado
+    
+    async def eval_on_selector_all(self, selector, script):
+        if self.resultado_todos is None:
+            raise AssertionError("no debe consultar selector por selector")
+        self.selectores.append(selector)
+        return self.resultado_todos
+    
+    async def query_selector_all(self, selector):
+        raise AssertionError("no debe consultar elemento por elemento")
+    
+    async def query_selector(self, selector):
+        raise AssertionError("no debe pedir un ElementHandle")
+
+
+class ContextoFalso:
+    """BrowserContext que registra scripts de inicio y páginas abiertas."""
+    
+    def __init__(self):
+        self.scripts = []
+        self.paginas = []
+        self.cerrado = False
+    
+    async def add_init_script(self, script):
+        self.scripts.append(script)
+    
+    async def route(self, patron, manejador):
+        pass
+    
+    async def new_page(self):
+        self.paginas.append(PaginaFalsa())
+        return self.paginas[-1]
+    
+    async def close(self):
+        self.cerrado = True
+
+
+class NavegadorFalso:
+    """Navegador que registra los contextos creados."""
+    
+    def __init__(self):
+        self.contextos = []
+    
+    async def new_context(self, **opciones):
+        self.contextos.append(ContextoFalso())
+        return self.contextos[-1]
+
+
 class TestValidacionRecetas:
     """Tests para la validación de recetas."""
     
@@ -204,6 +313,355 @@ class TestRecetaScrapedValidacion:
         )
         idioma = receta.detectar_idioma()
         assert idioma == 'en'
+    
+    def test_listas_se_guardan_como_tuplas(self):
+        """Verifica que ingredientes y pasos se normalizan a tuplas inmutables."""
+        receta = RecetaScraped(
+            titulo='Guiso',
+            url_origen='https://test.com/guiso',
+            sitio_origen='Test',
+            ingredientes=['500g de carne', 'Cebollas']
+        )
+        
+        assert receta.ingredientes == ('500g de carne', 'Cebollas')
+        assert receta.pasos == ()
+    
+    def test_metadatos_repetidos_comparten_instancia(self):
+        """Verifica que los metadatos iguales de distintas recetas son la misma cadena."""
+        primera = RecetaScraped(
+            titulo='Guiso', url_origen='https://test.com/1', sitio_origen='Test',
+            porciones=''.join(['4 ', 'porciones'])
+        )
+        segunda = RecetaScraped(
+            titulo='Sopa', url_origen='https://test.com/2', sitio_origen='Test',
+            porciones=''.join(['4 porc', 'iones'])
+        )
+        
+        assert primera.porciones == '4 porciones'
+        assert primera.porciones is segunda.porciones
+        assert primera.tiempo_coccion is None
+    
+    def test_receta_usa_slots(self):
+        """Verifica que RecetaScraped no reserva un __dict__ por instancia."""
+        receta = RecetaScraped(titulo='Guiso', url_origen='https://test.com/guiso', sitio_origen='Test')
+        
+        assert not hasattr(receta, '__dict__')
+
+
+class TestCacheRecetas:
+    """Tests para la caché de recetas por URL normalizada."""
+    
+    def test_normalizar_url_quita_seguimiento_y_fragmento(self):
+        """Verifica que la normalización ignora tracking, fragmento y mayúsculas del dominio."""
+        from app.scraper.base_scraper import normalizar_url
+        
+        url = "HTTPS://Cookpad.com/ar/recetas/123/?utm_source=x&porciones=4&fbclid=abc#pasos"
+        assert normalizar_url(url) == "https://cookpad.com/ar/recetas/123?porciones=4"
+        assert normalizar_url("https://cookpad.com/ar/recetas/123") == normalizar_url(
+            "https://cookpad.com/ar/recetas/123/"
+        )
+    
+    def test_html_cacheado_en_disco(self, monkeypatch, tmp_path):
+        """Verifica que el HTML guardado se reutiliza sin petición mientras no expira."""
+        import asyncio
+        from app.scraper import base_scraper
+        from app.scraper.sites.rechupete import RechupeteScraper
+        
+        monkeypatch.setattr(base_scraper, "SCRAPER_CACHE_HTML_DIR", str(tmp_path))
+        url = "https://www.recetasderechupete.com/paella/"
+        base_scraper.guardar_html_en_cache(url, "<h1>Paella</h1>", '"v1"', None)
+        
+        cacheado = base_scraper.leer_html_cacheado(url + "?utm_source=x")
+        assert cacheado.html == "<h1>Paella</h1>"
+        assert cacheado.etag == '"v1"'
+        assert cacheado.ultima_modificacion is None
+        
+        # Dentro del TTL no hay petición HTTP (ni espera de rate limit)
+        scraper = RechupeteScraper()
+        scraper._esperar_rate_limit = no_debe_esperar
+        assert asyncio.run(scraper._descargar_html(url)) == "<h1>Paella</h1>"
+        
+        # Escrituras simultáneas de la misma URL: cada una usa su temporal
+        async def escribir_en_paralelo():
+            await asyncio.gather(*(
+                asyncio.to_thread(base_scraper.guardar_html_en_cache, url, f"<h1>v{i}</h1>")
+                for i in range(8)
+            ))
+        
+        asyncio.run(escribir_en_paralelo())
+        assert base_scraper.leer_html_cacheado(url).html.startswith("<h1>v")
+        assert [ruta.suffix for ruta in tmp_path.iterdir()] == [".json"]
+        
+        monkeypatch.setattr(base_scraper, "SCRAPER_CACHE_HTML_DIR", "")
+        assert base_scraper.leer_html_cacheado(url) is None
+    
+    def test_html_cacheado_se_poda(self, monkeypatch, tmp_path):
+        """Verifica que la caché de HTML no pasa de SCRAPER_CACHE_HTML_MAX páginas."""
+        import os
+        from app.scraper import base_scraper
+        
+        monkeypatch.setattr(base_scraper, "SCRAPER_CACHE_HTML_DIR", str(tmp_path))
+        monkeypatch.setattr(base_scraper, "SCRAPER_CACHE_HTML_MAX", 3)
+        monkeypatch.setattr(base_scraper, "_PODA_HTML_CADA", 1)
+        urls = [f"https://www.recetasderechupete.com/receta-{i}/" for i in range(5)]
+        
+        for i, url in enumerate(urls):
+            base_scraper.guardar_html_en_cache(url, f"<h1>{i}</h1>")
+            # Fechas de guardado distintas y crecientes
+            os.utime(base_scraper._ruta_html_cacheado(url), (1000 + i, 1000 + i))
+        
+        assert len(list(tmp_path.iterdir())) == 3
+        assert [base_scraper.leer_html_cacheado(url) is not None for url in urls] == [
+            False, False, True, True, True
+        ]
+    
+    def test_scrapear_usa_cache(self):
+        """Verifica que scrapear devuelve la receta cacheada sin abrir el navegador."""
+        import asyncio
+        from app.scraper.base_scraper import guardar_receta_en_cache, limpiar_cache_recetas
+        from app.scraper.sites.cookpad import CookpadScraper
+        
+        receta = receta_valida("https://cookpad.com/ar/recetas/1", "Tarta")
+        limpiar_cache_recetas()
+        try:
+            guardar_receta_en_cache("https://cookpad.com/ar/recetas/1", receta)
+            resultado = asyncio.run(
+                CookpadScraper().scrapear("https://cookpad.com/ar/recetas/1?utm_medium=web")
+            )
+            assert resultado is receta
+        finally:
+            limpiar_cache_recetas()
+    
+    def test_extraer_con_pool_cierra_pagina_y_cachea(self, monkeypatch):
+        """Verifica que extraer_con_pool usa el contexto compartido y cierra solo la página."""
+        import asyncio
+        from app.scraper import base_scraper
+        from app.scraper.base_scraper import limpiar_cache_recetas
+        from app.scraper.sites.cookpad import CookpadScraper
+        
+        monkeypatch.setattr(base_scraper.asyncio, "sleep", sin_espera)
+        
+        class ScraperPrueba(CookpadScraper):
+            async def _extraer_receta(self, page, url):
+                return receta_valida(url)
+        
+        contexto = ContextoFalso()
+        scraper = ScraperPrueba()
+        limpiar_cache_recetas()
+        try:
+            url = "https://cookpad.com/ar/recetas/99"
+            primera = asyncio.run(scraper.extraer_con_pool(contexto, url))
+            segunda = asyncio.run(scraper.extraer_con_pool(contexto, url))
+            
+            assert primera is segunda
+            assert len(contexto.paginas) == 1
+            assert contexto.paginas[0].cerrada
+            assert not contexto.cerrado
+            
+            # Forzar la actualización vuelve a navegar y reemplaza la cacheada
+            tercera = asyncio.run(scraper.extraer_con_pool(contexto, url, forzar_actualizacion=True))
+            cuarta = asyncio.run(scraper.extraer_con_pool(contexto, url))
+            assert tercera is not primera
+            assert cuarta is tercera
+            assert len(contexto.paginas) == 2
+        finally:
+            limpiar_cache_recetas()
+    
+    def test_receta_invalida_no_se_cachea(self, monkeypatch):
+        """Verifica que un scrapeo vacío o parcial no queda en caché y se vuelve a navegar."""
+        import asyncio
+        from app.scraper import base_scraper
+        from app.scraper.base_scraper import (
+            RecetaScraped, guardar_receta_en_cache, obtener_receta_cacheada, limpiar_cache_recetas
+        )
+        from app.scraper.sites.cookpad import CookpadScraper
+        
+        monkeypatch.setattr(base_scraper.asyncio, "sleep", sin_espera)
+        
+        class ScraperPrueba(CookpadScraper):
+            async def _extraer_receta(self, page, url):
+                # La página no terminó de cargar: hay título pero no pasos
+                return RecetaScraped(titulo="Flan", url_origen=url, sitio_origen=self.nombre_sitio,
+                                     ingredientes=["4 huevos"])
+        
+        contexto = ContextoFalso()
+        scraper = ScraperPrueba()
+        limpiar_cache_recetas()
+        try:
+            url = "https://cookpad.com/ar/recetas/7"
+            primera = asyncio.run(scraper.extraer_con_pool(contexto, url))
+            segunda = asyncio.run(scraper.extraer_con_pool(contexto, url))
+            
+            assert primera is not segunda
+            assert len(contexto.paginas) == 2
+            assert obtener_receta_cacheada(url) is None
+            assert guardar_receta_en_cache(url, primera) is False
+            assert guardar_receta_en_cache(url, receta_valida(url)) is True
+        finally:
+            limpiar_cache_recetas()
+    
+    def test_sesion_navegador_reutiliza_el_contexto(self, monkeypatch):
+        """Verifica que dentro de una sesión scrapear solo abre páginas sobre un contexto."""
+        import asyncio
+        from app.scraper import base_scraper
+        from app.scraper.base_scraper import limpiar_cache_recetas
+        from app.scraper.sites.cookpad import CookpadScraper
+        
+        monkeypatch.setattr(base_scraper.asyncio, "sleep", sin_espera)
+        
+        class ScraperPrueba(CookpadScraper):
+            async def _extraer_receta(self, page, url):
+                return receta_valida(url)
+        
+        async def scrapear_en_sesion(scraper, navegador):
+            async with scraper.sesion_navegador(navegador):
+                # Una sesión anidada reutiliza la abierta
+                async with scraper.sesion_navegador(navegador):
+                    await scraper.scrapear("https://cookpad.com/ar/recetas/1")
+                await scraper.scrapear("https://cookpad.com/ar/recetas/2")
+                await scraper.scrapear("https://cookpad.com/ar/recetas/3")
+                # El listado también es una página más del contexto
+                await scraper.buscar_recetas("flan")
+        
+        navegador = NavegadorFalso()
+        scraper = ScraperPrueba()
+        limpiar_cache_recetas()
+        try:
+            asyncio.run(scrapear_en_sesion(scraper, navegador))
+        finally:
+            limpiar_cache_recetas()
+        
+        assert len(navegador.contextos) == 1
+        assert len(navegador.contextos[0].paginas) == 4
+        assert all(pagina.cerrada for pagina in navegador.contextos[0].paginas)
+        # El navegador es del llamador: la sesión solo cierra su contexto
+        assert navegador.contextos[0].cerrado
+        assert scraper._contexto is None
+    
+    def test_scrapeos_concurrentes_misma_url_navegan_una_vez(self, monkeypatch):
+        """Verifica que pedidos simultáneos de la misma URL comparten un único scrapeo."""
+        import asyncio
+        from app.scraper import base_scraper
+        from app.scraper.base_scraper import limpiar_cache_recetas
+        from app.scraper.sites.cookpad import CookpadScraper
+        
+        monkeypatch.setattr(base_scraper.asyncio, "sleep", sin_espera)
+        
+        extracciones = []
+        
+        class ScraperPrueba(CookpadScraper):
+            async def _extraer_receta(self, page, url):
+                extracciones.append(url)
+                return receta_valida(url)
+        
+        async def scrapear_en_paralelo():
+            contexto = ContextoFalso()
+            return await asyncio.gather(
+                ScraperPrueba().extraer_con_pool(contexto, "https://cookpad.com/ar/recetas/7"),
+                ScraperPrueba().extraer_con_pool(contexto, "https://cookpad.com/ar/recetas/7/"),
+            )
+        
+        limpiar_cache_recetas()
+        try:
+            primera, segunda = asyncio.run(scrapear_en_paralelo())
+            
+            assert primera is segunda
+            assert len(extracciones) == 1
+            assert base_scraper._locks_por_url == {}
+        finally:
+            limpiar_cache_recetas()
+    
+    def test_filtrar_recursos_bloquea_imagenes_y_rastreadores(self):
+        """Verifica que se abortan imágenes, fuentes y rastreadores pero no documentos ni CSS."""
+        import asyncio
+        from types import SimpleNamespace
+        from app.scraper.sites.cookpad import CookpadScraper
+        
+        class RutaFalsa:
+            def __init__(self, tipo, url):
+                self.request = SimpleNamespace(resource_type=tipo, url=url)
+                self.resultado = None
+            
+            async def abort(self):
+                self.resultado = "abort"
+            
+            async def continue_(self):
+                self.resultado = "continue"
+        
+        scraper = CookpadScraper()
+        casos = [
+            (RutaFalsa("image", "https://img.cookpad.com/a.jpg"), "abort"),
+            (RutaFalsa("font", "https://cookpad.com/f.woff2"), "abort"),
+            (RutaFalsa("script", "https://www.google-analytics.com/analytics.js"), "abort"),
+            (RutaFalsa("document", "https://cookpad.com/ar/recetas/1"), "continue"),
+            (RutaFalsa("stylesheet", "https://cookpad.com/app.css"), "continue"),
+            (RutaFalsa("script", "https://notdoubleclick.net/x.js"), "continue"),
+        ]
+        
+        for ruta, esperado in casos:
+            asyncio.run(scraper._filtrar_recursos(ruta))
+            assert ruta.resultado == esperado
+
+
+class TestRecetaJsonLd:
+    """Tests para la extracción de recetas desde JSON-LD (schema.org)."""
+    
+    def test_buscar_recipe_en_graph(self):
+        """Verifica que se encuentra el Recipe dentro de @graph e ignora JSON inválido."""
+        import json
+        from app.scraper.base_scraper import buscar_recipe_jsonld
+        
+        payloads = [
+            "{invalido",
+            json.dumps({"@type": "WebSite", "name": "Sitio"}),
+            json.dumps({"@graph": [
+                {"@type": "BreadcrumbList"},
+                {"@type": ["Recipe", "NewsArticle"], "name": "Tortilla"}
+            ]}),
+        ]
+        
+        recipe = buscar_recipe_jsonld(payloads)
+        assert recipe is not None
+        assert recipe["name"] == "Tortilla"
+        assert buscar_recipe_jsonld([json.dumps({"@type": "WebSite"})]) is None
+    
+    def test_campos_desde_recipe(self):
+        """Verifica el mapeo de un Recipe a los campos de RecetaScraped."""
+        from app.scraper.base_scraper import campos_desde_recipe_jsonld
+        
+        recipe = {
+            "@type": "Recipe",
+            "name": "Tortilla de papas",
+            "image": [{"url": "https://img.example.com/t.jpg"}],
+            "recipeIngredient": ["4 papas", " ", "6 huevos"],
+            "recipeInstructions": [
+                {"@type": "HowToSection", "itemListElement": [
+                    {"@type": "HowToStep", "text": "Pelar las papas"},
+                    {"@type": "HowToStep", "text": "Freír a fuego medio"},
+                ]},
+                "Batir los huevos y mezclar",
+            ],
+            "prepTime": "PT15M",
+            "cookTime": "PT1H5M",
+            "recipeYield": 4,
+        }
+        
+        campos = campos_desde_recipe_jsonld(recipe)
+        
+        assert campos["titulo"] == "Tortilla de papas"
+        assert campos["imagen_url"] == "https://img.example.com/t.jpg"
+        assert campos["ingredientes"] == ["4 papas", "6 huevos"]
+        assert campos["pasos"] == ["Pelar las papas", "Freír a fuego medio", "Batir los huevos y mezclar"]
+        assert campos["tiempo_preparacion"] == "15 min"
+        assert campos["tiempo_coccion"] == "1 h 5 min"
+        assert campos["porciones"] == "4"
+    
+    def test_formatear_duracion_no_iso(self):
+        """Verifica que las duraciones que no son ISO 8601 se devuelven tal cual."""
+        from app.scraper.base_scraper import formatear_duracion_iso
+        
+        assert formatear_duracion_iso("45 minutos") == "45 minutos"
+        assert formatear_duracion_iso("P1DT2H") == "26 h"
 
 
 class TestScraperFactory:
@@ -246,6 +704,16 @@ class TestScraperFactory:
         assert "Cookpad" in nombres
         assert "AllRecipes" in nombres
         assert "Tasty" in nombres
+    
+    def test_obtener_scraper_por_nombre(self):
+        """Verifica que el scraper se obtenga por nombre de sitio sin recorrer dominios."""
+        nombres = ScraperFactory.obtener_nombres_sitios()
+        assert nombres == [s["nombre"] for s in ScraperFactory.obtener_sitios_soportados()]
+        
+        scraper = ScraperFactory.obtener_scraper_por_nombre("Tasty")
+        assert scraper is not None
+        assert scraper.nombre_sitio == "Tasty"
+        assert ScraperFactory.obtener_scraper_por_nombre("Inexistente") is None
 
 
 class TestProxyManager:
@@ -412,6 +880,369 @@ class TestBaseScraperHelpers:
         scraper = CookpadScraper()
         assert scraper.nombre_sitio == "Cookpad"
         assert "cookpad.com" in scraper.dominios_soportados
+    
+    def test_campos_compilados_validos(self):
+        """Verifica que las especificaciones CAMPOS usan tipos y claves soportados."""
+        from app.scraper.sites.cookpad import CookpadScraper
+        from app.scraper.sites.cocineros_argentinos import CocinerosArgentinosScraper
+        from app.scraper.sites.directo_al_paladar import DirectoAlPaladarScraper
+        from app.scraper.sites.hellofresh import HelloFreshScraper
+        from app.scraper.sites.paulina_cocina import PaulinaCocinaScraper
+        from app.scraper.sites.recetas_essen import RecetasEssenScraper
+        from app.scraper.sites.allrecipes import AllRecipesScraper
+        from app.scraper.sites.rechupete import RechupeteScraper
+        from app.scraper.sites.soy_celiaco import SoyCeliacoScraper
+        from app.scraper.sites.tasty import TastyScraper
+        
+        claves_por_tipo = {
+            "texto": {"selector"},
+            "atributo": {"selectores", "atributos", "requiere_http"},
+            "lista": {"selectores"},
+        }
+        
+        especificaciones = [
+            scraper_cls.CAMPOS for scraper_cls in (
+                CookpadScraper, CocinerosArgentinosScraper,
+                DirectoAlPaladarScraper, HelloFreshScraper,
+                PaulinaCocinaScraper, RecetasEssenScraper, AllRecipesScraper,
+                RechupeteScraper, SoyCeliacoScraper, TastyScraper
+            )
+        ]
+        especificaciones.append(HelloFreshScraper.CAMPOS_DATA_TEST_ID)
+        
+        for campos in especificaciones:
+            assert {"titulo", "ingredientes", "pasos", "imagen_url"} <= set(campos)
+            for campo in campos.values():
+                assert set(campo) - {"tipo"} == claves_por_tipo[campo["tipo"]]
+                # Sin selectores repetidos en una misma cascada
+                selectores = [str(s) for s in campo.get("selectores", [])]
+                assert len(selectores) == len(set(selectores))
+    
+    def test_extraer_campos_devuelve_vacios_si_falla(self):
+        """Verifica que _extraer_campos devuelve valores vacíos si el extractor falla."""
+        import asyncio
+        from app.scraper.sites.cookpad import CookpadScraper
+        
+        def extractor_roto(campos):
+            raise RuntimeError("extractor no disponible")
+        
+        scraper = CookpadScraper()
+        datos = asyncio.run(scraper._extraer_campos(PaginaFalsa(respuesta=extractor_roto), scraper.CAMPOS))
+        
+        assert datos["titulo"] == ""
+        assert datos["ingredientes"] == []
+        assert datos["pasos"] == []
+    
+    def test_extraer_campos_recuerda_selector_ganador(self):
+        """Verifica que la cascada ganadora se prueba primero en la página siguiente."""
+        import asyncio
+        from app.scraper import base_scraper
+        from app.scraper.sites.paulina_cocina import PaulinaCocinaScraper
+        
+        base_scraper._selectores_ganadores.clear()
+        scraper = PaulinaCocinaScraper()
+        campos = {"pasos": scraper.CAMPOS["pasos"]}
+        cascada = scraper.CAMPOS["pasos"]["selectores"]
+        
+        def pagina_con_ganadores(ganadores):
+            return PaginaFalsa(respuesta=lambda campos: {
+                "pasos": ["Mezclar"] if ganadores else [], "__ganadores": ganadores
+            })
+        
+        asyncio.run(scraper._extraer_campos(pagina_con_ganadores({"pasos": 2}), campos))
+        
+        segunda = pagina_con_ganadores({"pasos": 0})
+        datos = asyncio.run(scraper._extraer_campos(segunda, campos))
+        assert segunda.llamadas[0]["pasos"]["selectores"][0] == cascada[2]
+        assert sorted(segunda.llamadas[0]["pasos"]["selectores"]) == sorted(cascada)
+        assert "__ganadores" not in datos
+        
+        # Con el mismo ganador se reutiliza el campo ya compilado
+        tercera = pagina_con_ganadores({"pasos": 0})
+        asyncio.run(scraper._extraer_campos(tercera, campos))
+        assert tercera.llamadas[0]["pasos"] is segunda.llamadas[0]["pasos"]
+        
+        # Sin ganador (cambió el diseño) se vuelve al orden declarado
+        asyncio.run(scraper._extraer_campos(pagina_con_ganadores({}), campos))
+        cuarta = pagina_con_ganadores({})
+        asyncio.run(scraper._extraer_campos(cuarta, campos))
+        assert cuarta.llamadas[0]["pasos"]["selectores"] == cascada
+        
+        base_scraper._selectores_ganadores.clear()
+    
+    def test_hellofresh_camino_rapido_data_test_id(self):
+        """Verifica que HelloFresh no consulta JSON-LD si los data-test-id alcanzan."""
+        import asyncio
+        from app.scraper.sites.hellofresh import HelloFreshScraper
+        
+        def por_data_test_id(campos):
+            assert all("data-test-id" in str(campo) for campo in campos.values())
+            datos = {nombre: "" for nombre in campos}
+            datos.update(titulo="Pollo al horno", ingredientes=["1 pollo"], pasos=["Hornear"])
+            return datos
+        
+        # Sin resultado_todos, leer el JSON-LD haría fallar a la página
+        pagina = PaginaFalsa(respuesta=por_data_test_id)
+        receta = asyncio.run(HelloFreshScraper()._extraer_receta(pagina, "https://www.hellofresh.es/recipes/x"))
+        
+        assert receta.titulo == "Pollo al horno"
+        assert receta.pasos == ("Hornear",)
+        assert len(pagina.llamadas) == 1
+    
+    def test_listado_sin_titulos_preview(self):
+        """Verifica que el listado no pide el título de cada tarjeta si no se usa."""
+        import asyncio
+        from app.scraper.sites.paulina_cocina import PaulinaCocinaScraper
+        
+        scraper = PaulinaCocinaScraper()
+        pagina = PaginaFalsa([["https://www.paulinacocina.net/receta-1", "", ""]])
+        asyncio.run(scraper._extraer_lista_recetas(pagina, 5))
+        assert pagina.llamadas[-1]["con_titulo"] is True
+        
+        scraper.titulos_preview = False
+        recetas = asyncio.run(scraper._extraer_lista_recetas(pagina, 5))
+        assert pagina.llamadas[-1]["con_titulo"] is False
+        assert recetas[0].url == "https://www.paulinacocina.net/receta-1"
+        assert recetas[0].titulo == ""
+    
+    def test_listados_en_una_llamada(self):
+        """Verifica que los listados convertidos se extraen con un único evaluate."""
+        import asyncio
+        from app.scraper.sites.hellofresh import HelloFreshScraper
+        from app.scraper.sites.paulina_cocina import PaulinaCocinaScraper
+        from app.scraper.sites.recetas_essen import RecetasEssenScraper
+        from app.scraper.sites.allrecipes import AllRecipesScraper
+        from app.scraper.sites.cocineros_argentinos import CocinerosArgentinosScraper
+        from app.scraper.sites.rechupete import RechupeteScraper
+        from app.scraper.sites.soy_celiaco import SoyCeliacoScraper
+        from app.scraper.sites.tasty import TastyScraper
+        
+        for scraper_cls in (
+            HelloFreshScraper, PaulinaCocinaScraper, RecetasEssenScraper,
+            AllRecipesScraper, CocinerosArgentinosScraper,
+            RechupeteScraper, SoyCeliacoScraper, TastyScraper
+        ):
+            pagina = PaginaFalsa([["https://ejemplo.com/receta/1", "Tarta", ""]])
+            recetas = asyncio.run(scraper_cls()._extraer_lista_recetas(pagina, 10))
+            
+            assert len(pagina.llamadas) == 1
+            assert pagina.llamadas[0]["selectores"] == list(scraper_cls.SELECTORES_TARJETA)
+            assert recetas[0].titulo == "Tarta"
+    
+    def test_esperar_contenido_cargado_estrategias_en_paralelo(self):
+        """Verifica que las esperas se solapan y un timeout no aborta la espera."""
+        import asyncio
+        import time
+        from app.scraper.sites.cookpad import CookpadScraper
+        
+        class PaginaLenta:
+            async def wait_for_load_state(self, estado, timeout):
+                await asyncio.sleep(0.2)
+                raise TimeoutError("networkidle")
+            
+            async def wait_for_function(self, script, timeout):
+                await asyncio.sleep(0.2)
+        
+        inicio = time.monotonic()
+        asyncio.run(CookpadScraper()._esperar_contenido_cargado(PaginaLenta()))
+        
+        assert time.monotonic() - inicio < 0.35
+    
+    def test_esperar_cualquier_selector_una_sola_espera(self):
+        """Verifica que todos los selectores se esperan con un único wait_for_function."""
+        import asyncio
+        from app.scraper.sites.cookpad import CookpadScraper
+        
+        class HandleFalso:
+            async def json_value(self):
+                return "#steps li"
+        
+        class PaginaConEspera:
+            def __init__(self):
+                self.llamadas = []
+            
+            async def wait_for_function(self, script, arg, timeout):
+                self.llamadas.append((arg, timeout))
+                if arg == ["#nada"]:
+                    raise TimeoutError("timeout")
+                return HandleFalso()
+        
+        scraper = CookpadScraper()
+        pagina = PaginaConEspera()
+        
+        encontrado = asyncio.run(
+            scraper._esperar_cualquier_selector(pagina, ("#steps", "#steps li"), timeout=5000)
+        )
+        no_encontrado = asyncio.run(scraper._esperar_cualquier_selector(pagina, ["#nada"]))
+        
+        assert encontrado == "#steps li"
+        assert no_encontrado is None
+        assert pagina.llamadas[0] == (["#steps", "#steps li"], 5000)
+    
+    def test_extraer_campos_de_arbol_como_el_extractor_compilado(self):
+        """Verifica que la versión local de CAMPOS respeta la cascada y los filtros del extractor JS."""
+        from selectolax.lexbor import LexborHTMLParser
+        from app.scraper.base_scraper import extraer_campos_de_arbol
+        
+        html = """
+        <h1 class="entry-title">Tortilla  de <b>papas</b></h1>
+        <img class="lazy" src="data:image/gif;base64,R0lG" data-src="https://ejemplo.com/t.jpg">
+        <ul class="recipe-ingredients"><li>4 papas</li><li> </li><li>3 huevos</li></ul>
+        <ol class="pasos"><li><span class="n">1</span><span class="t">Pelar</span></li></ol>
+        """
+        campos = {
+            "titulo": {"tipo": "texto", "selector": "h1.entry-title, h1"},
+            "descripcion": {"tipo": "texto", "selector": ".resumen"},
+            "imagen_url": {
+                "tipo": "atributo",
+                "selectores": [".wp-post-image", "img.lazy"],
+                "atributos": ["src", "data-src"],
+                "requiere_http": True,
+            },
+            "ingredientes": {"tipo": "lista", "selectores": [".wprm-recipe-ingredient", ".recipe-ingredients li"]},
+            "pasos": {"tipo": "lista", "selectores": [[".pasos li", [".n", ".t"]]]},
+        }
+        
+        datos = extraer_campos_de_arbol(LexborHTMLParser(html), campos)
+        
+        assert datos == {
+            "titulo": "Tortilla de papas",
+            "descripcion": "",
+            "imagen_url": "https://ejemplo.com/t.jpg",
+            "ingredientes": ["4 papas", "3 huevos"],
+            "pasos": ["1 Pelar"],
+        }
+    
+    def test_receta_sin_navegador_solo_si_esta_completa(self):
+        """Verifica que el camino HTTP devuelve la receta completa y cede al navegador si falta algo."""
+        import asyncio
+        from app.scraper.sites.rechupete import RechupeteScraper
+        from app.scraper.sites.soy_celiaco import SoyCeliacoScraper
+        
+        html_completo = """
+        <h1 class="entry-title">Paella</h1>
+        <div class="entry-content"><p>Clásica</p><img src="https://ejemplo.com/p.jpg"></div>
+        <li class="wprm-recipe-ingredient">400 g de arroz</li>
+        <li class="wprm-recipe-instruction">Sofreír</li>
+        <span class="recipe-servings">4</span>
+        """
+        html_sin_pasos = '<h1>Paella</h1><li class="wprm-recipe-ingredient">400 g de arroz</li>'
+        
+        def scraper_con_html(scraper_cls, html):
+            scraper = scraper_cls()
+            descargas = []
+            
+            async def descargar_html(url, revalidar=False):
+                descargas.append(url)
+                return html
+            
+            scraper._descargar_html = descargar_html
+            return scraper, descargas
+        
+        url = "https://www.recetasderechupete.com/paella/"
+        scraper, _ = scraper_con_html(RechupeteScraper, html_completo)
+        receta = asyncio.run(scraper._extraer_receta_http(url))
+        assert receta.titulo == "Paella"
+        assert receta.descripcion == "Clásica"
+        assert receta.imagen_url == "https://ejemplo.com/p.jpg"
+        assert receta.ingredientes == ("400 g de arroz",)
+        assert receta.pasos == ("Sofreír",)
+        assert receta.porciones == "4"
+        assert receta.sitio_origen == "Recetas de Rechupete"
+        
+        scraper, _ = scraper_con_html(RechupeteScraper, html_sin_pasos)
+        assert asyncio.run(scraper._extraer_receta_http(url)) is None
+        
+        # Sin HTML_ESTATICO ni siquiera se descarga
+        scraper, descargas = scraper_con_html(SoyCeliacoScraper, html_completo)
+        assert asyncio.run(scraper._extraer_receta_http(url)) is None
+        assert descargas == []
+    
+    def test_receta_sin_navegador_desde_jsonld(self):
+        """Verifica que el camino HTTP prioriza el JSON-LD del HTML en los sitios que lo publican."""
+        import asyncio
+        from selectolax.lexbor import LexborHTMLParser
+        from app.scraper.sites.directo_al_paladar import DirectoAlPaladarScraper
+        
+        html = """
+        <script type="application/ld+json">
+        {"@type": "Recipe", "name": "Gazpacho", "recipeIngredient": ["1 kg de tomate"],
+         "recipeInstructions": [{"@type": "HowToStep", "text": "Triturar"}],
+         "cookTime": "PT10M"}
+        </script>
+        <h1>Gazpacho andaluz</h1>
+        """
+        scraper = DirectoAlPaladarScraper()
+        
+        async def descargar_html(url, revalidar=False):
+            return html
+        
+        scraper._descargar_html = descargar_html
+        receta = asyncio.run(scraper._extraer_receta_http("https://www.directoalpaladar.com/gazpacho"))
+        assert receta.titulo == "Gazpacho"
+        assert receta.ingredientes == ("1 kg de tomate",)
+        assert receta.pasos == ("Triturar",)
+        assert receta.tiempo_coccion
+        
+        # JSON-LD incompleto: completa los huecos de CAMPOS y, sin pasos, cede al navegador
+        html = """
+        <script type="application/ld+json">{"@type": "Recipe", "name": "Gazpacho"}</script>
+        <h1>Gazpacho andaluz</h1><ul class="ingredients"><li>Tomate</li></ul>
+        """
+        assert asyncio.run(scraper._extraer_receta_http("https://www.directoalpaladar.com/gazpacho")) is None
+        
+        datos = scraper._extraer_campos_de_arbol(LexborHTMLParser(html))
+        assert datos["titulo"] == "Gazpacho andaluz"
+        assert datos["ingredientes"] == ["Tomate"]
+    
+    def test_listado_sin_navegador(self):
+        """Verifica que los listados estáticos se leen del HTML sin abrir el navegador."""
+        import asyncio
+        from selectolax.lexbor import LexborHTMLParser
+        from app.scraper.base_scraper import TarjetaReceta, tarjetas_de_arbol
+        from app.scraper.sites.rechupete import RechupeteScraper
+        from app.scraper.sites.tasty import TastyScraper
+        
+        html = """
+        <div class="sin-articulos"><a href="/contacto">Contacto</a></div>
+        <h2 class="entry-title"><a href="https://ejemplo.com/paella">Paella  valenciana</a></h2>
+        <h2 class="entry-title"><a href="https://ejemplo.com/tortilla">Tortilla</a></h2>
+        <h2 class="entry-title"><a>Sin enlace</a></h2>
+        """
+        opciones = {
+            "selectores": ["article a", ".entry-title a"],
+            "limite": 5,
+            "con_titulo": True,
+        }
+        tarjetas = tarjetas_de_arbol(LexborHTMLParser(html), opciones)
+        assert tarjetas == [
+            TarjetaReceta("https://ejemplo.com/paella", "Paella valenciana"),
+            TarjetaReceta("https://ejemplo.com/tortilla", "Tortilla"),
+        ]
+        
+        # Mismas opciones que el extractor del navegador, incluido el límite
+        opciones.update(limite=1, con_titulo=False, url_base="https://ejemplo.com")
+        arbol = LexborHTMLParser('<article><a href="/pan">Pan</a><a href="/te">Té</a></article>')
+        assert tarjetas_de_arbol(arbol, opciones) == [TarjetaReceta("https://ejemplo.com/pan")]
+        
+        scraper = RechupeteScraper()
+        revalidaciones = []
+        
+        async def descargar_html(url, revalidar=False):
+            revalidaciones.append(revalidar)
+            return html
+        
+        scraper._descargar_html = descargar_html
+        # Playwright no llega a importarse: el listado sale del HTML
+        recetas = asyncio.run(scraper.buscar_recetas("paella", limite=1))
+        assert recetas == [TarjetaReceta("https://ejemplo.com/paella", "Paella valenciana")]
+        assert revalidaciones == [True]
+        
+        # Sin LISTADO_ESTATICO ni siquiera se descarga
+        scraper = TastyScraper()
+        scraper._descargar_html = descargar_html
+        assert asyncio.run(scraper._extraer_lista_http("https://tasty.co/search?q=x", 5)) == []
+        assert revalidaciones == [True]
 
 
 class TestCocinerosArgentinosScraper:
@@ -444,6 +1275,40 @@ class TestCocinerosArgentinosScraper:
         assert 'procedimiento' in scraper.TITULOS_PASOS
         assert 'elaboración' in scraper.TITULOS_PASOS
     
+    def test_encabezado_coincide_por_palabra(self):
+        """Verifica que los encabezados se comparen por palabra completa."""
+        from app.scraper.sites.cocineros_argentinos import CocinerosArgentinosScraper
+        
+        scraper = CocinerosArgentinosScraper()
+        assert scraper._encabezado_coincide("ingredientes:", scraper.TITULOS_INGREDIENTES)
+        assert scraper._encabezado_coincide("modo de preparación", scraper.TITULOS_PASOS)
+        assert not scraper._encabezado_coincide("superpasos", scraper.TITULOS_PASOS)
+    
+    def test_extraer_contenido_por_encabezado_arbol_local(self):
+        """Verifica la extracción por encabezado sobre el árbol HTML local."""
+        pytest.importorskip("selectolax")
+        from selectolax.lexbor import LexborHTMLParser
+        from app.scraper.sites.cocineros_argentinos import CocinerosArgentinosScraper
+        
+        html = """
+        <div class="entry-content">
+            <h2>Compartir</h2><p>Nada</p>
+            <h2>Ingredientes:</h2>
+            <ul><li>2 <b>huevos</b></li><li> </li><li>Harina 500 g</li></ul>
+            <h3>Preparación</h3>
+            <!-- pasos -->
+            <p>Batir los huevos<br>Agregar la harina<br/>ok</p>
+        </div>
+        """
+        scraper = CocinerosArgentinosScraper()
+        arbol = LexborHTMLParser(html)
+        
+        ingredientes = scraper._extraer_contenido_por_encabezado(arbol, scraper.TITULOS_INGREDIENTES)
+        pasos = scraper._extraer_contenido_por_encabezado(arbol, scraper.TITULOS_PASOS)
+        
+        assert ingredientes == ["2 huevos", "Harina 500 g"]
+        assert pasos == ["Batir los huevos", "Agregar la harina"]
+    
     def test_parsear_contenido_con_br_simple(self):
         """Verifica parseo de contenido con tags <br> simples."""
         from app.scraper.sites.cocineros_argentinos import CocinerosArgentinosScraper
@@ -505,7 +1370,6 @@ class TestCocinerosArgentinosScraper:
         assert hasattr(scraper, '_esperar_cualquier_selector')
         assert hasattr(scraper, '_hacer_scroll_para_lazy_loading')
         assert hasattr(scraper, '_esperar_contenido_cargado')
-        assert hasattr(scraper, '_extraer_imagen')
         assert hasattr(scraper, '_extraer_contenido_por_encabezado')
         assert hasattr(scraper, '_parsear_contenido_con_br')
     
@@ -566,16 +1430,7 @@ class TestRecetasEssenScraper:
         assert hasattr(scraper, '_esperar_cualquier_selector')
         assert hasattr(scraper, '_hacer_scroll_para_lazy_loading')
         assert hasattr(scraper, '_esperar_contenido_cargado')
-        assert hasattr(scraper, '_extraer_texto_seguro')
-        assert hasattr(scraper, '_extraer_lista_textos')
-    
-    def test_recetas_essen_tiene_metodo_extraer_imagen_lazy(self):
-        """Verifica que tiene método para extraer imágenes con lazy loading."""
-        from app.scraper.sites.recetas_essen import RecetasEssenScraper
-        
-        scraper = RecetasEssenScraper()
-        assert hasattr(scraper, '_extraer_imagen_lazy')
-        assert callable(getattr(scraper, '_extraer_imagen_lazy'))
+        assert hasattr(scraper, '_extraer_contenido_por_encabezado')
     
     def test_recetas_essen_tiene_metodo_extraer_contenido_por_encabezado(self):
         """Verifica que tiene método genérico para extraer contenido por encabezado."""
@@ -585,13 +1440,72 @@ class TestRecetasEssenScraper:
         assert hasattr(scraper, '_extraer_contenido_por_encabezado')
         assert callable(getattr(scraper, '_extraer_contenido_por_encabezado'))
     
-    def test_recetas_essen_tiene_metodo_parsear_contenido_html(self):
-        """Verifica que tiene método para parsear HTML con br y listas."""
+    def test_recetas_essen_contenido_por_encabezado_en_una_llamada(self):
+        """Verifica que la búsqueda por encabezados se resuelve con un único evaluate."""
+        import asyncio
+        from app.scraper.sites.recetas_essen import RecetasEssenScraper
+        
+        scraper = RecetasEssenScraper()
+        pagina = PaginaFalsa(["200 g de harina", "2 huevos"])
+        items = asyncio.run(scraper._extraer_contenido_por_encabezado(
+            pagina, scraper.ENCABEZADOS_INGREDIENTES
+        ))
+        
+        assert items == ["200 g de harina", "2 huevos"]
+        assert len(pagina.llamadas) == 1
+        assert pagina.llamadas[0]["encabezados"] == scraper.ENCABEZADOS_INGREDIENTES
+        assert pagina.llamadas[0]["selectores"] == list(scraper.SELECTORES_ENCABEZADO)
+    
+    def test_recetas_essen_instala_scripts_en_el_contexto(self):
+        """Verifica que los scripts de Essen se instalan una vez por contexto y no viajan por receta."""
+        import asyncio
+        from app.scraper.base_scraper import JS_EXTRACTOR
         from app.scraper.sites.recetas_essen import RecetasEssenScraper
         
         scraper = RecetasEssenScraper()
-        assert hasattr(scraper, '_parsear_contenido_html')
-        assert callable(getattr(scraper, '_parsear_contenido_html'))
+        navegador = NavegadorFalso()
+        asyncio.run(scraper._crear_contexto(navegador))
+        assert navegador.contextos[0].scripts == [JS_EXTRACTOR, *scraper.SCRIPTS_INICIO]
+        assert "parsearContenido" not in scraper.SCRIPTS_INICIO[0]
+        
+        pagina = PaginaFalsa([])
+        asyncio.run(scraper._extraer_contenido_por_encabezado(pagina, scraper.ENCABEZADOS_PASOS))
+        assert all("window.__essen." in script for script in pagina.scripts)
+        assert all(len(script) < 100 for script in pagina.scripts)
+    
+    def test_recetas_essen_sin_scroll_si_hay_imagen(self):
+        """Verifica que Essen solo hace scroll cuando la imagen todavía no cargó."""
+        import asyncio
+        from app.scraper.sites.recetas_essen import RecetasEssenScraper
+        
+        def pagina_con_imagenes(imagenes):
+            imagenes = list(imagenes)
+            
+            def campos_o_scroll(campos):
+                if campos is None:
+                    return None  # scroll
+                datos = {nombre: [] if c["tipo"] == "lista" else "" for nombre, c in campos.items()}
+                datos.update(titulo="Budín", ingredientes=["Harina"], pasos=["Hornear"])
+                datos["imagen_url"] = imagenes.pop(0)
+                return datos
+            
+            return PaginaFalsa(respuesta=campos_o_scroll)
+        
+        def scrolls(pagina):
+            return sum(1 for argumentos in pagina.llamadas if argumentos is None)
+        
+        scraper = RecetasEssenScraper()
+        scraper._esperar_contenido_cargado = sin_espera
+        
+        con_imagen = pagina_con_imagenes(["https://essen.com/budin.jpg"])
+        receta = asyncio.run(scraper._extraer_receta(con_imagen, "https://www.recetasessen.com.ar/budin"))
+        assert scrolls(con_imagen) == 0
+        assert receta.imagen_url == "https://essen.com/budin.jpg"
+        
+        sin_imagen = pagina_con_imagenes(["", "https://essen.com/lazy.jpg"])
+        receta = asyncio.run(scraper._extraer_receta(sin_imagen, "https://www.recetasessen.com.ar/budin"))
+        assert scrolls(sin_imagen) == 1
+        assert receta.imagen_url == "https://essen.com/lazy.jpg"
     
     def test_recetas_essen_log_output(self, capsys):
         """Verifica que el método _log produce salida correcta."""
@@ -626,30 +1540,6 @@ class TestRecetasEssenScraper:
 class TestCookpadScraperMejoras:
     """Tests para las mejoras del scraper de Cookpad."""
     
-    def test_cookpad_tiene_metodo_extraer_imagen_lazy_loading(self):
-        """Verifica que CookpadScraper tiene método para lazy loading de imágenes."""
-        from app.scraper.sites.cookpad import CookpadScraper
-        
-        scraper = CookpadScraper()
-        assert hasattr(scraper, '_extraer_imagen_con_lazy_loading')
-        assert callable(getattr(scraper, '_extraer_imagen_con_lazy_loading'))
-    
-    def test_cookpad_tiene_metodo_extraer_ingredientes(self):
-        """Verifica que CookpadScraper tiene método para extraer ingredientes."""
-        from app.scraper.sites.cookpad import CookpadScraper
-        
-        scraper = CookpadScraper()
-        assert hasattr(scraper, '_extraer_ingredientes')
-        assert callable(getattr(scraper, '_extraer_ingredientes'))
-    
-    def test_cookpad_tiene_metodo_extraer_pasos(self):
-        """Verifica que CookpadScraper tiene método para extraer pasos."""
-        from app.scraper.sites.cookpad import CookpadScraper
-        
-        scraper = CookpadScraper()
-        assert hasattr(scraper, '_extraer_pasos')
-        assert callable(getattr(scraper, '_extraer_pasos'))
-    
     def test_cookpad_tiene_metodo_extraer_receta(self):
         """Verifica que CookpadScraper tiene método para extraer recetas."""
         from app.scraper.sites.cookpad import CookpadScraper
@@ -658,6 +1548,33 @@ class TestCookpadScraperMejoras:
         assert hasattr(scraper, '_extraer_receta')
         assert callable(getattr(scraper, '_extraer_receta'))
     
+    def test_cookpad_detiene_la_carga_al_tener_el_contenido(self):
+        """Verifica que Cookpad no espera networkidle y detiene la carga antes de extraer."""
+        import asyncio
+        from app.scraper.sites.cookpad import CookpadScraper
+        
+        def campos_o_stop(campos):
+            if campos is None:
+                return None  # window.stop()
+            datos = {nombre: [] if c["tipo"] == "lista" else "" for nombre, c in campos.items()}
+            datos.update(titulo="Flan", ingredientes=["4 huevos"], pasos=["Batir"])
+            return datos
+        
+        for encontrado, detenida in (("#ingredients li", True), (None, False)):
+            async def esperar_selector(page, selectores, timeout=10000):
+                return encontrado or None
+            
+            scraper = CookpadScraper()
+            scraper._esperar_contenido_cargado = no_debe_esperar
+            scraper._esperar_cualquier_selector = esperar_selector
+            pagina = PaginaFalsa(respuesta=campos_o_stop)
+            
+            receta = asyncio.run(scraper._extraer_receta(pagina, "https://cookpad.com/ar/recetas/1"))
+            
+            assert receta.ingredientes == ("4 huevos",)
+            assert (pagina.scripts[0] == "window.stop()") is detenida
+            assert len(pagina.scripts) == (2 if detenida else 1)
+    
     def test_cookpad_tiene_metodo_extraer_lista_recetas(self):
         """Verifica que CookpadScraper tiene método para extraer lista de recetas."""
         from app.scraper.sites.cookpad import CookpadScraper
@@ -682,6 +1599,32 @@ class TestCookpadScraperMejoras:
         scraper = CookpadScraper()
         url = scraper._construir_url_busqueda(None)
         assert "cookpad.com/ar/buscar/populares" in url
+    
+    def test_cookpad_url_busqueda_memorizada(self):
+        """Verifica que la URL de búsqueda se memoriza por palabra clave."""
+        from app.scraper.sites.cookpad import CookpadScraper
+        
+        CookpadScraper._url_busqueda.cache_clear()
+        scraper = CookpadScraper()
+        primera = scraper._construir_url_busqueda("pan casero", {"sin_tacc": True})
+        segunda = CookpadScraper()._construir_url_busqueda("pan casero")
+        
+        assert primera == segunda == "https://cookpad.com/ar/buscar/pan%20casero"
+        assert CookpadScraper._url_busqueda.cache_info().hits == 1
+    
+    def test_cookpad_lista_recetas_en_una_llamada(self):
+        """Verifica que el listado de Cookpad se extrae con un único evaluate."""
+        import asyncio
+        from app.scraper.sites.cookpad import CookpadScraper
+        
+        pagina = PaginaFalsa([[f"https://cookpad.com/ar/recetas/{i}", "", ""] for i in range(5)])
+        recetas = asyncio.run(CookpadScraper()._extraer_lista_recetas(pagina, 3))
+        
+        assert len(pagina.llamadas) == 1
+        assert pagina.llamadas[0]["filtro_href"] == "/recetas/"
+        assert pagina.llamadas[0]["url_base"] == "https://cookpad.com"
+        assert len(recetas) == 3
+        assert recetas[0].url == "https://cookpad.com/ar/recetas/0"
 class TestSoyCeliacoScraper:
     """Tests para el scraper de Soy Celíaco No Extraterrestre."""
     
@@ -693,22 +1636,6 @@ class TestSoyCeliacoScraper:
         assert scraper.nombre_sitio == "Soy Celíaco No Extraterrestre"
         assert "soyceliaconoextraterrestre.com" in scraper.dominios_soportados
     
-    def test_scraper_tiene_metodo_extraer_imagen_con_lazy_loading(self):
-        """Verifica que el scraper tiene el método para lazy loading."""
-        from app.scraper.sites.soy_celiaco import SoyCeliacoScraper
-        
-        scraper = SoyCeliacoScraper()
-        assert hasattr(scraper, '_extraer_imagen_con_lazy_loading')
-        assert callable(getattr(scraper, '_extraer_imagen_con_lazy_loading'))
-    
-    def test_scraper_tiene_metodo_extraer_metadatos(self):
-        """Verifica que el scraper tiene el método para extraer metadatos."""
-        from app.scraper.sites.soy_celiaco import SoyCeliacoScraper
-        
-        scraper = SoyCeliacoScraper()
-        assert hasattr(scraper, '_extraer_metadatos')
-        assert callable(getattr(scraper, '_extraer_metadatos'))
-    
     def test_scraper_url_busqueda_con_palabra_clave(self):
         """Verifica construcción de URL de búsqueda con palabra clave."""
         from app.scraper.sites.soy_celiaco import SoyCeliacoScraper
@@ -725,6 +1652,108 @@ class TestSoyCeliacoScraper:
         scraper = SoyCeliacoScraper()
         url = scraper._construir_url_busqueda()
         assert url == "https://www.soyceliaconoextraterrestre.com/recetas/"
+    
+    def test_receta_en_una_llamada(self):
+        """Verifica que la receta completa, con metadatos, sale de un único evaluate."""
+        import asyncio
+        from app.scraper.sites.soy_celiaco import SoyCeliacoScraper
+        
+        scraper = SoyCeliacoScraper()
+        pagina = PaginaFalsa({
+            "titulo": "Pan de mandioca",
+            "descripcion": "",
+            "imagen_url": "https://ejemplo.com/pan.jpg",
+            "ingredientes": ["500 g de fécula"],
+            "pasos": ["Amasar: Unir todo"],
+            "parrafo_metadatos": "Rinde para 5 pancitos. Tiempo de preparación: 30 minutos",
+            "__ganadores": {},
+        })
+        receta = asyncio.run(scraper._extraer_receta(pagina, "https://www.soyceliaconoextraterrestre.com/pan/"))
+        
+        assert pagina.scripts == ['(campos) => window.__soyCeliaco.receta(campos)']
+        assert receta.titulo == "Pan de mandioca"
+        assert receta.ingredientes == ("500 g de fécula",)
+        assert receta.porciones == "5 porciones"
+        assert receta.tiempo_preparacion == "30 minutos"
+    
+    def test_scripts_instalados_en_el_contexto(self):
+        """Verifica que las funciones del sitio se instalan una vez y se invocan por nombre."""
+        import asyncio
+        from app.scraper.sites.soy_celiaco import SoyCeliacoScraper
+        
+        scraper = SoyCeliacoScraper()
+        assert len(scraper.SCRIPTS_INICIO) == 1
+        assert scraper.SCRIPTS_INICIO[0].startswith("window.__soyCeliaco = {")
+        
+        pagina = PaginaFalsa(respuesta=lambda campos: {nombre: [] for nombre in campos})
+        asyncio.run(scraper._extraer_receta(pagina, "https://www.soyceliaconoextraterrestre.com/pan"))
+        
+        assert len(pagina.scripts) == 1
+        assert "window.__soyCeliaco.receta" in pagina.scripts[0]
+        assert len(pagina.scripts[0]) < 100
+
+
+class TestTastyScraper:
+    """Tests para el scraper de Tasty."""
+    
+    def test_receta_en_una_llamada(self):
+        """Verifica que todos los campos de la receta salen de un único evaluate."""
+        import asyncio
+        from app.scraper.sites.tasty import TastyScraper
+        
+        scraper = TastyScraper()
+        scraper._esperar_contenido_cargado = sin_espera
+        scraper._hacer_scroll_para_lazy_loading = sin_espera
+        scraper._esperar_cualquier_selector = sin_espera
+        
+        # Sin JSON-LD en la página: se cae al recorrido del DOM
+        pagina = PaginaFalsa({
+            "titulo": "Pancakes",
+            "descripcion": "",
+            "imagen_url": "https://ejemplo.com/p.jpg",
+            "porciones": "4 servings",
+            "tiempo_coccion": "",
+            "ingredientes": ["2 eggs"],
+            "pasos": ["Mix"],
+            "__ganadores": {"ingredientes": 0, "pasos": 0},
+        }, resultado_todos=[])
+        receta = asyncio.run(scraper._extraer_receta(pagina, "https://tasty.co/recipe/pancakes"))
+        
+        assert [set(campos) for campos in pagina.llamadas] == [set(scraper.CAMPOS)]
+        assert receta.titulo == "Pancakes"
+        assert receta.ingredientes == ("2 eggs",)
+        assert receta.pasos == ("Mix",)
+        assert receta.porciones == "4 servings"
+    
+    def test_receta_desde_jsonld_sin_esperar_la_spa(self):
+        """Verifica que con un JSON-LD completo no se espera el render ni se recorre el DOM."""
+        import asyncio
+        import json
+        from app.scraper.sites.tasty import TastyScraper
+        
+        recipe = {
+            "@type": "Recipe",
+            "name": "Pancakes",
+            "image": "https://ejemplo.com/p.jpg",
+            "recipeIngredient": ["2 eggs", "1 cup flour"],
+            "recipeInstructions": [{"@type": "HowToStep", "text": "Mix"}],
+            "recipeYield": "4 servings",
+            "cookTime": "PT15M",
+        }
+        
+        def no_recorrer_el_dom(campos):
+            raise AssertionError("no debería recorrer el DOM")
+        
+        scraper = TastyScraper()
+        scraper._esperar_contenido_cargado = no_debe_esperar
+        
+        pagina = PaginaFalsa(respuesta=no_recorrer_el_dom, resultado_todos=[json.dumps(recipe)])
+        receta = asyncio.run(scraper._extraer_receta(pagina, "https://tasty.co/recipe/pancakes"))
+        assert receta.titulo == "Pancakes"
+        assert receta.ingredientes == ("2 eggs", "1 cup flour")
+        assert receta.pasos == ("Mix",)
+        assert receta.porciones == "4 servings"
+        assert receta.tiempo_coccion
 
 
 class TestSoyCeliacoMetadatosRegex:
@@ -799,3 +1828,14 @@ class TestSoyCeliacoMetadatosRegex:
         assert match is not None
         resultado = match.group(1).strip()
         assert "45" in resultado
+    
+    def test_parsear_metadatos_en_una_linea(self):
+        """Verifica que cada dato se busca en todo el párrafo aunque compartan línea."""
+        from app.scraper.sites.soy_celiaco import SoyCeliacoScraper
+        
+        texto = "Tiempo de cocción: 20 minutos. Rinde para 6 porciones. Tiempo de preparación: 15 min"
+        prep, coccion, porciones = SoyCeliacoScraper()._parsear_metadatos(texto)
+        
+        assert prep == "15 min"
+        assert coccion.startswith("20 minutos")
+        assert porciones == "6 porciones"